@@ -1,18 +1,120 @@
 import requests
 import time
-import random
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
-from urllib.robotparser import RobotFileParser
 import json
 import os
 from datetime import datetime
 import logging
 import threading
-from queue import Queue
+from queue import Empty
 import hashlib
 from fake_useragent import UserAgent
 import re
+from politeness import HostScheduler
+from http_client import PooledHTTPClient, read_limited, is_allowed_content_type, HTML_CONTENT_TYPES, DEFAULT_MAX_BODY_BYTES
+from response_cache import ResponseCache
+from url_filter import URLFilter
+from retry_engine import RetryEngine
+from autothrottle import AutoThrottle
+from robots_cache import RobotsCache
+from sitemap import SitemapDiscovery
+from frontier import SQLiteFrontier
+from canonicalizer import URLCanonicalizer
+from url_priority import URLScorer
+from trap_detector import CrawlTrapDetector
+from checkpoint import CrawlCheckpointer
+from instrumented_lock import InstrumentedLock
+from html_parser import make_soup, resolve_parser
+from seen_set import create_seen_set, seen_set_statistics, ScalableBloomFilter, FingerprintIndex
+from parse_pool import ParsePool
+from stream_parser import StreamingPageParser, incremental_decoder
+
+
+def is_same_domain(base_url, target_url):
+    """같은 도메인 확인"""
+    return urlparse(base_url).netloc == urlparse(target_url).netloc
+
+
+def parse_html(url, html_content, parser=None):
+    """
+    페이지 파싱 -> 페이지 데이터
+
+    parse_processes 설정 시 파서 프로세스에서도 실행되므로 모듈 수준 함수로 둔다.
+    """
+    soup = make_soup(html_content, parser)
+    
+    # 페이지 해시 생성 (중복 확인용)
+    content_hash = hashlib.md5(html_content.encode()).hexdigest()
+    
+    # title.string 은 트리 전체를 참조하는 NavigableString 이므로 str 로 바꿔 둠 (파서 프로세스 결과 pickle)
+    title = soup.title.string if soup.title else ''
+    
+    page_data = {
+        'url': url,
+        'content_hash': content_hash,
+        'title': str(title) if title is not None else None,
+        'timestamp': datetime.now().isoformat(),
+        'links': [],
+        'text_content': '',
+        'meta_description': '',
+        'meta_keywords': [],
+        'images': [],
+        'headers': {},
+        'word_count': 0
+    }
+    
+    # 메타 태그 추출
+    for meta in soup.find_all('meta'):
+        name = meta.get('name', '').lower()
+        content = meta.get('content', '')
+        
+        if name == 'description':
+            page_data['meta_description'] = content
+        elif name == 'keywords':
+            page_data['meta_keywords'] = [kw.strip() for kw in content.split(',')]
+        elif name == 'robots':
+            page_data['meta_robots'] = content
+    
+    # 헤더 태그 추출
+    for i in range(1, 7):
+        headers = soup.find_all(f'h{i}')
+        page_data['headers'][f'h{i}'] = [h.get_text(strip=True) for h in headers]
+    
+    # 이미지 추출
+    for img in soup.find_all('img', src=True):
+        src = img['src']
+        alt = img.get('alt', '')
+        page_data['images'].append({
+            'src': urljoin(url, src),
+            'alt': alt
+        })
+    
+    # 텍스트 내용 추출
+    for script in soup(["script", "style", "nav", "footer"]):
+        script.decompose()
+    
+    text_content = soup.get_text(separator=' ', strip=True)
+    page_data['text_content'] = text_content
+    page_data['word_count'] = len(text_content.split())
+    
+    # 링크 추출
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        absolute_url = urljoin(url, href)
+        
+        # 같은 도메인의 링크만 수집
+        if is_same_domain(url, absolute_url):
+            link_info = {
+                'url': absolute_url,
+                'text': link.get_text(strip=True),
+                'title': link.get('title', '')
+            }
+            if link.get('type'):
+                link_info['type'] = link['type']
+            page_data['links'].append(link_info)
+    
+    return page_data
+
 
 class AdvancedWebCrawler:
     """
@@ -33,11 +135,33 @@ class AdvancedWebCrawler:
         
         self.session = requests.Session()
         self.ua = UserAgent()
-        self.crawled_urls = set()
+        # seen_set 설정 시 URL 문자열 대신 블룸 필터 / mmap 지문 인덱스로 방문 기록
+        self.seen_set_config = self.config.get('seen_set') or {}
+        self.crawled_urls = create_seen_set(self.seen_set_config)
         self.crawled_data = []
-        self.robots_cache = {}
-        self.url_queue = Queue()
-        self.lock = threading.Lock()
+        # HTML 파서 백엔드 ('lxml', 'html.parser', 'html5lib', 없으면 설치된 것 중 가장 빠른 파서)
+        self.parser = resolve_parser(self.config.get('html_parser'))
+        
+        # autothrottle 설정 시 호스트별 동시 요청 수를 응답 상태에 따라 자동 조절 (AIMD)
+        throttle_config = self.config.get('autothrottle')
+        if throttle_config:
+            self.autothrottle = AutoThrottle(**(throttle_config if isinstance(throttle_config, dict) else {}))
+        else:
+            self.autothrottle = None
+        
+        # frontier_file 설정 시 디스크 프론티어 사용 (메모리에는 앞부분만 올리고, 중단 시 이어서 진행)
+        frontier_file = self.config.get('frontier_file')
+        self.frontier_store = SQLiteFrontier(frontier_file) if frontier_file else None
+        self.url_queue = HostScheduler(
+            self.config['delay_range'],
+            throttle=self.autothrottle,
+            store=self.frontier_store,
+            buffer_size=self.config.get('frontier_buffer_size', 10000),
+            lock=InstrumentedLock('frontier')
+        )
+        # 공유 상태마다 lock 을 따로 둠 (방문 기록 / 결과 목록). 링크 추가는 lock 밖에서 한 번에
+        self.lock = InstrumentedLock('seen')
+        self.data_lock = InstrumentedLock('data')
         
         # 로깅 설정
         self._setup_logging()
@@ -45,6 +169,87 @@ class AdvancedWebCrawler:
         # 세션 설정
         self._setup_session()
         
+        # 워커별 커넥션 풀 (공유 세션의 헤더를 바꾸지 않도록 요청마다 헤더 전달)
+        self.client = PooledHTTPClient(
+            base_headers=self.session.headers,
+            pool_connections=self.config.get('pool_connections', 100),
+            pool_maxsize=self.config.get('pool_maxsize', 4)
+        )
+        
+        # seen 집합 확인 전에 URL을 한 가지 형태로 맞춤 (fragment, utm_*, 쿼리 순서, 기본 포트 등)
+        self.url_canonicalizer = URLCanonicalizer(**self.config.get('canonicalize', {}))
+        
+        # prioritize 설정 시 점수가 높은 URL부터 크롤링 (best-first), 페이지당 링크 수 제한
+        priority_config = self.config.get('prioritize')
+        if priority_config:
+            self.url_scorer = URLScorer(**(priority_config if isinstance(priority_config, dict) else {}))
+        else:
+            self.url_scorer = None
+        
+        # HTML이 아닌 링크를 큐에 넣기 전에 걸러내는 필터
+        self.url_filter = URLFilter(**self.config.get('url_filter', {}))
+        
+        # trap_detection 설정 시 달력, 세션 ID, 끝없는 필터 조합, 반복되는 경로 같은 크롤러 트랩 차단
+        # (URL 패턴별 한도가 큰 상품 목록 같은 정상 페이지도 막을 수 있으므로 기본은 사용 안 함)
+        trap_config = self.config.get('trap_detection', False)
+        if trap_config:
+            self.trap_detector = CrawlTrapDetector(**(trap_config if isinstance(trap_config, dict) else {}))
+        else:
+            self.trap_detector = None
+        
+        # 호스트별 robots.txt 캐시 (Crawl-delay / Request-rate 는 스케줄러 지연으로 사용)
+        self.robots_cache = RobotsCache(
+            fetch=self._fetch_robots_txt,
+            ttl=self.config.get('robots_ttl', 86400),
+            retry_ttl=self.config.get('robots_retry_ttl', 300),
+            cache_file=self.config.get('robots_cache_file', 'robots_cache.json'),
+            on_delay=self.url_queue.set_host_delay
+        )
+        
+        # 사이트맵에서 찾은 URL의 lastmod / priority (use_sitemaps 설정 시)
+        self.sitemap_entries = {}
+        self.sitemap_discovery = None
+        
+        # 실패한 요청은 워커를 붙잡지 않고 백오프 후 프론티어로 되돌림
+        self.retry_engine = RetryEngine(**self.config.get('retry', {}))
+        
+        # 재검증 캐시 (ETag / Last-Modified) - response_cache_file 설정 시 사용
+        cache_path = self.config.get('response_cache_file')
+        self.response_cache = ResponseCache(cache_path) if cache_path else None
+        
+        # checkpoint_dir 설정 시 N 페이지 / N 초마다 새 결과와 호스트 상태를 증분 저장
+        checkpoint_dir = self.config.get('checkpoint_dir')
+        if checkpoint_dir:
+            self.checkpointer = CrawlCheckpointer(
+                checkpoint_dir,
+                every_pages=self.config.get('checkpoint_pages', 50),
+                every_seconds=self.config.get('checkpoint_seconds', 60),
+                host_state=self._host_state,
+                on_checkpoint=self._flush_crawl_state
+            )
+        else:
+            self.checkpointer = None
+        
+        # parse_processes 설정 시 파싱은 프로세스 풀에서 (가져오기 스레드 수는 max_workers, 크롤링 시작 시 생성)
+        self.parse_pool = None
+        self.parse_pool_stats = {}
+        
+        # stream_parse 설정 시 본문을 받는 대로 파싱하고, 찾은 링크는 바로 프론티어에 추가
+        stream_config = self.config.get('stream_parse')
+        if stream_config:
+            self.stream_config = stream_config if isinstance(stream_config, dict) else {}
+        else:
+            self.stream_config = None
+        self._stream_lock = threading.Lock()
+        self.stream_stats = {
+            'pages': 0,
+            'stopped_early': 0,
+            'bytes_read': 0,
+            'links_emitted_early': 0,
+            'pages_with_early_links': 0,
+            'time_to_first_link': 0.0
+        }
+        
         # 캐시 로드
         self._load_cache()
     
@@ -73,6 +278,13 @@ class AdvancedWebCrawler:
     
     def _load_cache(self):
         """캐시 파일 로드"""
+        if isinstance(self.crawled_urls, ScalableBloomFilter):
+            self._load_seen_filter()
+            return
+        if isinstance(self.crawled_urls, FingerprintIndex):
+            # 인덱스 파일은 생성 시 mmap 으로 열려 있으므로 읽을 것이 없음
+            self.logger.info(f"URL 지문 인덱스에서 {len(self.crawled_urls)}개 URL 기록 열림")
+            return
         try:
             if os.path.exists(self.config['cache_file']):
                 with open(self.config['cache_file'], 'r', encoding='utf-8') as f:
@@ -84,187 +296,529 @@ class AdvancedWebCrawler:
     
     def _save_cache(self):
         """캐시 파일 저장"""
+        if isinstance(self.crawled_urls, ScalableBloomFilter):
+            self._save_seen_filter()
+            return
+        if isinstance(self.crawled_urls, FingerprintIndex):
+            try:
+                self.crawled_urls.merge()
+            except Exception as e:
+                self.logger.error(f"URL 지문 인덱스 병합 실패: {e}")
+            return
         try:
             cache_data = {
                 'crawled_urls': list(self.crawled_urls),
                 'timestamp': datetime.now().isoformat()
             }
             with open(self.config['cache_file'], 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+                json.dump(cache_data, f, ensure_ascii=False)
         except Exception as e:
             self.logger.error(f"캐시 저장 실패: {e}")
     
+    def _seen_filter_file(self):
+        return self.seen_set_config.get('file', 'seen_urls.bloom')
+    
+    def _load_seen_filter(self):
+        """블룸 필터 방문 기록 로드"""
+        path = self._seen_filter_file()
+        try:
+            if os.path.exists(path):
+                self.crawled_urls = ScalableBloomFilter.load(path)
+                self.logger.info(f"블룸 필터에서 {len(self.crawled_urls)}개 URL 기록 로드됨")
+        except Exception as e:
+            self.logger.warning(f"블룸 필터 로드 실패: {e}")
+    
+    def _save_seen_filter(self):
+        """블룸 필터 방문 기록 저장"""
+        try:
+            self.crawled_urls.save(self._seen_filter_file())
+        except Exception as e:
+            self.logger.error(f"블룸 필터 저장 실패: {e}")
+    
+    def _host_state(self):
+        """체크포인트에 저장할 호스트 상태"""
+        state = {'host_delays': dict(self.url_queue.host_delays)}
+        if self.autothrottle:
+            state['autothrottle'] = {
+                host: info['concurrency_limit']
+                for host, info in self.autothrottle.get_statistics()['hosts'].items()
+            }
+        return state
+    
+    def _flush_crawl_state(self):
+        """체크포인트 시점에 디스크 프론티어 / seen 인덱스의 변경 사항 기록"""
+        if self.frontier_store:
+            self.frontier_store.flush()
+        if isinstance(self.crawled_urls, FingerprintIndex):
+            self.crawled_urls.flush()
+    
+    def _resume_from_checkpoint(self):
+        """체크포인트에서 결과, 방문 기록, 호스트 상태, 프론티어 복원"""
+        records, host_state = self.checkpointer.load()
+        if not records:
+            return
+        
+        for host, delay in host_state.get('host_delays', {}).items():
+            self.url_queue.set_host_delay(host, delay)
+        if self.autothrottle:
+            for host, limit in host_state.get('autothrottle', {}).items():
+                self.autothrottle.set_limit(host, limit)
+        
+        with self.lock:
+            for _, page_data in records:
+                self.crawled_urls.add(page_data['url'])
+        with self.data_lock:
+            self.crawled_data.extend(page_data for _, page_data in records)
+        # 방문한 페이지의 링크 중 아직 방문하지 않은 것이 남은 프론티어
+        for depth, page_data in records:
+            if depth < self.config['max_depth']:
+                self._enqueue_links(page_data, depth)
+        
+        self.logger.info(
+            f"체크포인트에서 재개: {len(records)}개 페이지, 대기 URL {self.url_queue.qsize()}개"
+        )
+    
+    def _fetch_robots_txt(self, robots_url):
+        """크롤러의 HTTP 클라이언트로 robots.txt 가져오기 -> (상태 코드, 본문)"""
+        response = self.client.get(
+            robots_url,
+            headers={'User-Agent': self.ua.random},
+            timeout=self.config.get('timeout', 10)
+        )
+        return response.status_code, response.text
+    
+    def _open_sitemap_stream(self, sitemap_url):
+        """사이트맵 본문을 스트림으로 열기 (실패 시 None)"""
+        try:
+            response = self.client.get(
+                sitemap_url,
+                headers={'User-Agent': self.ua.random},
+                timeout=self.config.get('timeout', 10),
+                stream=True
+            )
+            if not response.ok:
+                response.close()
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.info(f"사이트맵 가져오기 실패 {sitemap_url}: {e}")
+            return None
+        
+        response.raw.decode_content = True
+        return response.raw
+    
+    def seed_from_sitemaps(self, start_url):
+        """사이트맵의 URL을 프론티어에 추가 (lastmod 가 바뀌지 않은 URL은 제외)"""
+        self.sitemap_discovery = SitemapDiscovery(
+            self._open_sitemap_stream,
+            robots_cache=self.robots_cache if self.config['respect_robots'] else None,
+            state_file=self.config.get('sitemap_state_file', 'sitemap_state.json'),
+            max_urls=self.config.get('sitemap_max_urls', 100000),
+            canonicalize=self.url_canonicalizer.canonicalize
+        )
+        
+        # discover 가 돌려주는 URL은 이미 정규화됨 (lastmod 상태도 같은 키로 저장)
+        for entry in self.sitemap_discovery.discover(start_url):
+            url = entry['url']
+            with self.lock:
+                if url in self.crawled_urls or url in self.sitemap_entries:
+                    continue
+                self.sitemap_entries[url] = entry
+            if self.url_filter.allows(url):
+                priority = self.url_scorer.score(url, 0, sitemap_priority=entry['priority']) if self.url_scorer else 0
+                self.url_queue.put((url, 0), priority=priority)
+        
+        self.logger.info(f"사이트맵 탐색 완료: {self.sitemap_discovery.stats}")
+    
+    def _save_sitemap_state(self):
+        """이번에 크롤링한 사이트맵 URL의 lastmod 저장"""
+        if not self.sitemap_discovery:
+            return
+        crawled_lastmod = {
+            url: entry['lastmod']
+            for url, entry in self.sitemap_entries.items()
+            if entry['lastmod'] and url in self.crawled_urls
+        }
+        self.sitemap_discovery.save_state(crawled_lastmod)
+    
     def check_robots_txt(self, url):
         """robots.txt 확인"""
         if not self.config['respect_robots']:
             return True
         
-        domain = urlparse(url).netloc
-        if domain in self.robots_cache:
-            return self.robots_cache[domain]
+        can_fetch = self.robots_cache.can_fetch(url, self.session.headers['User-Agent'])
+        if not can_fetch:
+            self.logger.warning(f"robots.txt에 의해 차단됨: {url}")
+        return can_fetch
+    
+    def fetch_page(self, url, read_body=True):
+        """
+        웹페이지 가져오기 (요청 실패 시 requests.RequestException 발생)
+
+        read_body=False 면 Content-Type 만 확인하고 본문은 읽지 않은 응답을 반환한다 (스트리밍 파싱용).
+        """
+        # robots.txt 확인
+        if not self.check_robots_txt(url):
+            return None
         
-        try:
-            robots_url = f"https://{domain}/robots.txt"
-            rp = RobotFileParser()
-            rp.set_url(robots_url)
-            rp.read()
-            
-            can_fetch = rp.can_fetch(self.session.headers['User-Agent'], url)
-            self.robots_cache[domain] = can_fetch
-            
-            if not can_fetch:
-                self.logger.warning(f"robots.txt에 의해 차단됨: {url}")
-            
-            return can_fetch
-            
-        except Exception as e:
-            self.logger.warning(f"robots.txt 확인 실패 {domain}: {e}")
-            return True
+        # User-Agent 변경 (이 요청에만 적용)
+        headers = {'User-Agent': self.ua.random}
+        
+        # 이전 크롤링 결과가 있으면 조건부 요청
+        if self.response_cache:
+            headers.update(self.response_cache.conditional_headers(url))
+        
+        response = self.client.get(url, headers=headers, timeout=self.config['timeout'], stream=True)
+        if not response.ok:
+            # 본문을 읽지 않은 스트리밍 응답은 닫아야 커넥션이 풀로 돌아감
+            response.close()
+        response.raise_for_status()
+        
+        # 본문을 읽기 전에 Content-Type 확인, 상한까지만 읽기
+        allowed_types = self.config.get('allowed_content_types', HTML_CONTENT_TYPES)
+        if read_body:
+            response = read_limited(
+                response,
+                max_bytes=self.config.get('max_body_bytes', DEFAULT_MAX_BODY_BYTES),
+                allowed_types=allowed_types
+            )
+        elif response.status_code != 304 and allowed_types and \
+                not is_allowed_content_type(response, allowed_types):
+            response.close()
+            response = None
+        if response is None:
+            self.logger.info(f"HTML이 아닌 응답 건너뜀: {url}")
+            return None
+        if getattr(response, 'truncated', False):
+            self.logger.warning(f"본문 크기 상한 도달, 잘린 본문 사용: {url}")
+        
+        if response.status_code == 304:
+            self.logger.info(f"변경 없음 (304): {url}")
+        else:
+            self.logger.info(f"페이지 가져옴: {url}")
+        return response
     
     def get_page(self, url):
-        """웹페이지 가져오기"""
+        """웹페이지 가져오기 (실패 시 None)"""
         try:
-            # robots.txt 확인
-            if not self.check_robots_txt(url):
-                return None
-            
-            # 랜덤 지연
-            time.sleep(random.uniform(*self.config['delay_range']))
-            
-            # User-Agent 변경
-            self.session.headers['User-Agent'] = self.ua.random
-            
-            response = self.session.get(url, timeout=self.config['timeout'])
-            response.raise_for_status()
-            
-            self.logger.info(f"페이지 가져옴: {url}")
-            return response
-            
+            return self.fetch_page(url)
         except requests.RequestException as e:
             self.logger.error(f"페이지 가져오기 실패 {url}: {e}")
             return None
     
+    def _schedule_retry(self, url, depth, error):
+        """실패한 URL을 백오프 시각에 맞춰 프론티어에 다시 넣기"""
+        delay, host_deferred_until = self.retry_engine.record_failure(url, error)
+        
+        if host_deferred_until:
+            self.url_queue.defer_host(self.url_queue.host_of(url), host_deferred_until)
+        
+        if delay is None:
+            self.logger.error(f"페이지 가져오기 실패 (재시도 안 함) {url}: {error}")
+            self.url_queue.complete(url)
+            return
+        
+        self.logger.warning(f"페이지 가져오기 실패, {delay:.1f}초 후 재시도 {url}: {error}")
+        self.url_queue.put((url, depth), not_before=time.monotonic() + delay)
+    
     def parse_page(self, url, html_content):
         """페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # 페이지 해시 생성 (중복 확인용)
-        content_hash = hashlib.md5(html_content.encode()).hexdigest()
-        
-        page_data = {
-            'url': url,
-            'content_hash': content_hash,
-            'title': soup.title.string if soup.title else '',
-            'timestamp': datetime.now().isoformat(),
-            'links': [],
-            'text_content': '',
-            'meta_description': '',
-            'meta_keywords': [],
-            'images': [],
-            'headers': {},
-            'word_count': 0
-        }
-        
-        # 메타 태그 추출
-        for meta in soup.find_all('meta'):
-            name = meta.get('name', '').lower()
-            content = meta.get('content', '')
-            
-            if name == 'description':
-                page_data['meta_description'] = content
-            elif name == 'keywords':
-                page_data['meta_keywords'] = [kw.strip() for kw in content.split(',')]
-            elif name == 'robots':
-                page_data['meta_robots'] = content
-        
-        # 헤더 태그 추출
-        for i in range(1, 7):
-            headers = soup.find_all(f'h{i}')
-            page_data['headers'][f'h{i}'] = [h.get_text(strip=True) for h in headers]
-        
-        # 이미지 추출
-        for img in soup.find_all('img', src=True):
-            src = img['src']
-            alt = img.get('alt', '')
-            page_data['images'].append({
-                'src': urljoin(url, src),
-                'alt': alt
-            })
-        
-        # 텍스트 내용 추출
-        for script in soup(["script", "style", "nav", "footer"]):
-            script.decompose()
-        
-        text_content = soup.get_text(separator=' ', strip=True)
-        page_data['text_content'] = text_content
-        page_data['word_count'] = len(text_content.split())
-        
-        # 링크 추출
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            absolute_url = urljoin(url, href)
-            
-            # 같은 도메인의 링크만 수집
-            if self._is_same_domain(url, absolute_url):
-                page_data['links'].append({
-                    'url': absolute_url,
-                    'text': link.get_text(strip=True),
-                    'title': link.get('title', '')
-                })
+        return parse_html(url, html_content, self.parser)
+    
+    def build_page_data(self, url, response):
+        """응답으로부터 페이지 데이터 생성 (304 이면 캐시된 파싱 결과 재사용)"""
+        if self.response_cache and response.status_code == 304:
+            try:
+                page_data = self.response_cache.reuse(url, response)
+            finally:
+                # 본문이 없는 스트리밍 응답도 닫아야 커넥션이 풀로 돌아감
+                response.close()
+            if page_data is None:
+                self.logger.warning(f"304 응답이지만 캐시된 결과 없음: {url}")
+            return page_data
         
+        return self._finish_page_data(url, response, self.parse_page(url, response.text))
+    
+    def _finish_page_data(self, url, response, page_data):
+        """파싱 결과에 응답 정보를 더하고 재검증 캐시에 저장"""
+        page_data['truncated'] = getattr(response, 'truncated', False)
+        if self.response_cache:
+            self.response_cache.store(url, response, page_data)
         return page_data
     
     def _is_same_domain(self, base_url, target_url):
         """같은 도메인 확인"""
-        base_domain = urlparse(base_url).netloc
-        target_domain = urlparse(target_url).netloc
-        return base_domain == target_domain
+        return is_same_domain(base_url, target_url)
+    
+    def _start_parse_pool(self):
+        """parse_processes 설정 시 파서 프로세스 풀 시작"""
+        processes = self.config.get('parse_processes')
+        # 스트리밍 파싱은 본문을 받는 스레드에서 바로 파싱하므로 풀을 쓰지 않음
+        if not processes or self.parse_pool or self.stream_config is not None:
+            return
+        if type(self).parse_page is not AdvancedWebCrawler.parse_page:
+            self.logger.warning("parse_page 를 재정의한 크롤러는 파서 프로세스 풀을 쓰지 않고 스레드에서 파싱")
+            return
+        self.parse_pool = ParsePool(
+            parse_html,
+            processes=processes,
+            max_pending=self.config.get('parse_queue_size'),
+            parser=self.parser
+        )
+        self.logger.info(
+            f"파서 프로세스 {self.parse_pool.processes}개 시작 "
+            f"(가져오기 스레드 {self.config['max_workers']}개, 대기 한도 {self.parse_pool.max_pending})"
+        )
+    
+    def _stop_parse_pool(self):
+        """남은 파싱을 마치고 풀 종료"""
+        if self.parse_pool:
+            self.parse_pool.close()
+            self.parse_pool_stats = self.parse_pool.get_statistics()
+            self.parse_pool = None
+    
+    def _submit_parse(self, url, depth, response):
+        """본문을 파서 프로세스로 넘김 (풀을 쓸 수 없으면 False)"""
+        if not self.parse_pool or (self.response_cache and response.status_code == 304):
+            return False
+        
+        def on_parsed(page_data, error):
+            try:
+                if error is not None:
+                    self.logger.error(f"파싱 실패 {url}: {error}")
+                    self.url_queue.complete(url)
+                    return
+                self._handle_page(url, depth, self._finish_page_data(url, response, page_data))
+            finally:
+                self.url_queue.task_done()
+        
+        # 파싱이 끝날 때까지 join / is_idle 이 기다리도록 작업을 하나 더 등록
+        self.url_queue.add_task()
+        try:
+            self.parse_pool.submit(url, response.content, response.encoding, on_parsed)
+        except Exception as e:
+            self.url_queue.task_done()
+            self.logger.warning(f"파서 프로세스 풀 사용 불가, 스레드에서 파싱 {url}: {e}")
+            return False
+        return True
+    
+    def process_url(self, url, depth):
+        """URL 하나 가져오기 / 파싱 / 링크 추가 (실제로 요청했으면 True)"""
+        with self.lock:
+            if url in self.crawled_urls:
+                self.url_queue.complete(url)
+                return False
+            if self._page_budget_exhausted():
+                self.url_queue.discard_pending()
+                return False
+        
+        # 서킷이 열린 호스트는 건너뛰고 나중에 다시 시도
+        allowed, retry_at = self.retry_engine.allow_request(url)
+        if not allowed:
+            self.url_queue.put((url, depth), not_before=retry_at)
+            return False
+        
+        started = time.monotonic()
+        try:
+            response = self.fetch_page(url, read_body=self.stream_config is None)
+        except requests.RequestException as e:
+            if self.autothrottle:
+                self.autothrottle.record(url, time.monotonic() - started, error=e)
+            self._schedule_retry(url, depth, e)
+            return True
+        
+        if self.autothrottle and response is not None:
+            self.autothrottle.record(url, time.monotonic() - started, status=response.status_code)
+        
+        self.retry_engine.record_success(url)
+        if response is not None and self.stream_config is not None and response.status_code != 304:
+            self._stream_page(url, depth, response, started)
+            return True
+        if response is not None and self._submit_parse(url, depth, response):
+            return True
+        
+        page_data = self.build_page_data(url, response) if response else None
+        self._handle_page(url, depth, page_data)
+        return True
+    
+    def _handle_page(self, url, depth, page_data):
+        """파싱한 페이지 기록, 링크 추가, URL 처리 완료 표시"""
+        new_urls = []
+        if page_data:
+            # 방문 기록에 먼저 표시한 워커만 결과를 기록 (lock 은 확인과 표시에만)
+            with self.lock:
+                claimed = url not in self.crawled_urls
+                if claimed:
+                    self.crawled_urls.add(url)
+            
+            if claimed:
+                self._record_page(url, page_data, depth)
+                # 새로운 링크들을 큐에 추가 (전역 lock 밖에서 한 번에)
+                if depth < self.config['max_depth']:
+                    new_urls = self._enqueue_links(page_data, depth)
+            
+            # 새 호스트의 robots.txt 는 첫 요청 전에 미리 받아 둠
+            if new_urls and self.config['respect_robots']:
+                self.robots_cache.prefetch(new_urls)
+        
+        self.url_queue.complete(url)
+    
+    def _stream_page(self, url, depth, response, started):
+        """
+        본문을 받는 대로 파싱하고 링크는 찾는 즉시 프론티어에 추가 (stream_parse 설정 시)
+
+        필요한 필드(fields)를 다 모았거나, max_links 개의 링크를 찾았거나, max_bytes 를 읽으면 나머지 본문은
+        받지 않는다. 본문 전체를 메모리에 두지 않으므로 재검증 캐시에는 저장하지 않는다.
+        """
+        # 링크를 받는 도중에 내보내므로 방문 기록에 먼저 표시
+        with self.lock:
+            claimed = url not in self.crawled_urls
+            if claimed:
+                self.crawled_urls.add(url)
+        if not claimed:
+            response.close()
+            self.url_queue.complete(url)
+            return
+        
+        config = self.stream_config
+        new_urls = []
+        first_link_at = []
+        
+        def on_links(links):
+            if not first_link_at:
+                first_link_at.append(time.monotonic())
+            new_urls.extend(self._enqueue_links({'links': links}, depth))
+        
+        # best-first 는 페이지의 링크를 모두 보고 상위만 고르므로 다 읽은 뒤에 한 번에 추가
+        emit_early = depth < self.config['max_depth'] and not self.url_scorer
+        parser = StreamingPageParser(
+            url,
+            fields=config.get('fields'),
+            max_links=config.get('max_links'),
+            on_links=on_links if emit_early else None,
+            link_batch=config.get('link_batch', 10)
+        )
+        max_bytes = config.get('max_bytes', self.config.get('max_body_bytes', DEFAULT_MAX_BODY_BYTES))
+        size = 0
+        finished = False
+        decoder = None
+        try:
+            for chunk in response.iter_content(chunk_size=config.get('chunk_size', 16 * 1024)):
+                if decoder is None:
+                    decoder = incremental_decoder(response.encoding, chunk)
+                chunk = chunk[:max_bytes - size]
+                size += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if parser.done or size >= max_bytes:
+                    break
+            else:
+                finished = True
+                if decoder is not None:
+                    parser.feed(decoder.decode(b'', final=True))
+        except requests.RequestException as e:
+            self.logger.warning(f"본문 받기 중단, 받은 부분만 사용 {url}: {e}")
+        finally:
+            response.close()
+        
+        page_data = parser.close()
+        page_data['truncated'] = not finished
+        if not finished:
+            self.logger.info(f"스트리밍 파싱 조기 종료 ({size} 바이트): {url}")
+        self._record_page(url, page_data, depth)
+        
+        if depth < self.config['max_depth'] and not emit_early:
+            new_urls = self._enqueue_links(page_data, depth)
+        if new_urls and self.config['respect_robots']:
+            self.robots_cache.prefetch(new_urls)
+        
+        with self._stream_lock:
+            self.stream_stats['pages'] += 1
+            self.stream_stats['bytes_read'] += size
+            self.stream_stats['stopped_early'] += 0 if finished else 1
+            if emit_early:
+                self.stream_stats['links_emitted_early'] += parser.links_emitted
+            if first_link_at:
+                self.stream_stats['pages_with_early_links'] += 1
+                self.stream_stats['time_to_first_link'] += first_link_at[0] - started
+        
+        self.url_queue.complete(url)
+    
+    def _enqueue_links(self, page_data, depth):
+        """페이지의 링크 중 방문하지 않은 것을 큐에 한 번에 추가 -> 추가한 URL 목록"""
+        candidates = []
+        for link_info in page_data['links']:
+            link_url = self.url_canonicalizer.canonicalize(link_info['url'])
+            if link_url in self.crawled_urls:
+                continue
+            if not self.url_filter.allows(link_url, link_info.get('type')):
+                continue
+            if self.trap_detector and not self.trap_detector.allows(link_url):
+                continue
+            candidates.append((link_url, link_info.get('text', '')))
+        
+        if self.url_scorer:
+            ranked = self.url_scorer.rank(candidates, depth + 1, self.sitemap_entries)
+        else:
+            ranked = [(link_url, 0) for link_url, _ in candidates]
+        
+        self._put_links([(link_url, depth + 1, priority) for link_url, priority in ranked])
+        return [link_url for link_url, _ in ranked]
+    
+    def _put_links(self, items):
+        """발견한 링크 [(url, depth, priority)] 를 프론티어에 추가"""
+        if items:
+            self.url_queue.put_many(items)
+    
+    def _record_page(self, url, page_data, depth):
+        """크롤링한 페이지 결과 기록 (방문 기록은 process_url 에서 이미 표시됨)"""
+        with self.data_lock:
+            self.crawled_data.append(page_data)
+        if self.checkpointer:
+            self.checkpointer.record(page_data, depth)
+    
+    def _page_budget_exhausted(self):
+        """max_pages 에 도달했는지"""
+        return len(self.crawled_urls) >= self.config['max_pages']
     
     def worker(self):
         """워커 스레드"""
         while True:
             try:
                 item = self.url_queue.get(timeout=1)
-                if item is None:
-                    break
-                
-                url, depth = item
-                
-                with self.lock:
-                    if url in self.crawled_urls or len(self.crawled_urls) >= self.config['max_pages']:
-                        self.url_queue.task_done()
-                        continue
-                
-                response = self.get_page(url)
-                if response:
-                    page_data = self.parse_page(url, response.text)
-                    
-                    with self.lock:
-                        if url not in self.crawled_urls:
-                            self.crawled_data.append(page_data)
-                            self.crawled_urls.add(url)
-                            
-                            # 새로운 링크들을 큐에 추가
-                            if depth < self.config['max_depth']:
-                                for link_info in page_data['links']:
-                                    link_url = link_info['url']
-                                    if link_url not in self.crawled_urls:
-                                        self.url_queue.put((link_url, depth + 1))
-                
-                self.url_queue.task_done()
-                
+            except Empty:
+                continue
+            
+            if item is None:
+                break
+            
+            # 호스트별 지연은 url_queue(HostScheduler)가 항목을 넘겨줄 때 이미 지켜짐
+            url, depth = item
+            fetched = True
+            try:
+                fetched = self.process_url(url, depth)
             except Exception as e:
                 self.logger.error(f"워커 에러: {e}")
+                # 처리 완료로 기록해야 디스크 프론티어 / 코디네이터 lease 에 남지 않음
+                self.url_queue.complete(url)
+            finally:
+                self.url_queue.release(url, fetched)
                 self.url_queue.task_done()
     
     def crawl(self, start_url):
         """멀티스레드 크롤링"""
         self.logger.info(f"고급 크롤링 시작: {start_url}")
+        start_url = self.url_canonicalizer.canonicalize(start_url)
+        
+        if self.checkpointer:
+            self._resume_from_checkpoint()
+            self.checkpointer.start()
         
         # 시작 URL을 큐에 추가
+        if self.config['respect_robots']:
+            self.robots_cache.prefetch([start_url])
         self.url_queue.put((start_url, 0))
         
-        # 워커 스레드 시작
+        # 워커 스레드 시작 (parse_processes 설정 시 파싱은 프로세스 풀에서)
+        self._start_parse_pool()
         threads = []
         for _ in range(self.config['max_workers']):
             t = threading.Thread(target=self.worker)
@@ -272,6 +826,10 @@ class AdvancedWebCrawler:
             t.start()
             threads.append(t)
         
+        # 사이트맵은 워커가 크롤링하는 동안 스트리밍으로 읽어 프론티어에 추가
+        if self.config.get('use_sitemaps'):
+            self.seed_from_sitemaps(start_url)
+        
         # 모든 작업 완료 대기
         self.url_queue.join()
         
@@ -281,10 +839,88 @@ class AdvancedWebCrawler:
         
         for t in threads:
             t.join()
+        self._stop_parse_pool()
         
+        connection_stats = self.client.get_statistics()
+        self.logger.info(
+            f"연결 재사용: {connection_stats['reused_connections']}/{connection_stats['requests']} "
+            f"(새 연결 {connection_stats['new_connections']}개)"
+        )
         self.logger.info(f"크롤링 완료. 총 {len(self.crawled_urls)}개 페이지 크롤링됨")
+        self._log_crawl_traps()
+        if self.checkpointer:
+            self.checkpointer.stop(finished=True)
         self.save_data()
         self._save_cache()
+        self.robots_cache.save()
+        self._save_sitemap_state()
+        if self.frontier_store:
+            self.frontier_store.flush()
+    
+    def _stream_statistics(self):
+        with self._stream_lock:
+            stats = dict(self.stream_stats)
+        early = stats.pop('pages_with_early_links')
+        total = stats.pop('time_to_first_link')
+        stats['average_time_to_first_link'] = total / early if early else 0.0
+        return stats
+    
+    def _log_crawl_traps(self):
+        """트랩으로 보고 막은 URL 패턴 기록"""
+        if not self.trap_detector:
+            return
+        for entry in self.trap_detector.get_statistics(top=10)['throttled_patterns']:
+            self.logger.info(f"크롤러 트랩 차단 ({entry['reason']}): {entry['pattern']} - {entry['blocked']}개 URL")
+    
+    def crawl_async(self, start_url):
+        """aiohttp 기반 비동기 크롤링 (동시 요청 수는 config['max_concurrency'])"""
+        from async_crawler import run_async_crawl
+        
+        max_concurrency = self.config.get('max_concurrency', 100)
+        self.logger.info(f"비동기 크롤링 시작: {start_url} (동시 요청: {max_concurrency})")
+        
+        run_async_crawl(
+            self,
+            start_url,
+            max_depth=self.config['max_depth'],
+            max_pages=self.config['max_pages'],
+            max_concurrency=max_concurrency,
+            timeout=self.config.get('timeout', 10),
+            delay_range=self.config['delay_range'],
+            max_body_bytes=self.config.get('max_body_bytes', DEFAULT_MAX_BODY_BYTES),
+            allowed_types=self.config.get('allowed_content_types', HTML_CONTENT_TYPES)
+        )
+        
+        self.logger.info(f"크롤링 완료. 총 {len(self.crawled_urls)}개 페이지 크롤링됨")
+        self.save_data()
+        self._save_cache()
+        self.robots_cache.save()
+    
+    def crawl_sharded(self, start_urls):
+        """
+        호스트 해시로 나눈 여러 프로세스에서 크롤링 (프로세스 수는 config['num_processes'])
+
+        각 프로세스가 자기 호스트의 페이지를 직접 파싱하므로 파싱이 GIL 하나에 묶이지 않는다.
+        호스트 단위로 나누므로 한 사이트만 크롤링하면 프로세스 하나가 모두 처리한다.
+        """
+        from sharded_crawler import run_sharded_crawl
+        
+        if isinstance(start_urls, str):
+            start_urls = [start_urls]
+        start_urls = [self.url_canonicalizer.canonicalize(url) for url in start_urls]
+        num_processes = self.config.get('num_processes') or os.cpu_count() or 1
+        self.logger.info(f"멀티 프로세스 크롤링 시작: {start_urls} (프로세스: {num_processes})")
+        if num_processes > 1 and len({urlparse(url).netloc for url in start_urls}) == 1:
+            self.logger.warning("시작 URL의 호스트가 하나뿐이라 같은 사이트 안의 링크는 한 프로세스가 모두 처리함 (한 사이트는 crawl() 과 parse_processes 권장)")
+        
+        pages, summaries = run_sharded_crawl(self.config, start_urls, num_processes)
+        self.crawled_data.extend(pages)
+        for page_data in pages:
+            self.crawled_urls.add(page_data['url'])
+        
+        per_shard = ', '.join(f"{s['shard']}:{s['pages']}" for s in summaries)
+        self.logger.info(f"크롤링 완료. 총 {len(pages)}개 페이지 크롤링됨 (샤드별 {per_shard})")
+        self.save_data()
     
     def save_data(self):
         """데이터 저장"""
@@ -318,7 +954,24 @@ class AdvancedWebCrawler:
             'total_words': total_words,
             'average_words_per_page': total_words / len(self.crawled_data),
             'average_links_per_page': total_links / len(self.crawled_data),
-            'average_images_per_page': total_images / len(self.crawled_data)
+            'average_images_per_page': total_images / len(self.crawled_data),
+            'connections': self.client.get_statistics(),
+            'response_cache': self.response_cache.get_statistics() if self.response_cache else {},
+            'url_filter': self.url_filter.get_statistics(),
+            'canonicalizer': self.url_canonicalizer.get_statistics(),
+            'crawl_traps': self.trap_detector.get_statistics() if self.trap_detector else {},
+            'priority': self.url_scorer.get_statistics() if self.url_scorer else {},
+            'checkpoint': self.checkpointer.get_statistics() if self.checkpointer else {},
+            'parse_pool': self.parse_pool.get_statistics() if self.parse_pool else self.parse_pool_stats,
+            'stream_parse': self._stream_statistics() if self.stream_config is not None else {},
+            'frontier': self.url_queue.get_statistics(),
+            'locks': dict(
+                {lock.name: lock.get_statistics() for lock in (self.lock, self.data_lock)},
+                **self.url_queue.lock_statistics()
+            ),
+            'retries': self.retry_engine.get_metrics()['counters'],
+            'autothrottle': self.autothrottle.get_statistics() if self.autothrottle else {},
+            'seen_set': seen_set_statistics(self.crawled_urls)
         }
 
 # 사용 예시
@@ -15,10 +15,10 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
 from PyQt5.QtCore import QThread, pyqtSignal, Qt
 from PyQt5.QtGui import QFont, QIcon
 import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from fake_useragent import UserAgent
 import time
+from html_parser import make_soup
 
 class TemplateCrawler:
     """템플릿 기반 크롤러"""
@@ -95,11 +95,12 @@ class AdvancedCrawlerThread(QThread):
     finished_signal = pyqtSignal(dict)
     error_signal = pyqtSignal(str)
     
-    def __init__(self, url, template_type="auto", custom_selectors=None):
+    def __init__(self, url, template_type="auto", custom_selectors=None, options=None):
         super().__init__()
         self.url = url
         self.template_type = template_type
         self.custom_selectors = custom_selectors or {}
+        self.options = options or {}
         self.is_running = True
         self.crawler = TemplateCrawler()
         
@@ -134,8 +135,8 @@ class AdvancedCrawlerThread(QThread):
         
         self.progress_signal.emit("페이지 파싱 중...")
         
-        # BeautifulSoup으로 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # BeautifulSoup으로 파싱 (options['html_parser'], 없으면 설치된 것 중 가장 빠른 파서)
+        soup = make_soup(response.text, self.options.get('html_parser'))
         
         # 기본 정보
         data = {
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+상용 크롤러 페이지 분석 벤치마크
+
+commercial_crawler 가 쓰던 기존 방식(요소마다 find_all 로 트리를 여러 번 순회)과 PageAnalyzer(한 번 순회)의
+결과가 같은지 확인하고, 큰 페이지에서 페이지당 분석 시간을 비교한다.
+
+    python analyzer_benchmark.py                       # 내장 예제 페이지 (행 수별)
+    python analyzer_benchmark.py https://example.com page.html --repeat 10
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+from types import SimpleNamespace
+from urllib.parse import urljoin, urlparse
+import requests
+from html_parser import make_soup
+from page_analyzer import PageAnalyzer
+
+
+BASE_URL = 'https://example.com/shop/index.html'
+
+# 기존 방식에서는 script / style 을 지운 뒤 세어서 항상 0 이던 성능 메트릭
+FIXED_FIELDS = {('performance_metrics', 'css_size'), ('performance_metrics', 'js_size'),
+                ('performance_metrics', 'script_count'), ('performance_metrics', 'style_count')}
+
+
+class LegacyAnalyzer:
+    """commercial_crawler.AdvancedCrawlerThread 의 기존 추출 코드 (비교 기준, soup 를 고침)"""
+
+    def __init__(self, url):
+        self.url = url
+
+    def analyze(self, soup, response):
+        return {
+            'basic_info': self.extract_basic_info(soup),
+            'extracted_data': self.extract_advanced_info(soup),
+            'performance_metrics': self.calculate_performance_metrics(soup, response)
+        }
+
+    def extract_basic_info(self, soup):
+        """기본 정보 추출"""
+        info = {
+            'title': '',
+            'description': '',
+            'keywords': [],
+            'images': [],
+            'links': [],
+            'text_content': '',
+            'headers': {},
+            'meta_tags': {},
+            'forms': [],
+            'scripts': [],
+            'styles': []
+        }
+        
+        # 제목
+        title_tag = soup.find('title')
+        if title_tag:
+            info['title'] = title_tag.get_text(strip=True)
+        
+        # 메타 태그
+        for meta in soup.find_all('meta'):
+            name = meta.get('name', '').lower()
+            content = meta.get('content', '')
+            
+            if name == 'description':
+                info['description'] = content
+            elif name == 'keywords':
+                info['keywords'] = [kw.strip() for kw in content.split(',')]
+            else:
+                info['meta_tags'][name] = content
+        
+        # 헤더
+        for i in range(1, 7):
+            headers = soup.find_all(f'h{i}')
+            info['headers'][f'h{i}'] = [h.get_text(strip=True) for h in headers]
+        
+        # 이미지
+        for img in soup.find_all('img', src=True):
+            src = img['src']
+            alt = img.get('alt', '')
+            info['images'].append({
+                'src': urljoin(self.url, src),
+                'alt': alt,
+                'width': img.get('width', ''),
+                'height': img.get('height', '')
+            })
+        
+        # 링크
+        base_domain = urlparse(self.url).netloc
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            absolute_url = urljoin(self.url, href)
+            link_domain = urlparse(absolute_url).netloc
+            
+            info['links'].append({
+                'url': absolute_url,
+                'text': link.get_text(strip=True),
+                'title': link.get('title', ''),
+                'is_internal': link_domain == base_domain
+            })
+        
+        # 폼
+        for form in soup.find_all('form'):
+            info['forms'].append({
+                'action': form.get('action', ''),
+                'method': form.get('method', 'get'),
+                'inputs': [{'name': inp.get('name', ''), 'type': inp.get('type', '')} 
+                          for inp in form.find_all('input')]
+            })
+        
+        # 스크립트
+        for script in soup.find_all('script'):
+            info['scripts'].append({
+                'src': script.get('src', ''),
+                'type': script.get('type', ''),
+                'content_length': len(script.get_text())
+            })
+        
+        # 스타일
+        for style in soup.find_all('style'):
+            info['styles'].append({
+                'content_length': len(style.get_text())
+            })
+        
+        # 텍스트
+        for script in soup(["script", "style", "nav", "footer"]):
+            script.decompose()
+        
+        text_content = soup.get_text(separator=' ', strip=True)
+        info['text_content'] = text_content[:2000] + "..." if len(text_content) > 2000 else text_content
+        
+        return info
+    
+    def extract_advanced_info(self, soup):
+        """고급 정보 추출"""
+        advanced = {
+            'content_analysis': {},
+            'seo_metrics': {},
+            'accessibility': {},
+            'security': {}
+        }
+        
+        # 콘텐츠 분석
+        text_content = soup.get_text()
+        advanced['content_analysis'] = {
+            'word_count': len(text_content.split()),
+            'character_count': len(text_content),
+            'paragraph_count': len(soup.find_all('p')),
+            'sentence_count': len(re.split(r'[.!?]+', text_content)),
+            'average_sentence_length': len(text_content.split()) / max(len(re.split(r'[.!?]+', text_content)), 1)
+        }
+        
+        # SEO 메트릭
+        advanced['seo_metrics'] = {
+            'title_length': len(soup.find('title').get_text() if soup.find('title') else ''),
+            'meta_description_length': len(soup.find('meta', attrs={'name': 'description'}).get('content', '') if soup.find('meta', attrs={'name': 'description'}) else ''),
+            'h1_count': len(soup.find_all('h1')),
+            'h2_count': len(soup.find_all('h2')),
+            'image_count': len(soup.find_all('img')),
+            'image_with_alt': len([img for img in soup.find_all('img') if img.get('alt')]),
+            'internal_links': len([link for link in soup.find_all('a', href=True) if urlparse(link['href']).netloc == urlparse(self.url).netloc]),
+            'external_links': len([link for link in soup.find_all('a', href=True) if urlparse(link['href']).netloc != urlparse(self.url).netloc])
+        }
+        
+        # 접근성
+        advanced['accessibility'] = {
+            'images_without_alt': len([img for img in soup.find_all('img') if not img.get('alt')]),
+            'forms_without_labels': len([form for form in soup.find_all('form') if not form.find_all('label')]),
+            'tables_without_headers': len([table for table in soup.find_all('table') if not table.find_all('th')])
+        }
+        
+        # 보안
+        advanced['security'] = {
+            'has_https': self.url.startswith('https'),
+            'has_csp': bool(soup.find('meta', attrs={'http-equiv': 'Content-Security-Policy'})),
+            'has_hsts': bool(soup.find('meta', attrs={'http-equiv': 'Strict-Transport-Security'}))
+        }
+        
+        return advanced
+    
+    def calculate_performance_metrics(self, soup, response):
+        """성능 메트릭 계산"""
+        return {
+            'page_size': len(response.content),
+            'html_size': len(response.text),
+            'css_size': sum(len(style.get_text()) for style in soup.find_all('style')),
+            'js_size': sum(len(script.get_text()) for script in soup.find_all('script')),
+            'image_count': len(soup.find_all('img')),
+            'script_count': len(soup.find_all('script')),
+            'style_count': len(soup.find_all('style')),
+            'link_count': len(soup.find_all('a')),
+            'form_count': len(soup.find_all('form'))
+        }
+
+
+def _sample_page(rows):
+    """상품 목록처럼 생긴 큰 페이지 (nav / footer / 폼 / 표 / 스크립트 포함)"""
+    items = '\n'.join(
+        f'<div class="item"><h2>상품 {i}</h2><p>설명 {i}. 좋은 상품입니다! 지금 구매하세요?</p>'
+        f'<a href="/item/{i}" title="상품 {i}">자세히</a> <a href="https://ads.example.net/{i}">광고</a>'
+        f'<img src="/img/{i}.jpg"{" alt=" + chr(34) + "상품" + chr(34) if i % 3 else ""} width="120" height="90">'
+        f'<table><tr><th>옵션</th><td>{i}</td></tr></table></div>'
+        + (f'<table><tr><td>헤더 없는 표 {i}</td></tr></table>' if i % 10 == 0 else '')
+        for i in range(rows)
+    )
+    return f"""<!DOCTYPE html><html><head><title>상품 목록</title>
+<meta charset="utf-8"><meta name="description" content="큰 상품 목록 페이지">
+<meta name="keywords" content="상품, 목록, 벤치마크">
+<meta http-equiv="Content-Security-Policy" content="default-src 'self'">
+<style>.item {{ margin: 4px; }}</style><script src="/app.js"></script>
+<script>window.items = {rows};</script></head><body>
+<nav><a href="/">홈</a><a href="/cart">장바구니</a><img src="/logo.png"></nav>
+<h1>상품 목록</h1>
+<form action="/search" method="post"><label>검색</label><input name="q" type="text"><input type="submit"></form>
+<form action="/subscribe"><input name="email" type="email"></form>
+{items}
+<footer><p>회사 소개</p><a href="/about">소개</a><table><tr><td>연락처</td></tr></table></footer>
+</body></html>"""
+
+
+def _load_pages(sources, rows):
+    if not sources:
+        return [(f'{n}행', BASE_URL, _sample_page(n)) for n in rows]
+    pages = []
+    for source in sources:
+        if os.path.exists(source):
+            with open(source, 'r', encoding='utf-8', errors='replace') as f:
+                pages.append((os.path.basename(source), BASE_URL, f.read()))
+        else:
+            response = requests.get(source, timeout=10)
+            response.raise_for_status()
+            pages.append((source, response.url, response.text))
+    return pages
+
+
+def _differences(expected, actual):
+    """섹션별로 다른 필드 -> [(섹션, 필드)]"""
+    return [(section, field)
+            for section in expected
+            for field in sorted(set(expected[section]) | set(actual[section]))
+            if expected[section].get(field) != actual[section].get(field)]
+
+
+def _time_analysis(analyzer, html, parser, repeat):
+    """페이지당 분석 시간(ms), 파싱 시간은 빼고 잼 (기존 방식이 soup 를 고치므로 매번 새로 파싱)"""
+    response = SimpleNamespace(content=html.encode('utf-8'), text=html)
+    total = 0.0
+    for _ in range(repeat):
+        soup = make_soup(html, parser)
+        started = time.perf_counter()
+        analyzer.analyze(soup, response)
+        total += time.perf_counter() - started
+    return total * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='상용 크롤러 페이지 분석 벤치마크')
+    parser.add_argument('sources', nargs='*', help='분석할 페이지 URL 또는 HTML 파일 (없으면 내장 예제)')
+    parser.add_argument('--rows', type=int, nargs='+', default=[100, 1000, 5000], help='내장 예제 페이지의 상품 수')
+    parser.add_argument('--repeat', type=int, default=5, help='페이지마다 반복 횟수')
+    parser.add_argument('--parser', default=None, help='HTML 파서 (기본: 설치된 것 중 가장 빠른 파서)')
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'페이지':>12s} {'크기':>10s} {'기존':>10s} {'한 번 순회':>10s} {'향상':>7s}")
+    for name, url, html in _load_pages(args.sources, args.rows):
+        response = SimpleNamespace(content=html.encode('utf-8'), text=html)
+        expected = LegacyAnalyzer(url).analyze(make_soup(html, args.parser), response)
+        actual = PageAnalyzer(url).analyze(make_soup(html, args.parser), response)
+        for section, field in _differences(expected, actual):
+            if (section, field) in FIXED_FIELDS:
+                continue
+            failed = True
+            print(f"  다름: {name} / {section} / {field}")
+
+        legacy_ms = _time_analysis(LegacyAnalyzer(url), html, args.parser, args.repeat)
+        single_ms = _time_analysis(PageAnalyzer(url), html, args.parser, args.repeat)
+        print(f"{name:>12s} {len(html) // 1024:>8d}KB {legacy_ms:>8.1f}ms {single_ms:>8.1f}ms {legacy_ms / single_ms:>6.1f}배")
+
+    print("\n결과 비교: " + ("다른 필드 있음" if failed else "같음 (script / style 성능 메트릭 제외)"))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
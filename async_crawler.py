@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import aiohttp
+from politeness import HostScheduler
+from http_client import is_allowed_content_type, HTML_CONTENT_TYPES, DEFAULT_MAX_BODY_BYTES
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFetchEngine:
+    """
+    aiohttp 기반 비동기 수집 엔진
+
+    WebCrawler / AdvancedWebCrawler 인스턴스를 받아 같은 parse_page, save_data 를
+    그대로 사용하고, 요청만 asyncio 위에서 동시에 보낸다.
+    동시에 진행 중인 요청 수는 max_concurrency 로 제한된다.
+    HTML 파싱은 이벤트 루프를 막지 않도록 스레드 풀에서 실행하고, 본문은 동기 경로처럼
+    Content-Type 을 먼저 확인한 뒤 max_body_bytes 까지만 읽는다.
+    """
+
+    def __init__(self, crawler, max_concurrency=100, timeout=10, delay_range=None,
+                 max_body_bytes=DEFAULT_MAX_BODY_BYTES, allowed_types=HTML_CONTENT_TYPES):
+        self.crawler = crawler
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_body_bytes = max_body_bytes
+        self.allowed_types = allowed_types
+        self.scheduler = HostScheduler(delay_range) if delay_range else None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.claimed_urls = set()
+        self.reserved_pages = 0
+
+    def _build_headers(self):
+        """크롤러 세션의 기본 헤더에 요청별 User-Agent 를 더한 헤더"""
+        headers = dict(self.crawler.session.headers)
+        headers['User-Agent'] = self.crawler.ua.random
+        return headers
+
+    async def _read_limited(self, response):
+        """본문을 max_body_bytes 까지만 읽기 -> (본문 bytes, 잘렸는지)"""
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            remaining = self.max_body_bytes - size
+            if len(chunk) > remaining:
+                chunks.append(chunk[:remaining])
+                return b''.join(chunks), True
+            chunks.append(chunk)
+            size += len(chunk)
+        return b''.join(chunks), False
+
+    async def fetch(self, session, url):
+        """페이지 본문을 비동기로 가져오기 -> (html, 잘렸는지) (실패하거나 HTML이 아니면 None)"""
+        # robots.txt 확인 (기존 동기 구현은 스레드 풀에서 실행)
+        check_robots = getattr(self.crawler, 'check_robots_txt', None)
+        if check_robots:
+            loop = asyncio.get_running_loop()
+            if not await loop.run_in_executor(None, check_robots, url):
+                return None
+
+        # 호스트별 지연: 같은 호스트 요청만 간격을 두고, 다른 호스트 요청은 바로 진행
+        if self.scheduler:
+            delay = self.scheduler.reserve(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            async with session.get(url, headers=self._build_headers()) as response:
+                response.raise_for_status()
+                if self.allowed_types and not is_allowed_content_type(response, self.allowed_types):
+                    self.crawler.logger.info(f"HTML이 아닌 응답 건너뜀: {url}")
+                    return None
+                body, truncated = await self._read_limited(response)
+                html = body.decode(response.charset or 'utf-8', errors='replace')
+                if truncated:
+                    self.crawler.logger.warning(f"본문 크기 상한 도달, 잘린 본문 사용: {url}")
+                self.crawler.logger.info(f"페이지 가져옴: {url}")
+                return html, truncated
+        except (aiohttp.ClientError, asyncio.TimeoutError, LookupError) as e:
+            self.crawler.logger.error(f"페이지 가져오기 실패 {url}: {e}")
+            return None
+        finally:
+            self.in_flight -= 1
+
+    async def _worker(self, session, queue, max_depth, max_pages):
+        """큐에서 URL을 꺼내 가져오고 파싱하는 코루틴"""
+        crawler = self.crawler
+        while True:
+            url, depth = await queue.get()
+            try:
+                if url in crawler.crawled_urls or url in self.claimed_urls or depth > max_depth:
+                    continue
+                if len(crawler.crawled_urls) + self.reserved_pages >= max_pages:
+                    continue
+
+                # 같은 URL을 여러 코루틴이 동시에 가져오지 않도록 먼저 표시
+                self.claimed_urls.add(url)
+                self.reserved_pages += 1
+                try:
+                    fetched = await self.fetch(session, url)
+                    if fetched is None:
+                        continue
+
+                    html, truncated = fetched
+                    loop = asyncio.get_running_loop()
+                    page_data = await loop.run_in_executor(None, crawler.parse_page, url, html)
+                    page_data['truncated'] = truncated
+                    crawler.crawled_data.append(page_data)
+                    crawler.crawled_urls.add(url)
+                finally:
+                    self.reserved_pages -= 1
+
+                if depth < max_depth:
+                    url_filter = getattr(crawler, 'url_filter', None)
+                    canonicalizer = getattr(crawler, 'url_canonicalizer', None)
+                    for link_info in page_data['links']:
+                        link_url = link_info['url']
+                        if canonicalizer:
+                            link_url = canonicalizer.canonicalize(link_url)
+                        if link_url in crawler.crawled_urls or link_url in self.claimed_urls:
+                            continue
+                        if url_filter and not url_filter.allows(link_url, link_info.get('type')):
+                            continue
+                        queue.put_nowait((link_url, depth + 1))
+            except Exception as e:
+                crawler.logger.error(f"비동기 워커 에러 {url}: {e}")
+            finally:
+                queue.task_done()
+
+    async def run(self, start_url, max_depth, max_pages):
+        """크롤링 실행 (모든 큐 항목이 처리되면 종료)"""
+        queue = asyncio.Queue()
+        canonicalizer = getattr(self.crawler, 'url_canonicalizer', None)
+        if canonicalizer:
+            start_url = canonicalizer.canonicalize(start_url)
+        queue.put_nowait((start_url, 0))
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+        client_timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+            workers = [
+                asyncio.create_task(self._worker(session, queue, max_depth, max_pages))
+                for _ in range(self.max_concurrency)
+            ]
+            await queue.join()
+
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        logger.debug(f"최대 동시 요청 수: {self.max_in_flight}")
+
+
+def run_async_crawl(crawler, start_url, max_depth, max_pages, max_concurrency=100,
+                    timeout=10, delay_range=None, max_body_bytes=DEFAULT_MAX_BODY_BYTES,
+                    allowed_types=HTML_CONTENT_TYPES):
+    """동기 코드에서 비동기 크롤링을 실행하는 헬퍼"""
+    engine = AsyncFetchEngine(
+        crawler,
+        max_concurrency=max_concurrency,
+        timeout=timeout,
+        delay_range=delay_range,
+        max_body_bytes=max_body_bytes,
+        allowed_types=allowed_types
+    )
+    asyncio.run(engine.run(start_url, max_depth, max_pages))
+    return engine
@@ -0,0 +1,140 @@
+import threading
+from collections import deque
+from datetime import datetime
+from urllib.parse import urlparse
+import requests
+
+
+class HostThrottleState:
+    """호스트 하나의 자동 조절 상태"""
+
+    def __init__(self, start_concurrency):
+        self.limit = float(start_concurrency)
+        self.ewma_latency = None
+        self.ewma_error_rate = 0.0
+        self.responses = 0
+        self.increases = 0
+        self.decreases = 0
+
+
+class AutoThrottle:
+    """
+    호스트별 동시 요청 수 자동 조절 (AIMD)
+
+    응답 지연과 오류율이 낮게 유지되는 동안에는 호스트의 동시 요청 한도를 조금씩(가산) 올리고,
+    타임아웃 / 429 / 5xx 가 나오면 곱셈으로 줄인다. HostScheduler 는 이 한도를 보고
+    호스트별 동시 요청 수와 요청 간격을 정한다.
+    """
+
+    OVERLOAD_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(self, start_concurrency=1, min_concurrency=1, max_concurrency=8,
+                 target_latency=1.0, max_error_rate=0.05, increase_step=1.0,
+                 decrease_factor=0.5, smoothing=0.2, max_decisions=100):
+        self.start_concurrency = start_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.max_error_rate = max_error_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.smoothing = smoothing
+
+        self._lock = threading.Lock()
+        self._hosts = {}
+        self.decisions = deque(maxlen=max_decisions)
+
+    @staticmethod
+    def host_of(url):
+        return urlparse(url).netloc
+
+    def _state(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = HostThrottleState(self.start_concurrency)
+            self._hosts[host] = state
+        return state
+
+    def limit(self, host):
+        """호스트의 현재 동시 요청 한도"""
+        with self._lock:
+            return self._state(host).limit
+
+    def set_limit(self, host, limit):
+        """저장해 둔 한도 복원 (체크포인트에서 재시작할 때)"""
+        with self._lock:
+            self._state(host).limit = min(self.max_concurrency, max(self.min_concurrency, float(limit)))
+
+    def max_in_flight(self, host):
+        """동시에 진행할 수 있는 요청 수 (정수)"""
+        return max(int(self.limit(host)), self.min_concurrency)
+
+    def is_overload(self, status=None, error=None):
+        """서버 과부하 신호인지"""
+        if status in self.OVERLOAD_STATUS:
+            return True
+        if error is not None:
+            response = getattr(error, 'response', None)
+            if response is not None:
+                return response.status_code in self.OVERLOAD_STATUS
+            return isinstance(error, (requests.Timeout, requests.ConnectionError))
+        return False
+
+    def _decide(self, host, state, action, reason):
+        self.decisions.append({
+            'host': host,
+            'action': action,
+            'limit': round(state.limit, 2),
+            'reason': reason,
+            'timestamp': datetime.now().isoformat()
+        })
+
+    def record(self, url, latency, status=None, error=None):
+        """응답 결과를 반영해 한도 조정"""
+        host = self.host_of(url)
+        overloaded = self.is_overload(status, error)
+        alpha = self.smoothing
+
+        with self._lock:
+            state = self._state(host)
+            state.responses += 1
+            state.ewma_error_rate = (1 - alpha) * state.ewma_error_rate + alpha * (1.0 if overloaded else 0.0)
+            if error is None:
+                if state.ewma_latency is None:
+                    state.ewma_latency = latency
+                else:
+                    state.ewma_latency = (1 - alpha) * state.ewma_latency + alpha * latency
+
+            previous = state.limit
+            if overloaded:
+                # 곱셈 감소
+                state.limit = max(self.min_concurrency, state.limit * self.decrease_factor)
+                if state.limit < previous:
+                    state.decreases += 1
+                    self._decide(host, state, 'decrease', f'status={status}' if error is None else type(error).__name__)
+            elif error is None and state.ewma_latency <= self.target_latency and \
+                    state.ewma_error_rate <= self.max_error_rate:
+                # 가산 증가 (한도 1 만큼 늘리는 데 대략 한도 수만큼의 성공 응답 필요)
+                state.limit = min(self.max_concurrency, state.limit + self.increase_step / state.limit)
+                if int(state.limit) > int(previous):
+                    state.increases += 1
+                    self._decide(host, state, 'increase', f'latency={state.ewma_latency:.2f}s')
+
+    def get_statistics(self):
+        """호스트별 한도와 최근 조정 기록"""
+        with self._lock:
+            hosts = {
+                host: {
+                    'concurrency_limit': round(state.limit, 2),
+                    'ewma_latency': round(state.ewma_latency, 3) if state.ewma_latency is not None else None,
+                    'error_rate': round(state.ewma_error_rate, 3),
+                    'responses': state.responses,
+                    'increases': state.increases,
+                    'decreases': state.decreases
+                }
+                for host, state in self._hosts.items()
+            }
+            return {
+                'hosts': hosts,
+                'recent_decisions': list(self.decisions)
+            }
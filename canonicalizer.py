@@ -0,0 +1,138 @@
+import re
+import fnmatch
+import threading
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+from seen_set import WindowedBloomFilter
+
+
+# 추적용 파라미터 (와일드카드 가능)
+DEFAULT_STRIP_PARAMS = (
+    'utm_*', 'gclid', 'fbclid', 'msclkid', 'yclid', 'dclid',
+    'mc_cid', 'mc_eid', '_hsenc', '_hsmi', '_ga', '_gl'
+)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+class _HostRules:
+    """호스트 하나에 적용할 정규화 규칙 (미리 컴파일)"""
+
+    def __init__(self, strip_params=DEFAULT_STRIP_PARAMS, sort_query=True, remove_fragment=True,
+                 trailing_slash=None, lowercase_path=False):
+        self.strip_params = tuple(strip_params)
+        patterns = [fnmatch.translate(p.lower()) for p in self.strip_params]
+        self.strip_regex = re.compile('|'.join(patterns)) if patterns else None
+        self.sort_query = sort_query
+        self.remove_fragment = remove_fragment
+        # 'strip' | 'add' | None(그대로) - 상대 링크는 정규화한 URL 기준으로 풀리므로 기본은 그대로
+        self.trailing_slash = trailing_slash
+        self.lowercase_path = lowercase_path
+
+    def options(self):
+        return {
+            'strip_params': self.strip_params,
+            'sort_query': self.sort_query,
+            'remove_fragment': self.remove_fragment,
+            'trailing_slash': self.trailing_slash,
+            'lowercase_path': self.lowercase_path
+        }
+
+
+class URLCanonicalizer:
+    """
+    URL 정규화기
+
+    seen 집합 확인과 요청 전에 URL을 한 가지 형태로 맞춘다.
+    스킴 / 호스트 소문자화, 기본 포트 제거, #fragment 제거, 추적 파라미터(utm_* 등) 제거,
+    쿼리 파라미터 정렬, (설정 시) 끝 슬래시 통일을 하며, host_rules 로 호스트별 규칙을 덮어쓸 수 있다.
+    같은 URL이 반복해서 나오므로 결과는 LRU 캐시에 둔다.
+    duplicates_removed 는 이미 본 정규화 URL로 합쳐진 서로 다른 원래 URL 수다 (방문 여부와 상관없이,
+    같은 URL이 여러 번 나와도 한 번만 셈). 메모리를 일정하게 두려고 최근 duplicate_window 개의 URL을
+    고정 크기 블룸 필터로 기억하므로 근사치다 (0 이면 세지 않음).
+    """
+
+    def __init__(self, host_rules=None, cache_size=100000, duplicate_window=1000000, **default_rules):
+        self.default_rules = _HostRules(**default_rules)
+        self.host_rules = {
+            host.lower(): _HostRules(**{**self.default_rules.options(), **rules})
+            for host, rules in (host_rules or {}).items()
+        }
+        self._canonicalize = lru_cache(maxsize=cache_size)(self._canonicalize_uncached)
+        self._lock = threading.Lock()
+        if duplicate_window:
+            self._seen_originals = WindowedBloomFilter(duplicate_window)   # 최근에 본 원래 URL
+            self._seen_canonical = WindowedBloomFilter(duplicate_window)   # 최근에 만든 정규화 URL
+        else:
+            self._seen_originals = self._seen_canonical = None
+        self.stats = {'rewritten': 0, 'duplicates_removed': 0}
+
+    def rules_for(self, host):
+        """호스트 규칙 (www. 를 뗀 호스트 규칙도 찾아봄)"""
+        rules = self.host_rules.get(host)
+        if rules is None and host.startswith('www.'):
+            rules = self.host_rules.get(host[4:])
+        return rules or self.default_rules
+
+    def _canonicalize_uncached(self, url):
+        try:
+            parts = urlsplit(url.strip())
+            port = parts.port
+        except ValueError:
+            return url
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS:
+            return url
+
+        host = (parts.hostname or '').rstrip('.')
+        rules = self.rules_for(host)
+
+        netloc = host
+        if ':' in host:
+            netloc = f'[{host}]'     # IPv6
+        if port is not None and port != DEFAULT_PORTS[scheme]:
+            netloc = f'{netloc}:{port}'
+        if parts.username:
+            userinfo = parts.username + (f':{parts.password}' if parts.password else '')
+            netloc = f'{userinfo}@{netloc}'
+
+        path = parts.path or '/'
+        if rules.lowercase_path:
+            path = path.lower()
+        if rules.trailing_slash == 'strip' and len(path) > 1 and path.endswith('/'):
+            path = path.rstrip('/') or '/'
+        elif rules.trailing_slash == 'add' and not path.endswith('/') and \
+                '.' not in path.rsplit('/', 1)[-1]:
+            path += '/'
+
+        query = parts.query
+        if query:
+            params = [p for p in query.split('&') if p]
+            if rules.strip_regex is not None:
+                params = [p for p in params if not rules.strip_regex.fullmatch(p.split('=', 1)[0].lower())]
+            if rules.sort_query:
+                params.sort()
+            query = '&'.join(params)
+
+        fragment = '' if rules.remove_fragment else parts.fragment
+        return urlunsplit((scheme, netloc, path, query, fragment))
+
+    def canonicalize(self, url):
+        """정규화된 URL"""
+        canonical = self._canonicalize(url)
+        with self._lock:
+            if canonical != url:
+                self.stats['rewritten'] += 1
+            if self._seen_originals is not None and self._seen_originals.add(url):
+                if not self._seen_canonical.add(canonical):
+                    # 다른 형태로 이미 본 URL (정규화하지 않았으면 따로 요청했을 것)
+                    self.stats['duplicates_removed'] += 1
+        return canonical
+
+    def get_statistics(self):
+        with self._lock:
+            stats = dict(self.stats)
+        cache = self._canonicalize.cache_info()
+        stats['cache_hits'] = cache.hits
+        stats['cache_size'] = cache.currsize
+        return stats
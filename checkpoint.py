@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlCheckpointer:
+    """
+    백그라운드 증분 체크포인트
+
+    크롤러가 record 로 넘긴 새 결과를 every_pages 페이지 또는 every_seconds 초마다
+    results.jsonl 에 덧붙인다(전체를 다시 쓰지 않음). 각 줄에는 페이지와 깊이가 들어 있으므로
+    재시작할 때 방문 기록(seen 집합)과 프론티어(아직 방문하지 않은 링크)를 여기서 다시 만든다.
+    호스트 상태(지연, 동시 요청 한도 등)는 크기가 작아 hosts.json 에 통째로 교체 저장한다.
+    디스크 작업은 모두 체크포인트 스레드에서 하므로 워커는 목록에 추가하는 비용만 든다.
+    """
+
+    def __init__(self, directory='checkpoint', every_pages=50, every_seconds=60,
+                 host_state=None, on_checkpoint=None):
+        self.directory = directory
+        self.every_pages = every_pages
+        self.every_seconds = every_seconds
+        self.host_state = host_state          # host_state() -> dict (호스트 상태 스냅샷)
+        self.on_checkpoint = on_checkpoint    # 체크포인트마다 부를 함수 (프론티어 / seen 집합 flush 등)
+        self.results_path = os.path.join(directory, 'results.jsonl')
+        self.hosts_path = os.path.join(directory, 'hosts.json')
+
+        self._pending = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self.stats = {
+            'checkpoints': 0,
+            'pages_written': 0,
+            'last_duration': 0.0,
+            'total_duration': 0.0
+        }
+        os.makedirs(directory, exist_ok=True)
+
+    def load(self):
+        """
+        이전 실행의 체크포인트 읽기 -> ([(depth, page_data)], 호스트 상태)
+
+        정상 종료(finished)된 체크포인트이면 새로 시작한다.
+        """
+        host_state = {}
+        if os.path.exists(self.hosts_path):
+            try:
+                with open(self.hosts_path, 'r', encoding='utf-8') as f:
+                    host_state = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"호스트 상태 체크포인트 로드 실패: {e}")
+
+        if host_state.get('finished'):
+            self.reset()
+            return [], {}
+
+        records = []
+        if os.path.exists(self.results_path):
+            with open(self.results_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # 쓰는 도중 중단된 마지막 줄
+                    records.append((record['depth'], record['page']))
+        return records, host_state
+
+    def reset(self):
+        """체크포인트 파일 삭제"""
+        for path in (self.results_path, self.hosts_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def record(self, page_data, depth):
+        """새로 크롤링한 페이지 추가 (워커 스레드에서 호출)"""
+        with self._lock:
+            self._pending.append((depth, page_data))
+            if len(self._pending) >= self.every_pages:
+                self._wakeup.set()
+
+    def checkpoint(self, finished=False):
+        """쌓인 결과를 덧붙이고 호스트 상태 저장"""
+        with self._write_lock:
+            started = time.monotonic()
+            with self._lock:
+                pending, self._pending = self._pending, []
+
+            if pending:
+                with open(self.results_path, 'a', encoding='utf-8') as f:
+                    for depth, page_data in pending:
+                        f.write(json.dumps({'depth': depth, 'page': page_data}, ensure_ascii=False))
+                        f.write('\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            if self.on_checkpoint:
+                self.on_checkpoint()
+
+            host_state = self.host_state() if self.host_state else {}
+            host_state['finished'] = finished
+            tmp_path = self.hosts_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(host_state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.hosts_path)
+
+            duration = time.monotonic() - started
+            self.stats['checkpoints'] += 1
+            self.stats['pages_written'] += len(pending)
+            self.stats['last_duration'] = duration
+            self.stats['total_duration'] += duration
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.every_seconds)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.checkpoint()
+            except Exception as e:
+                logger.error(f"체크포인트 저장 실패: {e}")
+
+    def start(self):
+        """체크포인트 스레드 시작"""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, finished=True):
+        """스레드를 멈추고 마지막 체크포인트 저장"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.checkpoint(finished=finished)
+
+    def get_statistics(self):
+        stats = dict(self.stats)
+        with self._lock:
+            stats['pending_pages'] = len(self._pending)
+        return stats
@@ -5,7 +5,6 @@
 
 import sys
 import json
-import re
 import time
 import random
 import threading
@@ -19,12 +18,14 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
 from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer
 from PyQt5.QtGui import QFont, QIcon
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
 from fake_useragent import UserAgent
 import queue
 import hashlib
 import os
+from politeness import HostScheduler
+from retry_engine import RetryEngine
+from html_parser import make_soup
+from page_analyzer import PageAnalyzer
 
 class CommercialCrawler:
     """상용화 크롤러 클래스"""
@@ -38,7 +39,13 @@ class CommercialCrawler:
         self.delay_range = (1, 3)
         self.max_concurrent = 5
         self.crawled_urls = set()
-        self.error_log = []
+        self.scheduler = HostScheduler(self.delay_range)
+        self.retry_engine = RetryEngine(max_retries=self.retry_count - 1)
+    
+    @property
+    def error_log(self):
+        """구조화된 재시도 지표 (카운터, 오류 유형별 횟수, 열린 서킷, 최근 오류)"""
+        return self.retry_engine.get_metrics()
         
     def load_proxies(self, proxy_file=None):
         """프록시 목록 로드"""
@@ -70,8 +77,20 @@ class CommercialCrawler:
         }
     
     def make_request(self, url, use_proxy=True, timeout=30):
-        """요청 보내기 (재시도 로직 포함)"""
-        for attempt in range(self.retry_count):
+        """
+        요청 보내기 (재시도 로직 포함)
+        
+        실패하면 호스트 스케줄러에 다음 시도 시각(지터 백오프, Retry-After)을 예약하고,
+        그 시각까지 호출한 스레드에서 기다린 뒤 다시 요청한다. 즉 백오프 동안 호출자는
+        계속 블록되며, 재시도 간격만 스케줄러가 정한다.
+        """
+        host = self.scheduler.host_of(url)
+        
+        while True:
+            allowed, retry_at = self.retry_engine.allow_request(url)
+            if not allowed:
+                raise requests.ConnectionError(f"서킷 브레이커 열림: {host}")
+            
             try:
                 headers = self.get_headers()
                 proxies = None
@@ -81,8 +100,9 @@ class CommercialCrawler:
                     if proxy:
                         proxies = {'http': proxy, 'https': proxy}
                 
-                # 랜덤 딜레이
-                time.sleep(random.uniform(*self.delay_range))
+                # 호스트별 딜레이 (재시도 백오프 포함, 이 스레드에서 기다림)
+                self.scheduler.delay_range = self.delay_range
+                self.scheduler.wait(url)
                 
                 response = self.session.get(
                     url, 
@@ -91,22 +111,18 @@ class CommercialCrawler:
                     timeout=timeout
                 )
                 response.raise_for_status()
+                self.retry_engine.record_success(url)
                 return response
                 
             except Exception as e:
-                self.error_log.append({
-                    'url': url,
-                    'attempt': attempt + 1,
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                })
-                
-                if attempt == self.retry_count - 1:
+                delay, host_deferred_until = self.retry_engine.record_failure(url, e)
+                if delay is None:
                     raise e
                 
-                time.sleep(2 ** attempt)  # 지수 백오프
-        
-        return None
+                retry_at = time.monotonic() + delay
+                if host_deferred_until:
+                    retry_at = max(retry_at, host_deferred_until)
+                self.scheduler.defer_host(host, retry_at)
 
 class AdvancedCrawlerThread(QThread):
     """고급 크롤링 작업을 별도 스레드에서 실행"""
@@ -147,8 +163,8 @@ class AdvancedCrawlerThread(QThread):
         
         self.progress_signal.emit("페이지 파싱 중...")
         
-        # BeautifulSoup으로 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # BeautifulSoup으로 파싱 (설치된 것 중 가장 빠른 파서)
+        soup = make_soup(response.text, self.options.get('html_parser'))
         
         # 기본 정보
         data = {
@@ -165,20 +181,9 @@ class AdvancedCrawlerThread(QThread):
             'performance_metrics': {}
         }
         
-        # 기본 정보 추출
-        self.progress_signal.emit("기본 정보 추출 중...")
-        basic_info = self.extract_basic_info(soup)
-        data['basic_info'] = basic_info
-        
-        # 고급 정보 추출
-        self.progress_signal.emit("고급 정보 추출 중...")
-        advanced_info = self.extract_advanced_info(soup)
-        data['extracted_data'] = advanced_info
-        
-        # 성능 메트릭 계산
-        self.progress_signal.emit("성능 분석 중...")
-        performance = self.calculate_performance_metrics(soup, response)
-        data['performance_metrics'] = performance
+        # 기본 정보, 고급 정보, 성능 메트릭을 트리 한 번 순회로 추출
+        self.progress_signal.emit("페이지 분석 중...")
+        data.update(PageAnalyzer(self.url).analyze(soup, response))
         
         # 실시간 데이터 전송
         self.data_signal.emit(data)
@@ -186,162 +191,6 @@ class AdvancedCrawlerThread(QThread):
         self.progress_signal.emit("크롤링 완료!")
         return data
     
-    def extract_basic_info(self, soup):
-        """기본 정보 추출"""
-        info = {
-            'title': '',
-            'description': '',
-            'keywords': [],
-            'images': [],
-            'links': [],
-            'text_content': '',
-            'headers': {},
-            'meta_tags': {},
-            'forms': [],
-            'scripts': [],
-            'styles': []
-        }
-        
-        # 제목
-        title_tag = soup.find('title')
-        if title_tag:
-            info['title'] = title_tag.get_text(strip=True)
-        
-        # 메타 태그
-        for meta in soup.find_all('meta'):
-            name = meta.get('name', '').lower()
-            content = meta.get('content', '')
-            
-            if name == 'description':
-                info['description'] = content
-            elif name == 'keywords':
-                info['keywords'] = [kw.strip() for kw in content.split(',')]
-            else:
-                info['meta_tags'][name] = content
-        
-        # 헤더
-        for i in range(1, 7):
-            headers = soup.find_all(f'h{i}')
-            info['headers'][f'h{i}'] = [h.get_text(strip=True) for h in headers]
-        
-        # 이미지
-        for img in soup.find_all('img', src=True):
-            src = img['src']
-            alt = img.get('alt', '')
-            info['images'].append({
-                'src': urljoin(self.url, src),
-                'alt': alt,
-                'width': img.get('width', ''),
-                'height': img.get('height', '')
-            })
-        
-        # 링크
-        base_domain = urlparse(self.url).netloc
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            absolute_url = urljoin(self.url, href)
-            link_domain = urlparse(absolute_url).netloc
-            
-            info['links'].append({
-                'url': absolute_url,
-                'text': link.get_text(strip=True),
-                'title': link.get('title', ''),
-                'is_internal': link_domain == base_domain
-            })
-        
-        # 폼
-        for form in soup.find_all('form'):
-            info['forms'].append({
-                'action': form.get('action', ''),
-                'method': form.get('method', 'get'),
-                'inputs': [{'name': inp.get('name', ''), 'type': inp.get('type', '')} 
-                          for inp in form.find_all('input')]
-            })
-        
-        # 스크립트
-        for script in soup.find_all('script'):
-            info['scripts'].append({
-                'src': script.get('src', ''),
-                'type': script.get('type', ''),
-                'content_length': len(script.get_text())
-            })
-        
-        # 스타일
-        for style in soup.find_all('style'):
-            info['styles'].append({
-                'content_length': len(style.get_text())
-            })
-        
-        # 텍스트
-        for script in soup(["script", "style", "nav", "footer"]):
-            script.decompose()
-        
-        text_content = soup.get_text(separator=' ', strip=True)
-        info['text_content'] = text_content[:2000] + "..." if len(text_content) > 2000 else text_content
-        
-        return info
-    
-    def extract_advanced_info(self, soup):
-        """고급 정보 추출"""
-        advanced = {
-            'content_analysis': {},
-            'seo_metrics': {},
-            'accessibility': {},
-            'security': {}
-        }
-        
-        # 콘텐츠 분석
-        text_content = soup.get_text()
-        advanced['content_analysis'] = {
-            'word_count': len(text_content.split()),
-            'character_count': len(text_content),
-            'paragraph_count': len(soup.find_all('p')),
-            'sentence_count': len(re.split(r'[.!?]+', text_content)),
-            'average_sentence_length': len(text_content.split()) / max(len(re.split(r'[.!?]+', text_content)), 1)
-        }
-        
-        # SEO 메트릭
-        advanced['seo_metrics'] = {
-            'title_length': len(soup.find('title').get_text() if soup.find('title') else ''),
-            'meta_description_length': len(soup.find('meta', attrs={'name': 'description'}).get('content', '') if soup.find('meta', attrs={'name': 'description'}) else ''),
-            'h1_count': len(soup.find_all('h1')),
-            'h2_count': len(soup.find_all('h2')),
-            'image_count': len(soup.find_all('img')),
-            'image_with_alt': len([img for img in soup.find_all('img') if img.get('alt')]),
-            'internal_links': len([link for link in soup.find_all('a', href=True) if urlparse(link['href']).netloc == urlparse(self.url).netloc]),
-            'external_links': len([link for link in soup.find_all('a', href=True) if urlparse(link['href']).netloc != urlparse(self.url).netloc])
-        }
-        
-        # 접근성
-        advanced['accessibility'] = {
-            'images_without_alt': len([img for img in soup.find_all('img') if not img.get('alt')]),
-            'forms_without_labels': len([form for form in soup.find_all('form') if not form.find_all('label')]),
-            'tables_without_headers': len([table for table in soup.find_all('table') if not table.find_all('th')])
-        }
-        
-        # 보안
-        advanced['security'] = {
-            'has_https': self.url.startswith('https'),
-            'has_csp': bool(soup.find('meta', attrs={'http-equiv': 'Content-Security-Policy'})),
-            'has_hsts': bool(soup.find('meta', attrs={'http-equiv': 'Strict-Transport-Security'}))
-        }
-        
-        return advanced
-    
-    def calculate_performance_metrics(self, soup, response):
-        """성능 메트릭 계산"""
-        return {
-            'page_size': len(response.content),
-            'html_size': len(response.text),
-            'css_size': sum(len(style.get_text()) for style in soup.find_all('style')),
-            'js_size': sum(len(script.get_text()) for script in soup.find_all('script')),
-            'image_count': len(soup.find_all('img')),
-            'script_count': len(soup.find_all('script')),
-            'style_count': len(soup.find_all('style')),
-            'link_count': len(soup.find_all('a')),
-            'form_count': len(soup.find_all('form'))
-        }
-    
     def stop(self):
         """크롤링 중지"""
         self.is_running = False
@@ -0,0 +1,417 @@
+import json
+import time
+import zlib
+import socket
+import logging
+import argparse
+import threading
+import socketserver
+from collections import deque
+from urllib.parse import urlparse
+from advanced_crawler import AdvancedWebCrawler
+
+
+logger = logging.getLogger(__name__)
+
+
+def partition_of(url, num_partitions):
+    """URL 호스트의 프론티어 파티션 번호"""
+    return zlib.crc32(urlparse(url).netloc.encode('utf-8')) % num_partitions
+
+
+class CrawlCoordinator:
+    """
+    여러 노드가 함께 쓰는 크롤링 코디네이터
+
+    프론티어를 호스트 해시로 나눈 파티션으로 관리하고, 파티션은 살아 있는 노드에게 나누어
+    맡긴다 (한 호스트는 한 노드만 가져오므로 노드가 늘어도 호스트별 지연이 지켜진다).
+    노드는 URL 묶음을 lease 로 받아 가고, 처리한 URL과 발견한 링크를 report 로 한꺼번에 보낸다.
+    lease_timeout 동안 소식이 없는 노드는 죽은 것으로 보고 그 노드의 lease 를 다른 노드에게
+    다시 나누어 준다. 파티션의 주인이 바뀌어도 이전 주인이 빌려 간 URL이 남아 있는 동안에는
+    새 주인에게 빌려주지 않으므로 한 호스트를 두 노드가 동시에 가져오지 않는다.
+    """
+
+    def __init__(self, max_pages=100, num_partitions=64, lease_timeout=60, batch_size=50):
+        self.max_pages = max_pages
+        self.num_partitions = num_partitions
+        self.lease_timeout = lease_timeout
+        self.batch_size = batch_size
+
+        self._lock = threading.Lock()
+        self._partitions = [deque() for _ in range(num_partitions)]
+        self._seen = set()
+        self._leased = {}            # URL -> (노드, depth)
+        self._nodes = {}             # 노드 -> 마지막 연락 시각
+        self._owners = {}            # 파티션 -> 노드
+        self._holders = {}           # 파티션 -> [lease 를 가진 노드, 빌려 간 URL 수]
+        self._revoked = set()        # lease 를 회수한 노드 (다시 연락하면 남은 작업을 버리게 함)
+        self._pending = 0
+        self.stats = {
+            'pages': 0,
+            'leased': 0,
+            'completed': 0,
+            'links_received': 0,
+            'reassigned': 0,
+            'dead_nodes': 0
+        }
+
+    def add_urls(self, items):
+        """(url, depth) 목록을 프론티어에 추가 (처음 보는 URL만)"""
+        added = 0
+        with self._lock:
+            for url, depth in items:
+                if url in self._seen:
+                    continue
+                self._seen.add(url)
+                self._partitions[partition_of(url, self.num_partitions)].append((url, depth))
+                added += 1
+            self._pending += added
+        return added
+
+    def _rebalance(self):
+        """
+        살아 있는 노드에게 파티션을 고르게 나눔
+
+        이전 주인의 lease 는 그대로 두고, lease 에서 그 파티션의 URL이 모두 완료되거나
+        회수될 때까지 새 주인에게 빌려주지 않는다.
+        """
+        nodes = sorted(self._nodes)
+        self._owners = {
+            p: nodes[p % len(nodes)] for p in range(self.num_partitions)
+        } if nodes else {}
+
+    def _touch(self, node):
+        """노드의 연락 시각 기록 (lease 를 회수한 노드가 다시 연락했으면 True)"""
+        if node not in self._nodes:
+            self._nodes[node] = time.monotonic()
+            self._rebalance()
+            logger.info(f"노드 등록: {node} (노드 {len(self._nodes)}개)")
+        else:
+            self._nodes[node] = time.monotonic()
+        if node in self._revoked:
+            self._revoked.discard(node)
+            return True
+        return False
+
+    def _release(self, url):
+        """lease 하나를 풀고 (노드, depth) 반환"""
+        node, depth = self._leased.pop(url)
+        p = partition_of(url, self.num_partitions)
+        holder = self._holders[p]
+        holder[1] -= 1
+        if holder[1] == 0:
+            del self._holders[p]
+        return node, depth
+
+    def _budget_exhausted(self):
+        return self.stats['pages'] >= self.max_pages
+
+    def _is_done(self):
+        if self._budget_exhausted():
+            return True
+        return self._pending == 0 and not self._leased
+
+    def _status(self):
+        return {'done': self._is_done(), 'budget_exhausted': self._budget_exhausted()}
+
+    def lease(self, node, limit=None):
+        """노드가 맡은 파티션에서 URL 묶음을 빌려줌"""
+        limit = limit or self.batch_size
+        with self._lock:
+            revoked = self._touch(node)
+            items = []
+            if not self._budget_exhausted():
+                for p, owner in self._owners.items():
+                    if owner != node:
+                        continue
+                    holder = self._holders.get(p)
+                    if holder is not None and holder[0] != node:
+                        continue   # 이전 주인의 lease 가 끝나기를 기다림
+                    partition = self._partitions[p]
+                    taken = 0
+                    while partition and len(items) < limit:
+                        url, depth = partition.popleft()
+                        self._leased[url] = (node, depth)
+                        items.append((url, depth))
+                        taken += 1
+                    if taken:
+                        self._holders.setdefault(p, [node, 0])[1] += taken
+                    if len(items) >= limit:
+                        break
+            self._pending -= len(items)
+            self.stats['leased'] += len(items)
+            return dict(self._status(), items=items, revoked=revoked)
+
+    def report(self, node, completed=(), links=(), pages=0):
+        """처리한 URL, 새로 크롤링한 페이지 수, 발견한 링크 반영"""
+        with self._lock:
+            revoked = self._touch(node)
+            for url in completed:
+                # 회수되어 다른 노드가 빌려 간 URL의 완료는 그 노드만 보고할 수 있음
+                lease = self._leased.get(url)
+                if lease is not None and lease[0] == node:
+                    self._release(url)
+                    self.stats['completed'] += 1
+            self.stats['pages'] += pages
+            self.stats['links_received'] += len(links)
+        self.add_urls((url, depth) for url, depth in links)
+        with self._lock:
+            return dict(self._status(), revoked=revoked)
+
+    def reap(self):
+        """연락이 끊긴 노드를 지우고, 그 노드가 빌려 간 URL을 프론티어로 되돌림"""
+        now = time.monotonic()
+        with self._lock:
+            dead = [node for node, seen in self._nodes.items() if now - seen > self.lease_timeout]
+            if not dead:
+                return 0
+            for node in dead:
+                del self._nodes[node]
+                self._revoked.add(node)
+                self.stats['dead_nodes'] += 1
+                logger.warning(f"노드 응답 없음, lease 회수: {node}")
+
+            returned = [(url, depth) for url, (owner, depth) in self._leased.items() if owner in dead]
+            for url, depth in returned:
+                self._release(url)
+                self._partitions[partition_of(url, self.num_partitions)].appendleft((url, depth))
+            self._pending += len(returned)
+            self.stats['reassigned'] += len(returned)
+            self._rebalance()
+            return len(returned)
+
+    def handle(self, request):
+        """JSON 요청 하나 처리"""
+        op = request.get('op')
+        node = request.get('node', '')
+        if op == 'lease':
+            return self.lease(node, request.get('max'))
+        if op == 'report':
+            return self.report(
+                node,
+                completed=request.get('completed', []),
+                links=request.get('links', []),
+                pages=request.get('pages', 0)
+            )
+        if op == 'stats':
+            return self.get_statistics()
+        return {'error': f'알 수 없는 요청: {op}'}
+
+    def get_statistics(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['pending'] = self._pending
+            stats['in_lease'] = len(self._leased)
+            stats['nodes'] = sorted(self._nodes)
+            stats['done'] = self._is_done()
+            return stats
+
+
+class _CoordinatorHandler(socketserver.StreamRequestHandler):
+    """한 줄에 JSON 요청 하나, 한 줄에 JSON 응답 하나"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = self.server.coordinator.handle(json.loads(line))
+            except ValueError as e:
+                response = {'error': str(e)}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+
+
+class CoordinatorServer(socketserver.ThreadingTCPServer):
+    """CrawlCoordinator 를 TCP 로 제공 (노드 연결마다 스레드 하나)"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, coordinator, host='127.0.0.1', port=8900, reap_interval=5):
+        super().__init__((host, port), _CoordinatorHandler)
+        self.coordinator = coordinator
+        self.reap_interval = reap_interval
+        self._reaper = threading.Thread(target=self._reap_loop, daemon=True)
+        self._reaper.start()
+
+    def _reap_loop(self):
+        while True:
+            time.sleep(self.reap_interval)
+            self.coordinator.reap()
+
+
+class CoordinatorClient:
+    """코디네이터 TCP 클라이언트"""
+
+    def __init__(self, host='127.0.0.1', port=8900, timeout=30):
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._file = self._sock.makefile('rwb')
+        self._lock = threading.Lock()
+
+    def call(self, op, **params):
+        params['op'] = op
+        with self._lock:
+            self._file.write(json.dumps(params, ensure_ascii=False).encode('utf-8') + b'\n')
+            self._file.flush()
+            line = self._file.readline()
+        if not line:
+            raise ConnectionError('코디네이터 연결이 끊김')
+        return json.loads(line)
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+
+class CoordinatedCrawler(AdvancedWebCrawler):
+    """
+    코디네이터에 붙어 크롤링하는 노드
+
+    AdvancedWebCrawler 의 워커 루프를 그대로 쓰고, URL은 코디네이터에서 lease 로 받아 오며
+    처리한 URL과 발견한 링크는 모아 두었다가 report 로 한꺼번에 보낸다.
+    """
+
+    def __init__(self, config, coordinator_address, node_id=None):
+        super().__init__(config)
+        self.node_id = node_id or f"{socket.gethostname()}-{id(self):x}"
+        self.coordinator_address = coordinator_address
+        self.batch_size = self.config.get('lease_batch_size', 50)
+        self.report_interval = self.config.get('report_interval', 1.0)
+        self._completed = []
+        self._links = []
+        self._new_pages = 0
+        self._budget_done = False
+        self._report_lock = threading.Lock()
+        self.url_queue.on_complete = self._on_complete
+
+    def _on_complete(self, url):
+        with self._report_lock:
+            self._completed.append(url)
+
+    def _put_links(self, items):
+        with self._report_lock:
+            self._links.extend((url, depth) for url, depth, _ in items)
+
+    def _record_page(self, url, page_data, depth):
+        super()._record_page(url, page_data, depth)
+        with self._report_lock:
+            self._new_pages += 1
+
+    def _page_budget_exhausted(self):
+        return self._budget_done
+
+    def _report(self, client):
+        with self._report_lock:
+            completed, self._completed = self._completed, []
+            links, self._links = self._links, []
+            pages, self._new_pages = self._new_pages, 0
+        response = client.call('report', node=self.node_id, completed=completed, links=links, pages=pages)
+        self._budget_done = response['budget_exhausted']
+        self._drop_revoked(response)
+        return response
+
+    def _drop_revoked(self, response):
+        """코디네이터가 lease 를 회수했으면 아직 가져오지 않은 URL을 버림 (다른 노드가 맡음)"""
+        if response.get('revoked'):
+            discarded = self.url_queue.discard_pending()
+            self.logger.warning(f"코디네이터가 lease 를 회수함, 대기 중인 URL {discarded}개 버림")
+
+    def crawl_node(self):
+        """코디네이터가 끝났다고 할 때까지 lease 를 받아 크롤링"""
+        host, port = self.coordinator_address
+        client = CoordinatorClient(host, port)
+        self.logger.info(f"노드 {self.node_id} 시작 (코디네이터 {host}:{port})")
+
+        self._start_parse_pool()
+        threads = []
+        for _ in range(self.config['max_workers']):
+            t = threading.Thread(target=self.worker, daemon=True)
+            t.start()
+            threads.append(t)
+
+        try:
+            while True:
+                response = self._report(client)
+                if self.url_queue.qsize() < self.batch_size // 2:
+                    response = client.call('lease', node=self.node_id, max=self.batch_size)
+                    self._drop_revoked(response)
+                    for url, depth in response['items']:
+                        self.url_queue.put((url, depth))
+                    if response['done'] and self.url_queue.is_idle():
+                        self._report(client)
+                        break
+                time.sleep(self.report_interval)
+        except OSError as e:
+            self.logger.warning(f"코디네이터 연결 종료: {e}")
+        finally:
+            for _ in threads:
+                self.url_queue.put(None)
+            for t in threads:
+                t.join()
+            self._stop_parse_pool()
+            client.close()
+
+        self.logger.info(f"노드 {self.node_id} 완료. {len(self.crawled_data)}개 페이지 크롤링됨")
+        self.save_data()
+        self._save_cache()
+        self.robots_cache.save()
+
+
+def serve(start_urls, host='127.0.0.1', port=8900, **options):
+    """시작 URL로 코디네이터를 띄우고 크롤링이 끝날 때까지 실행 -> 통계"""
+    coordinator = CrawlCoordinator(**options)
+    coordinator.add_urls((url, 0) for url in start_urls)
+    server = CoordinatorServer(coordinator, host, port)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    logger.info(f"코디네이터 시작: {host}:{port}")
+    try:
+        while not coordinator.get_statistics()['done']:
+            time.sleep(1)
+        # 노드가 done 응답을 받아 갈 시간
+        time.sleep(2)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return coordinator.get_statistics()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='분산 크롤링 코디네이터 / 노드')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = sub.add_parser('serve', help='코디네이터 실행')
+    serve_parser.add_argument('start_urls', nargs='+')
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8900)
+    serve_parser.add_argument('--max-pages', type=int, default=100)
+    serve_parser.add_argument('--lease-timeout', type=float, default=60)
+
+    node_parser = sub.add_parser('node', help='크롤링 노드 실행')
+    node_parser.add_argument('--host', default='127.0.0.1')
+    node_parser.add_argument('--port', type=int, default=8900)
+    node_parser.add_argument('--node-id')
+    node_parser.add_argument('--output-file', default='node_crawled_data.json')
+    node_parser.add_argument('--max-depth', type=int, default=3)
+    node_parser.add_argument('--max-workers', type=int, default=3)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.command == 'serve':
+        stats = serve(args.start_urls, args.host, args.port,
+                      max_pages=args.max_pages, lease_timeout=args.lease_timeout)
+        print(f"크롤링 통계: {stats}")
+    else:
+        config = {
+            'delay_range': (1, 3),
+            'max_depth': args.max_depth,
+            'max_workers': args.max_workers,
+            'timeout': 10,
+            'respect_robots': True,
+            'output_file': args.output_file,
+            'cache_file': f"{args.output_file}.cache.json"
+        }
+        CoordinatedCrawler(config, (args.host, args.port), args.node_id).crawl_node()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,10 +16,10 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
 from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer, QPropertyAnimation, QEasingCurve
 from PyQt5.QtGui import QFont, QIcon, QPixmap, QPalette, QColor, QLinearGradient
 import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from fake_useragent import UserAgent
 import time
+from html_parser import make_soup
 
 class CuteCrawlerThread(QThread):
     """귀여운 크롤링 작업을 별도 스레드에서 실행"""
@@ -70,8 +70,8 @@ class CuteCrawlerThread(QThread):
         response = requests.get(self.url, headers=headers, timeout=10)
         response.raise_for_status()
         
-        # BeautifulSoup으로 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # BeautifulSoup으로 파싱 (설치된 것 중 가장 빠른 파서)
+        soup = make_soup(response.text, self.options.get('html_parser'))
         
         # 귀여운 데이터 구조
         data = {
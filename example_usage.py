@@ -62,8 +62,8 @@ def custom_crawler_example():
             page_data = super().parse_page(url, html_content)
             
             # 추가 정보 추출
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            from html_parser import make_soup
+            soup = make_soup(html_content, self.parser)
             
             # 특정 클래스나 ID를 가진 요소들 추출
             page_data['custom_data'] = {
@@ -0,0 +1,289 @@
+import heapq
+import sqlite3
+import threading
+from collections import deque
+
+
+class URLFrontier:
+    """
+    크롤링할 URL 큐 (프론티어)
+
+    deque 로 O(1) 에 꺼내고, URL은 큐에 넣는 시점에 seen 집합에 표시한다.
+    같은 URL이 여러 페이지에서 링크되어도 큐에는 한 번만 들어간다.
+    seen 에 블룸 필터 / mmap 지문 인덱스(seen_set.create_seen_set)를 넘기면 URL 문자열을
+    따로 들고 있지 않는다.
+    """
+
+    def __init__(self, seen=None):
+        self._queue = deque()
+        self.seen = seen if seen is not None else set()
+        self.stats = {
+            'enqueued': 0,
+            'dequeued': 0,
+            'duplicates_suppressed': 0
+        }
+
+    def push(self, url, depth, priority=0):
+        """URL 추가 (이미 본 URL이면 False, priority 는 무시하고 들어온 순서대로)"""
+        if url in self.seen:
+            self.stats['duplicates_suppressed'] += 1
+            return False
+        self.seen.add(url)
+        self._queue.append((url, depth))
+        self.stats['enqueued'] += 1
+        return True
+
+    def is_duplicate(self, url):
+        """이미 큐에 넣은 적 있는 URL인지 (있으면 중복 억제 횟수에 포함)"""
+        if url in self.seen:
+            self.stats['duplicates_suppressed'] += 1
+            return True
+        return False
+
+    def pop(self):
+        """다음 (url, depth) 꺼내기 (비어 있으면 None)"""
+        if not self._queue:
+            return None
+        self.stats['dequeued'] += 1
+        return self._queue.popleft()
+
+    def mark_done(self, url):
+        """처리 완료 표시 (메모리 프론티어는 기록할 것이 없음)"""
+
+    def flush(self):
+        """디스크 프론티어와 같은 인터페이스용 (할 일 없음)"""
+
+    def __contains__(self, url):
+        return url in self.seen
+
+    def __len__(self):
+        return len(self._queue)
+
+    def get_statistics(self):
+        stats = dict(self.stats)
+        stats['queue_size'] = len(self._queue)
+        return stats
+
+
+class PriorityFrontier(URLFrontier):
+    """
+    우선순위 프론티어 (best-first)
+
+    점수가 높은 URL부터 꺼내고, 점수가 같으면 먼저 들어온 URL부터 꺼낸다.
+    아직 꺼내지 않은 URL의 점수가 올라가면(in-link 증가 등) raise_priority 로 반영한다.
+    """
+
+    def __init__(self, seen=None):
+        super().__init__(seen)
+        self._queue = []
+        self._pending = {}       # 대기 중인 URL -> (현재 점수, depth)
+        self._seq = 0
+
+    def _heap_push(self, url, depth, priority):
+        self._seq += 1
+        self._pending[url] = (priority, depth)
+        heapq.heappush(self._queue, (-priority, self._seq, url))
+
+    def push(self, url, depth, priority=0):
+        """URL 추가 (이미 본 URL이면 False)"""
+        if url in self.seen:
+            self.stats['duplicates_suppressed'] += 1
+            return False
+        self.seen.add(url)
+        self._heap_push(url, depth, priority)
+        self.stats['enqueued'] += 1
+        return True
+
+    def is_pending(self, url):
+        """아직 꺼내지 않은 URL인지"""
+        return url in self._pending
+
+    def raise_priority(self, url, priority):
+        """대기 중인 URL의 점수를 올림 (이전 항목은 꺼낼 때 건너뜀)"""
+        pending = self._pending.get(url)
+        if pending is None or priority <= pending[0]:
+            return False
+        self._heap_push(url, pending[1], priority)
+        return True
+
+    def pop(self):
+        """점수가 가장 높은 (url, depth) 꺼내기 (비어 있으면 None)"""
+        while self._queue:
+            neg_priority, _, url = heapq.heappop(self._queue)
+            pending = self._pending.get(url)
+            if pending is None or pending[0] != -neg_priority:
+                continue  # raise_priority 로 대체된 항목
+            del self._pending[url]
+            self.stats['dequeued'] += 1
+            return url, pending[1]
+        return None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def get_statistics(self):
+        stats = dict(self.stats)
+        stats['queue_size'] = len(self._pending)
+        return stats
+
+
+class SQLiteFrontier:
+    """
+    디스크(SQLite) 기반 프론티어
+
+    URL마다 상태(대기 / 처리 중 / 완료)를 파일에 기록하므로 프로세스가 죽어도 이어서
+    크롤링할 수 있고, 큐 크기가 메모리에 묶이지 않는다. 메모리에는 앞부분 몇 개만
+    buffer 로 올려 두고 모자라면 한 번에 여러 개씩 꺼낸다(lease).
+    UNIQUE 인덱스가 seen 집합 역할을 하므로 같은 URL은 한 번만 들어간다.
+    대기 중인 URL은 priority 가 높은 것부터, 같으면 먼저 들어온 것부터 꺼낸다.
+    """
+
+    PENDING, LEASED, DONE = 0, 1, 2
+
+    def __init__(self, path='frontier.db', buffer_size=1000, commit_interval=1000):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.commit_interval = commit_interval
+        self._buffer = deque()
+        self._uncommitted = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS urls ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT UNIQUE NOT NULL, '
+            'depth INTEGER NOT NULL, state INTEGER NOT NULL DEFAULT 0, '
+            'priority REAL NOT NULL DEFAULT 0)'
+        )
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(urls)')]
+        if 'priority' not in columns:
+            # priority 열이 없던 이전 파일
+            self._conn.execute('ALTER TABLE urls ADD COLUMN priority REAL NOT NULL DEFAULT 0')
+        self._conn.execute('DROP INDEX IF EXISTS idx_urls_state')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_urls_pending ON urls (state, priority DESC, id)')
+        self.stats = {
+            'enqueued': 0,
+            'dequeued': 0,
+            'duplicates_suppressed': 0,
+            'resumed': self.reset_leased()
+        }
+
+    def _maybe_commit(self, force=False):
+        if force or self._uncommitted >= self.commit_interval:
+            self._conn.commit()
+            self._uncommitted = 0
+
+    def reset_leased(self):
+        """이전 실행에서 처리 중이던 URL을 다시 대기 상태로 (재개용)"""
+        with self._lock:
+            cursor = self._conn.execute(
+                'UPDATE urls SET state = ? WHERE state = ?', (self.PENDING, self.LEASED)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def push(self, url, depth, leased=False, priority=0):
+        """URL 추가 (이미 본 URL이면 False). leased=True 면 처리 중 상태로 바로 넣음"""
+        with self._lock:
+            cursor = self._conn.execute(
+                'INSERT OR IGNORE INTO urls (url, depth, state, priority) VALUES (?, ?, ?, ?)',
+                (url, depth, self.LEASED if leased else self.PENDING, priority)
+            )
+            if cursor.rowcount == 0:
+                self.stats['duplicates_suppressed'] += 1
+                return False
+            self.stats['enqueued'] += 1
+            self._uncommitted += 1
+            self._maybe_commit()
+            return True
+
+    def is_duplicate(self, url):
+        """이미 프론티어에 들어간 적 있는 URL인지"""
+        with self._lock:
+            row = self._conn.execute('SELECT 1 FROM urls WHERE url = ?', (url,)).fetchone()
+            if row:
+                self.stats['duplicates_suppressed'] += 1
+                return True
+            return False
+
+    def is_pending(self, url):
+        """아직 대기 중인 URL인지"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT 1 FROM urls WHERE url = ? AND state = ?', (url, self.PENDING)
+            ).fetchone()
+            return row is not None
+
+    def raise_priority(self, url, priority):
+        """아직 대기 중인 URL의 점수를 올림"""
+        with self._lock:
+            cursor = self._conn.execute(
+                'UPDATE urls SET priority = ? WHERE url = ? AND state = ? AND priority < ?',
+                (priority, url, self.PENDING, priority)
+            )
+            self._uncommitted += cursor.rowcount
+            self._maybe_commit()
+            return cursor.rowcount > 0
+
+    def lease(self, limit, with_priority=False):
+        """
+        대기 중인 URL을 점수순으로 최대 limit 개 꺼내 처리 중으로 표시
+
+        -> [(url, depth)] (with_priority=True 면 [(url, depth, priority)])
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT id, url, depth, priority FROM urls WHERE state = ? '
+                'ORDER BY priority DESC, id LIMIT ?',
+                (self.PENDING, limit)
+            ).fetchall()
+            if rows:
+                self._conn.executemany(
+                    'UPDATE urls SET state = ? WHERE id = ?',
+                    [(self.LEASED, row[0]) for row in rows]
+                )
+                self._maybe_commit(force=True)
+            self.stats['dequeued'] += len(rows)
+            if with_priority:
+                return [(url, depth, priority) for _, url, depth, priority in rows]
+            return [(url, depth) for _, url, depth, _ in rows]
+
+    def pop(self):
+        """다음 (url, depth) 꺼내기 (비어 있으면 None)"""
+        if not self._buffer:
+            self._buffer.extend(self.lease(self.buffer_size))
+        if not self._buffer:
+            return None
+        return self._buffer.popleft()
+
+    def mark_done(self, url):
+        """처리가 끝난 URL 표시 (재개 시 다시 꺼내지 않음)"""
+        with self._lock:
+            self._conn.execute('UPDATE urls SET state = ? WHERE url = ?', (self.DONE, url))
+            self._uncommitted += 1
+            self._maybe_commit()
+
+    def flush(self):
+        """아직 커밋하지 않은 변경 사항 저장"""
+        with self._lock:
+            self._maybe_commit(force=True)
+
+    def pending_count(self):
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM urls WHERE state = ?', (self.PENDING,)
+            ).fetchone()[0]
+
+    def __len__(self):
+        return len(self._buffer) + self.pending_count()
+
+    def get_statistics(self):
+        stats = dict(self.stats)
+        stats['queue_size'] = len(self)
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._maybe_commit(force=True)
+            self._conn.close()
@@ -14,10 +14,10 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
 from PyQt5.QtCore import QThread, pyqtSignal, Qt
 from PyQt5.QtGui import QFont, QIcon
 import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from fake_useragent import UserAgent
 import time
+from html_parser import make_soup
 
 class CrawlerThread(QThread):
     """크롤링 작업을 별도 스레드에서 실행"""
@@ -25,10 +25,11 @@ class CrawlerThread(QThread):
     finished_signal = pyqtSignal(dict)
     error_signal = pyqtSignal(str)
     
-    def __init__(self, url, crawler_type="basic"):
+    def __init__(self, url, crawler_type="basic", options=None):
         super().__init__()
         self.url = url
         self.crawler_type = crawler_type
+        self.options = options or {}
         self.is_running = True
         
     def run(self):
@@ -67,8 +68,8 @@ class CrawlerThread(QThread):
         
         self.progress_signal.emit("페이지 파싱 중...")
         
-        # BeautifulSoup으로 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # BeautifulSoup으로 파싱 (options['html_parser'], 없으면 설치된 것 중 가장 빠른 파서)
+        soup = make_soup(response.text, self.options.get('html_parser'))
         
         # 기본 정보 추출
         data = {
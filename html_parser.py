@@ -0,0 +1,40 @@
+import logging
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+
+logger = logging.getLogger(__name__)
+
+# BeautifulSoup 파서 백엔드 (빠른 순서)
+PARSER_BACKENDS = ('lxml', 'html.parser', 'html5lib')
+
+
+def available_parsers():
+    """설치되어 있는 파서 백엔드 목록 (빠른 순서)"""
+    return [name for name in PARSER_BACKENDS if builder_registry.lookup(name) is not None]
+
+
+def default_parser():
+    """설치된 파서 중 가장 빠른 것 (html.parser 는 항상 있음)"""
+    parsers = available_parsers()
+    return parsers[0] if parsers else 'html.parser'
+
+
+def resolve_parser(parser=None):
+    """
+    사용할 파서 이름
+
+    None 이나 'auto' 면 가장 빠른 파서, 설치되지 않은 파서를 지정하면 경고를 남기고 가장 빠른 파서를 쓴다.
+    """
+    if parser in (None, 'auto'):
+        return default_parser()
+    if builder_registry.lookup(parser) is None:
+        fallback = default_parser()
+        logger.warning(f"파서 '{parser}' 를 사용할 수 없어 '{fallback}' 사용")
+        return fallback
+    return parser
+
+
+def make_soup(markup, parser=None):
+    """지정한 (또는 가장 빠른) 파서로 BeautifulSoup 생성"""
+    return BeautifulSoup(markup, resolve_parser(parser))
@@ -0,0 +1,171 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+DEFAULT_MAX_BODY_BYTES = 5 * 1024 * 1024
+
+
+def is_allowed_content_type(response, allowed_types=HTML_CONTENT_TYPES):
+    """Content-Type 헤더가 허용 목록에 있는지 (헤더가 없으면 허용)"""
+    content_type = response.headers.get('Content-Type', '')
+    if not content_type:
+        return True
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    return media_type in allowed_types
+
+
+def read_limited(response, max_bytes=DEFAULT_MAX_BODY_BYTES, allowed_types=HTML_CONTENT_TYPES):
+    """
+    stream=True 로 받은 응답의 본문을 max_bytes 까지만 읽기
+
+    본문을 읽기 전에 Content-Type 을 확인하고, 허용되지 않으면 연결을 닫고 None 을 반환한다.
+    읽은 본문은 response.content / response.text 로 그대로 쓸 수 있게 응답에 넣고,
+    잘렸는지 여부는 response.truncated 에 기록한다.
+    """
+    if response.status_code == 304:
+        response.truncated = False
+        return response
+
+    if allowed_types and not is_allowed_content_type(response, allowed_types):
+        response.close()
+        return None
+
+    chunks = []
+    size = 0
+    truncated = False
+
+    # Content-Length 가 상한보다 크면 상한까지만 읽는다
+    content_length = response.headers.get('Content-Length', '')
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        truncated = True
+
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        remaining = max_bytes - size
+        if len(chunk) > remaining:
+            chunks.append(chunk[:remaining])
+            truncated = True
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+
+    response.close()
+    response._content = b''.join(chunks)
+    response._content_consumed = True
+    response.truncated = truncated
+    return response
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """
+    연결 재사용 통계를 남기는 HTTPAdapter
+
+    urllib3 커넥션 풀은 요청 수(num_requests)와 새로 연 연결 수(num_connections)를
+    세고 있으므로, 풀이 교체(evict)될 때 그 값을 모아 둔다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.disposed_requests = 0
+        self.disposed_connections = 0
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        pools = self.poolmanager.pools
+        previous_dispose = pools.dispose_func
+
+        def dispose(pool):
+            self.disposed_requests += pool.num_requests
+            self.disposed_connections += pool.num_connections
+            if previous_dispose:
+                previous_dispose(pool)
+            else:
+                pool.close()
+
+        pools.dispose_func = dispose
+
+    def get_connection_counts(self):
+        """(요청 수, 새 연결 수)"""
+        requests_count = self.disposed_requests
+        connections_count = self.disposed_connections
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                requests_count += pool.num_requests
+                connections_count += pool.num_connections
+        return requests_count, connections_count
+
+
+class PooledHTTPClient:
+    """
+    스레드 안전한 HTTP 클라이언트
+
+    워커 스레드마다 자신의 requests.Session (과 커넥션 풀)을 갖는다.
+    세션 헤더는 생성 시 한 번만 설정하고, User-Agent 처럼 요청마다 바뀌는 값은
+    요청 헤더로 넘기므로 스레드 간에 공유 상태를 바꾸지 않는다.
+    keep-alive 연결이 재사용되면 TLS 핸드셰이크도 다시 하지 않는다.
+    """
+
+    def __init__(self, base_headers=None, pool_connections=100, pool_maxsize=4):
+        self.base_headers = dict(base_headers or {})
+        self.pool_connections = pool_connections  # 워커별로 유지할 호스트 풀 수
+        self.pool_maxsize = pool_maxsize          # 호스트별 유지할 연결 수
+        self._local = threading.local()
+        self._adapters = []
+        self._lock = threading.Lock()
+
+    def _create_session(self):
+        session = requests.Session()
+        session.headers.update(self.base_headers)
+
+        adapter = CountingHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        with self._lock:
+            self._adapters.append(adapter)
+        return session
+
+    @property
+    def session(self):
+        """현재 스레드 전용 세션"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._create_session()
+            self._local.session = session
+        return session
+
+    def get(self, url, headers=None, **kwargs):
+        """GET 요청 (headers 는 이 요청에만 적용)"""
+        return self.session.get(url, headers=headers, **kwargs)
+
+    def get_statistics(self):
+        """연결 재사용 통계"""
+        total_requests = 0
+        new_connections = 0
+        with self._lock:
+            adapters = list(self._adapters)
+        for adapter in adapters:
+            requests_count, connections_count = adapter.get_connection_counts()
+            total_requests += requests_count
+            new_connections += connections_count
+
+        reused = max(total_requests - new_connections, 0)
+        return {
+            'sessions': len(adapters),
+            'requests': total_requests,
+            'new_connections': new_connections,
+            'reused_connections': reused,
+            'reuse_ratio': reused / total_requests if total_requests else 0
+        }
+
+    def close(self):
+        with self._lock:
+            adapters = list(self._adapters)
+        for adapter in adapters:
+            adapter.close()
@@ -0,0 +1,64 @@
+import time
+import threading
+
+
+class InstrumentedLock:
+    """
+    대기 시간을 재는 Lock
+
+    threading.Lock 과 같은 acquire / release / with 인터페이스이며, 다른 스레드가 잡고 있어서
+    기다린 횟수와 시간을 센다. threading.Condition 의 lock 으로도 쓸 수 있다.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def acquire(self, blocking=True, timeout=-1):
+        if self._lock.acquire(False):
+            with self._stats_lock:
+                self.acquisitions += 1
+            return True
+        if not blocking:
+            return False
+
+        started = time.perf_counter()
+        acquired = self._lock.acquire(True, timeout)
+        waited = time.perf_counter() - started
+        with self._stats_lock:
+            self.contended += 1
+            self.wait_time += waited
+            self.max_wait = max(self.max_wait, waited)
+            if acquired:
+                self.acquisitions += 1
+        return acquired
+
+    def release(self):
+        self._lock.release()
+
+    def locked(self):
+        return self._lock.locked()
+
+    def _is_owned(self):
+        # threading.Condition 이 쓰는 확인용 (기본 구현과 같이 잠겨 있는지만 봄, 통계에는 넣지 않음)
+        return self._lock.locked()
+
+    __enter__ = acquire
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def get_statistics(self):
+        with self._stats_lock:
+            return {
+                'acquisitions': self.acquisitions,
+                'contended': self.contended,
+                'contention_ratio': self.contended / self.acquisitions if self.acquisitions else 0.0,
+                'wait_time': round(self.wait_time, 4),
+                'max_wait': round(self.max_wait, 4)
+            }
@@ -0,0 +1,254 @@
+import re
+from urllib.parse import urljoin, urlparse
+from bs4.element import NavigableString, Tag
+
+
+_SENTENCE_END = re.compile(r'[.!?]+')
+_HEADER_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+
+class _Container:
+    """열려 있는 form / table (안에서 찾은 input, label, th 를 모음)"""
+
+    __slots__ = ('record', 'counted', 'found')
+
+    def __init__(self, record=None, counted=False):
+        self.record = record        # basic_info['forms'] 항목 (form 만)
+        self.counted = counted      # 본문 영역(script/style/nav/footer 밖)에 있는지
+        self.found = 0              # 본문 영역의 label / th 수
+
+
+class PageAnalyzer:
+    """
+    상용 크롤러의 페이지 분석 (기본 정보, 고급 정보, 성능 메트릭)
+
+    트리를 한 번만 순회하면서 모든 목록과 카운터를 모은다. 결과 형식은 기존
+    extract_basic_info / extract_advanced_info / calculate_performance_metrics 와 같다.
+    본문 텍스트와 고급 정보의 카운트는 기존처럼 script, style, nav, footer 안의 요소를 빼고 센다
+    (soup 를 고치지 않으므로 같은 soup 를 다시 써도 된다).
+    """
+
+    TEXT_EXCLUDED_TAGS = frozenset(['script', 'style', 'nav', 'footer'])
+
+    def __init__(self, url, text_limit=2000):
+        self.url = url
+        self.text_limit = text_limit
+        self.netloc = urlparse(url).netloc
+
+    def analyze(self, soup, response=None):
+        """
+        페이지 분석 -> {'basic_info', 'extracted_data', 'performance_metrics'}
+
+        response 가 있으면 performance_metrics 의 page_size / html_size 를 채운다.
+        """
+        text_types = soup.interesting_string_types or Tag.MAIN_CONTENT_STRING_TYPES
+        if isinstance(text_types, type):
+            text_types = {text_types}
+
+        basic = {
+            'title': '',
+            'description': '',
+            'keywords': [],
+            'images': [],
+            'links': [],
+            'text_content': '',
+            'headers': {tag: [] for tag in _HEADER_TAGS},
+            'meta_tags': {},
+            'forms': [],
+            'scripts': [],
+            'styles': []
+        }
+        counts = dict.fromkeys(
+            ('p', 'h1', 'h2', 'img', 'img_alt', 'a', 'internal', 'external', 'form', 'table',
+             'form_without_label', 'table_without_th'), 0)
+        title = None            # 첫 title (기본 정보)
+        body_title = None       # 본문 영역의 첫 title (SEO)
+        meta_description = None
+        has_csp = has_hsts = False
+        strings = []
+        open_forms = []
+        open_tables = []
+
+        # (노드, 제외 영역 안인지) 또는 (None, 닫을 form/table) 스택으로 문서 순서대로 순회
+        stack = [(child, False) for child in reversed(soup.contents)]
+        while stack:
+            node, state = stack.pop()
+            if node is None:
+                # form / table 닫힘
+                kind, container = state
+                if kind == 'form':
+                    open_forms.remove(container)
+                    if container.counted and not container.found:
+                        counts['form_without_label'] += 1
+                else:
+                    open_tables.remove(container)
+                    if container.counted and not container.found:
+                        counts['table_without_th'] += 1
+                continue
+
+            excluded = state
+            if isinstance(node, NavigableString):
+                if not excluded and type(node) in text_types:
+                    strings.append(node)
+                continue
+            if not isinstance(node, Tag):
+                continue
+
+            name = node.name
+            excluded = excluded or name in self.TEXT_EXCLUDED_TAGS
+            counted = not excluded
+
+            if name == 'title':
+                if title is None:
+                    title = node
+                if counted and body_title is None:
+                    body_title = node
+            elif name == 'meta':
+                meta_name = node.get('name', '')
+                content = node.get('content', '')
+                lowered = meta_name.lower()
+                if lowered == 'description':
+                    basic['description'] = content
+                elif lowered == 'keywords':
+                    basic['keywords'] = [kw.strip() for kw in content.split(',')]
+                else:
+                    basic['meta_tags'][lowered] = content
+                if counted:
+                    if meta_description is None and meta_name == 'description':
+                        meta_description = node
+                    http_equiv = node.get('http-equiv')
+                    if http_equiv == 'Content-Security-Policy':
+                        has_csp = True
+                    elif http_equiv == 'Strict-Transport-Security':
+                        has_hsts = True
+            elif name in basic['headers']:
+                basic['headers'][name].append(node.get_text(strip=True))
+                if counted and name in counts:
+                    counts[name] += 1
+            elif name == 'img':
+                src = node.get('src')
+                if src is not None:
+                    basic['images'].append({
+                        'src': urljoin(self.url, src),
+                        'alt': node.get('alt', ''),
+                        'width': node.get('width', ''),
+                        'height': node.get('height', '')
+                    })
+                if counted:
+                    counts['img'] += 1
+                    if node.get('alt'):
+                        counts['img_alt'] += 1
+            elif name == 'a':
+                href = node.get('href')
+                if href is not None:
+                    absolute_url = urljoin(self.url, href)
+                    basic['links'].append({
+                        'url': absolute_url,
+                        'text': node.get_text(strip=True),
+                        'title': node.get('title', ''),
+                        'is_internal': urlparse(absolute_url).netloc == self.netloc
+                    })
+                if counted:
+                    counts['a'] += 1
+                    if href is not None:
+                        # 기존 SEO 메트릭과 같이 href 그대로의 호스트로 구분
+                        if urlparse(href).netloc == self.netloc:
+                            counts['internal'] += 1
+                        else:
+                            counts['external'] += 1
+            elif name == 'p':
+                if counted:
+                    counts['p'] += 1
+            elif name == 'input':
+                for form in open_forms:
+                    form.record['inputs'].append({'name': node.get('name', ''), 'type': node.get('type', '')})
+            elif name == 'label':
+                if counted:
+                    for form in open_forms:
+                        form.found += 1
+            elif name == 'th':
+                if counted:
+                    for table in open_tables:
+                        table.found += 1
+            elif name == 'script':
+                basic['scripts'].append({
+                    'src': node.get('src', ''),
+                    'type': node.get('type', ''),
+                    'content_length': len(node.get_text())
+                })
+            elif name == 'style':
+                basic['styles'].append({'content_length': len(node.get_text())})
+            elif name == 'form':
+                record = {'action': node.get('action', ''), 'method': node.get('method', 'get'), 'inputs': []}
+                basic['forms'].append(record)
+                container = _Container(record, counted)
+                open_forms.append(container)
+                stack.append((None, ('form', container)))
+                if counted:
+                    counts['form'] += 1
+            elif name == 'table':
+                container = _Container(counted=counted)
+                open_tables.append(container)
+                stack.append((None, ('table', container)))
+                if counted:
+                    counts['table'] += 1
+
+            stack.extend((child, excluded) for child in reversed(node.contents))
+
+        if title is not None:
+            basic['title'] = title.get_text(strip=True)
+        text_content = ' '.join(s for s in (s.strip() for s in strings) if s)
+        if len(text_content) > self.text_limit:
+            text_content = text_content[:self.text_limit] + "..."
+        basic['text_content'] = text_content
+
+        raw_text = ''.join(strings)
+        word_count = len(raw_text.split())
+        sentence_count = len(_SENTENCE_END.findall(raw_text)) + 1
+        advanced = {
+            'content_analysis': {
+                'word_count': word_count,
+                'character_count': len(raw_text),
+                'paragraph_count': counts['p'],
+                'sentence_count': sentence_count,
+                'average_sentence_length': word_count / sentence_count
+            },
+            'seo_metrics': {
+                'title_length': len(body_title.get_text()) if body_title is not None else 0,
+                'meta_description_length': len(meta_description.get('content', '')) if meta_description is not None else 0,
+                'h1_count': counts['h1'],
+                'h2_count': counts['h2'],
+                'image_count': counts['img'],
+                'image_with_alt': counts['img_alt'],
+                'internal_links': counts['internal'],
+                'external_links': counts['external']
+            },
+            'accessibility': {
+                'images_without_alt': counts['img'] - counts['img_alt'],
+                'forms_without_labels': counts['form_without_label'],
+                'tables_without_headers': counts['table_without_th']
+            },
+            'security': {
+                'has_https': self.url.startswith('https'),
+                'has_csp': has_csp,
+                'has_hsts': has_hsts
+            }
+        }
+
+        performance = {
+            'page_size': len(response.content) if response is not None else 0,
+            'html_size': len(response.text) if response is not None else 0,
+            'css_size': sum(style['content_length'] for style in basic['styles']),
+            'js_size': sum(script['content_length'] for script in basic['scripts']),
+            'image_count': counts['img'],
+            'script_count': len(basic['scripts']),
+            'style_count': len(basic['styles']),
+            'link_count': counts['a'],
+            'form_count': counts['form']
+        }
+
+        return {
+            'basic_info': basic,
+            'extracted_data': advanced,
+            'performance_metrics': performance
+        }
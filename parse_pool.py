@@ -0,0 +1,129 @@
+import os
+import time
+import queue
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from requests.compat import chardet
+
+
+logger = logging.getLogger(__name__)
+
+
+def decode_body(body, encoding=None):
+    """응답 본문 bytes -> str (requests 의 response.text 와 같은 방식)"""
+    if not body:
+        return ''
+    if encoding is None:
+        encoding = chardet.detect(body)['encoding']
+    try:
+        return str(body, encoding, errors='replace')
+    except (LookupError, TypeError):
+        return str(body, errors='replace')
+
+
+def _parse_job(parse_func, url, body, encoding, parser):
+    """파서 프로세스에서 실행 -> (페이지 데이터, 파싱 시간)"""
+    started = time.perf_counter()
+    page_data = parse_func(url, decode_body(body, encoding), parser)
+    return page_data, time.perf_counter() - started
+
+
+class ParsePool:
+    """
+    파싱 전용 프로세스 풀
+
+    가져오기 스레드는 본문 bytes 를 submit 으로 넘기고 바로 다음 URL을 가져온다. 디코딩과
+    파싱은 별도 프로세스에서 하므로 GIL 을 잡지 않고, 결과 페이지 데이터는 수집 스레드가
+    callback(page_data, error) 으로 넘긴다.
+    처리 중인 작업은 max_pending 개까지만 두며, 가득 차면 submit 이 자리가 날 때까지 기다린다
+    (파싱이 밀리면 가져오기도 늦춰짐).
+    """
+
+    def __init__(self, parse_func, processes=None, max_pending=None, parser=None):
+        self.parse_func = parse_func      # parse_func(url, html, parser) -> dict (모듈 수준 함수)
+        self.processes = processes or os.cpu_count() or 1
+        self.max_pending = max_pending or self.processes * 4
+        self.parser = parser
+
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._results = queue.Queue(self.max_pending)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        self._stats_lock = threading.Lock()
+        self._pending = 0
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'parse_time': 0.0,
+            'backpressure_waits': 0,
+            'backpressure_time': 0.0,
+            'max_pending': 0
+        }
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+
+    def submit(self, url, body, encoding, callback):
+        """본문 파싱 요청 (처리 중인 작업이 max_pending 개면 기다림)"""
+        if not self._slots.acquire(False):
+            started = time.perf_counter()
+            self._slots.acquire()
+            with self._stats_lock:
+                self.stats['backpressure_waits'] += 1
+                self.stats['backpressure_time'] += time.perf_counter() - started
+
+        try:
+            future = self._executor.submit(_parse_job, self.parse_func, url, body, encoding, self.parser)
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._stats_lock:
+            self._pending += 1
+            self.stats['submitted'] += 1
+            self.stats['max_pending'] = max(self.stats['max_pending'], self._pending)
+        future.add_done_callback(lambda f: self._results.put((f, url, callback)))
+
+    def _collect(self):
+        """파싱이 끝난 작업의 callback 호출 (자리는 callback 이 끝난 뒤에 돌려줌)"""
+        while True:
+            item = self._results.get()
+            if item is None:
+                break
+            future, url, callback = item
+            page_data = error = None
+            try:
+                page_data, parse_time = future.result()
+            except Exception as e:
+                error = e
+                parse_time = 0.0
+
+            with self._stats_lock:
+                self._pending -= 1
+                self.stats['completed' if error is None else 'failed'] += 1
+                self.stats['parse_time'] += parse_time
+
+            try:
+                callback(page_data, error)
+            except Exception as e:
+                logger.error(f"파싱 결과 처리 에러 {url}: {e}")
+            finally:
+                self._slots.release()
+
+    def close(self):
+        """남은 작업을 모두 처리하고 풀 종료"""
+        self._executor.shutdown(wait=True)
+        self._results.put(None)
+        self._collector.join()
+
+    def get_statistics(self):
+        with self._stats_lock:
+            stats = dict(self.stats)
+            stats['pending'] = self._pending
+        stats['processes'] = self.processes
+        stats['average_parse_time'] = stats['parse_time'] / stats['completed'] if stats['completed'] else 0.0
+        return stats
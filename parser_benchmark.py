@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+HTML 파서 백엔드 벤치마크
+
+설치된 파서(lxml, html.parser, html5lib)마다 페이지당 파싱 시간을 잰다.
+페이지는 내장 예제 HTML 또는 인자로 준 URL / 파일을 쓴다.
+파서별 추출 결과가 같은지는 tests/test_html_parser.py 에서 확인한다.
+
+    python parser_benchmark.py                      # 내장 예제 페이지
+    python parser_benchmark.py https://example.com page.html --repeat 50
+"""
+
+import os
+import sys
+import time
+import argparse
+import requests
+from html_parser import available_parsers, make_soup
+from advanced_crawler import parse_html
+
+
+REFERENCE_PARSER = 'html.parser'
+BASE_URL = 'https://example.com/section/index.html'
+
+
+def sample_pages():
+    """내장 예제 페이지 (일반 기사, 닫히지 않은 태그가 많은 페이지, 링크가 많은 목록)"""
+    article = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8">
+<title>크롤링 예제 기사</title>
+<meta name="description" content="파서 비교용 기사">
+<meta name="keywords" content="크롤링, 파서, 벤치마크">
+<meta name="robots" content="index, follow">
+<style>body { color: #333; }</style>
+<script>var tracking = "<a href='/not-a-link'>x</a>";</script>
+</head><body>
+<nav><a href="/">홈</a> <a href="/news/">뉴스</a></nav>
+<h1>제목 &amp; 부제</h1>
+<h2>소제목</h2>
+<p>첫 문단 &lt;태그&gt; 와 &nbsp;공백.</p>
+<p>둘째 문단 <a href="/article/2" title="다음 글">다음 글</a> 과 <a href="https://other.com/x">외부</a></p>
+<img src="/img/a.png" alt="그림 A"><img src="b.jpg">
+<form action="/search"><input name="q"></form>
+<footer>저작권 <a href="/about">소개</a></footer>
+</body></html>"""
+
+    sloppy = """<html><head><title>닫히지 않은 태그</title></head><body>
+<h1>목록</h1>
+<ul><li><a href="item/1">하나</a><li><a href="item/2">둘</a><li>셋</ul>
+<p>문단 하나<p>문단 둘 <b>굵게 <i>기울임</b></i>
+<table><tr><td>칸 1<td>칸 2<tr><td><a href="/cell">칸 링크</a></table>
+<img src="/img/c.gif" alt=c>
+</body></html>"""
+
+    rows = '\n'.join(
+        f'<tr><td>{i}</td><td><a href="/list/{i}" title="항목 {i}">항목 {i}</a></td>'
+        f'<td><img src="/thumb/{i}.jpg" alt="썸네일 {i}"></td><td>설명 텍스트 {i} ' + '내용 ' * 20 + '</td></tr>'
+        for i in range(300)
+    )
+    listing = f"""<!DOCTYPE html><html><head><title>긴 목록</title>
+<meta name="description" content="링크가 많은 목록 페이지"></head><body>
+<h1>목록 페이지</h1><table>{rows}</table></body></html>"""
+
+    return [('article', BASE_URL, article), ('sloppy', BASE_URL, sloppy), ('listing', BASE_URL, listing)]
+
+
+def _load_pages(sources):
+    pages = []
+    for source in sources:
+        if os.path.exists(source):
+            with open(source, 'r', encoding='utf-8', errors='replace') as f:
+                pages.append((os.path.basename(source), BASE_URL, f.read()))
+        else:
+            response = requests.get(source, timeout=10)
+            response.raise_for_status()
+            pages.append((source, response.url, response.text))
+    return pages
+
+
+def benchmark(pages, parsers, extract, repeat):
+    """파서별 페이지당 평균 시간(ms) -> {파서: (soup 생성, 전체 추출)}"""
+    results = {}
+    for parser in parsers:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for _, _, html in pages:
+                make_soup(html, parser)
+        soup_ms = (time.perf_counter() - started) * 1000 / (repeat * len(pages))
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for _, url, html in pages:
+                extract(url, html, parser)
+        extract_ms = (time.perf_counter() - started) * 1000 / (repeat * len(pages))
+        results[parser] = (soup_ms, extract_ms)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 백엔드 벤치마크')
+    parser.add_argument('sources', nargs='*', help='잴 페이지 URL 또는 HTML 파일 (없으면 내장 예제)')
+    parser.add_argument('--repeat', type=int, default=20, help='벤치마크 반복 횟수')
+    args = parser.parse_args()
+
+    pages = _load_pages(args.sources) if args.sources else sample_pages()
+    parsers = available_parsers()
+    print(f"설치된 파서: {', '.join(parsers)}")
+
+    print("\n== 페이지당 파싱 시간 (AdvancedWebCrawler.parse_page) ==")
+    results = benchmark(pages, parsers, parse_html, args.repeat)
+    reference = results.get(REFERENCE_PARSER, (0, 0))[1]
+    for backend, (soup_ms, extract_ms) in results.items():
+        speedup = reference / extract_ms if extract_ms else 0
+        print(f"  {backend:12s} soup {soup_ms:8.2f}ms  전체 {extract_ms:8.2f}ms  (html.parser 대비 {speedup:.2f}배)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,380 @@
+import time
+import random
+import heapq
+import threading
+from collections import deque
+from queue import Empty
+from urllib.parse import urlparse
+
+
+class HostScheduler:
+    """
+    호스트별 예의(politeness) 스케줄러
+
+    호스트마다 다음 요청 가능 시각을 기록하고, 준비된 호스트의 URL만 워커에게 넘긴다.
+    워커가 요청 전에 잠들지 않으므로, 한 호스트가 대기 중이어도 다른 호스트의 URL은
+    바로 처리된다. queue.Queue 와 같은 put/get/task_done/join 인터페이스를 제공하므로
+    AdvancedWebCrawler 의 url_queue 자리에 그대로 쓸 수 있다.
+    같은 호스트 안에서는 priority 가 높은 항목부터, 같으면 들어온 순서대로 꺼낸다.
+    이미 대기 중인 URL을 다시 넣으면 새 항목을 만들지 않고, priority 가 더 높을 때 점수만 올린다.
+    """
+
+    def __init__(self, delay_range=(1, 3), throttle=None, store=None, buffer_size=10000,
+                 on_complete=None, lock=None):
+        self.delay_range = delay_range
+        self.throttle = throttle      # AutoThrottle (있으면 호스트별 동시 요청 수 조절)
+        self.store = store            # SQLiteFrontier (있으면 buffer_size 를 넘는 URL은 디스크에 대기)
+        self.buffer_size = buffer_size
+        self.on_complete = on_complete  # on_complete(url) - URL 처리가 끝났을 때 (분산 크롤링 보고용)
+        self.host_delays = {}         # 호스트별 최소 지연 (robots.txt Crawl-delay 등)
+        self._next_allowed = {}       # 호스트 -> 다음 요청 가능 시각
+        self._host_queues = {}        # 호스트 -> 대기 중인 항목 힙 (-priority, 순번, 항목)
+        self._pending = {}            # 호스트 큐에서 대기 중인 URL -> priority (다른 항목은 꺼낼 때 건너뜀)
+        self._ready_heap = []         # (요청 가능 시각, 순번, 호스트) - 대기 항목이 있는 호스트만
+        self._heap_time = {}          # 호스트 -> 힙에 있는 유효한 항목의 시각 (그 외 항목은 무시)
+        self._delayed = []            # (not_before, 순번, 항목, priority) - 재시도 대기 중인 항목
+        self._in_flight = {}          # 호스트 -> 진행 중인 요청 수
+        self._saturated = set()       # 동시 요청 한도에 걸려 잠시 빠진 호스트
+        self._sentinels = deque()     # 워커 종료용 None
+        self._seq = 0
+        self._unfinished = 0
+        self._queued = 0
+        self._spilled = 0             # 디스크 프론티어에서 대기 중인 URL 수
+        self._lock = lock or threading.Lock()   # InstrumentedLock 을 넘기면 경합 시간 측정
+        self._not_empty = threading.Condition(self._lock)
+        self._all_done = threading.Condition(self._lock)
+
+        if store is not None:
+            # 이전 실행에서 남은 URL부터 이어서 처리
+            self._spilled = store.pending_count()
+            self._unfinished = self._spilled
+
+    @staticmethod
+    def host_of(url):
+        """URL의 호스트 (스케줄링 단위)"""
+        return urlparse(url).netloc
+
+    def _delay_for(self, host):
+        """호스트의 다음 요청까지 지연 시간"""
+        delay = random.uniform(*self.delay_range) if self.delay_range else 0
+        if self.throttle:
+            # 동시 요청 한도만큼 요청 시작 간격을 줄임 (robots.txt 지연은 그대로 하한)
+            delay /= self.throttle.limit(host)
+        return max(delay, self.host_delays.get(host, 0))
+
+    def set_host_delay(self, host, delay):
+        """호스트별 최소 지연 설정"""
+        with self._lock:
+            self.host_delays[host] = delay
+
+    def _push_host(self, host, ready_at):
+        self._seq += 1
+        self._heap_time[host] = ready_at
+        heapq.heappush(self._ready_heap, (ready_at, self._seq, host))
+
+    def _at_limit(self, host):
+        """호스트가 동시 요청 한도에 도달했는지"""
+        return bool(self.throttle) and self._in_flight.get(host, 0) >= self.throttle.max_in_flight(host)
+
+    def _enqueue(self, item, priority=0):
+        self._pending[item[0]] = priority
+        host = self.host_of(item[0])
+        host_queue = self._host_queues.setdefault(host, [])
+        if not host_queue and host not in self._saturated:
+            if self._at_limit(host):
+                # 큐가 비어 빠졌던 호스트라도 한도에 걸려 있으면 release 될 때까지 대기
+                self._saturated.add(host)
+            else:
+                self._push_host(host, self._next_allowed.get(host, 0))
+        self._seq += 1
+        heapq.heappush(host_queue, (-priority, self._seq, item))
+
+    def _pop_pending(self, host_queue):
+        """호스트 큐에서 유효한 항목 하나 꺼내기 (점수를 올리며 대체된 항목은 버림, 없으면 None)"""
+        while host_queue:
+            neg_priority, _, item = heapq.heappop(host_queue)
+            if self._pending.get(item[0]) == -neg_priority:
+                del self._pending[item[0]]
+                return item
+        return None
+
+    def _refill_from_store(self):
+        """메모리 버퍼가 절반 아래로 줄면 디스크 프론티어에서 채움"""
+        if not self._spilled or self._queued >= self.buffer_size // 2:
+            return
+        items = self.store.lease(self.buffer_size - self._queued, with_priority=True)
+        self._spilled -= len(items)
+        if not items:
+            # 디스크에 더 이상 대기 중인 URL이 없음 (세던 수와 어긋난 만큼 정리)
+            self._unfinished -= self._spilled
+            self._spilled = 0
+            if self._unfinished <= 0:
+                self._unfinished = 0
+                self._all_done.notify_all()
+        for url, depth, priority in items:
+            self._enqueue((url, depth), priority)
+            self._queued += 1
+
+    def _release_delayed(self, now):
+        """재시도 시각이 지난 항목을 호스트 큐로 옮김"""
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, item, priority = heapq.heappop(self._delayed)
+            pending = self._pending.get(item[0])
+            if pending is not None:
+                # 기다리는 동안 같은 URL이 다시 들어와 대기 중 (항목 하나로 합침)
+                if priority > pending:
+                    self._enqueue(item, priority)
+                self._queued -= 1
+                self._unfinished -= 1
+                continue
+            self._enqueue(item, priority)
+
+    def put(self, item, block=True, timeout=None, not_before=None, priority=0):
+        """
+        (url, depth) 항목 추가 (None 은 워커 종료 신호)
+
+        not_before(time.monotonic 기준)를 주면 그 시각 이후에만 꺼내진다 (재시도 예약).
+        디스크 프론티어를 쓰면 처음 보는 URL만 들어가고, 버퍼가 차 있으면 디스크에서 기다린다.
+        이미 디스크에서 기다리는 URL이면 priority 가 더 높을 때 점수만 올린다.
+        """
+        with self._lock:
+            if self._put_locked(item, not_before, priority):
+                self._not_empty.notify()
+
+    def put_many(self, items):
+        """
+        [(url, depth, priority)] 을 한 번에 추가
+
+        링크가 많은 페이지도 스케줄러 lock 을 한 번만 잡는다.
+        """
+        with self._lock:
+            added = sum(1 for url, depth, priority in items if self._put_locked((url, depth), None, priority))
+            if added:
+                self._not_empty.notify(added)
+            return added
+
+    def _put_locked(self, item, not_before, priority):
+        """lock 안에서 항목 하나 추가 (디스크 프론티어에 이미 있어 버린 항목이면 False)"""
+        if item is None:
+            self._unfinished += 1
+            self._sentinels.append(item)
+        elif not_before is not None and not_before > time.monotonic():
+            self._unfinished += 1
+            self._seq += 1
+            heapq.heappush(self._delayed, (not_before, self._seq, item, priority))
+            self._queued += 1
+        elif self.store is not None and not_before is None:
+            buffered = self._queued < self.buffer_size
+            if not self.store.push(item[0], item[1], leased=buffered, priority=priority):
+                if priority:
+                    self.store.raise_priority(item[0], priority)
+                return False
+            self._unfinished += 1
+            if buffered:
+                self._enqueue(item, priority)
+                self._queued += 1
+            else:
+                self._spilled += 1
+        else:
+            pending = self._pending.get(item[0])
+            if pending is not None:
+                # 이미 대기 중인 URL (점수가 오르면 새 항목으로 바꾸고 이전 항목은 꺼낼 때 건너뜀)
+                if priority > pending:
+                    self._enqueue(item, priority)
+                return False
+            self._unfinished += 1
+            self._enqueue(item, priority)
+            self._queued += 1
+        return True
+
+    def discard_pending(self):
+        """
+        대기 중인 항목을 모두 버림 (페이지 한도에 도달했을 때)
+
+        디스크 프론티어의 상태는 그대로 두므로 다음 실행에서 이어서 처리된다.
+        """
+        with self._lock:
+            discarded = self._queued + self._spilled
+            self._host_queues.clear()
+            self._pending.clear()
+            self._ready_heap.clear()
+            self._heap_time.clear()
+            self._delayed.clear()
+            self._saturated.clear()
+            self._queued = 0
+            self._spilled = 0
+            self._unfinished -= discarded
+            if self._unfinished <= 0:
+                self._unfinished = 0
+                self._all_done.notify_all()
+            return discarded
+
+    def complete(self, url):
+        """URL 처리 완료 기록 (디스크 프론티어에서 다시 꺼내지 않음)"""
+        if self.store is not None:
+            self.store.mark_done(url)
+        if self.on_complete is not None:
+            self.on_complete(url)
+
+    def defer_host(self, host, until):
+        """호스트의 다음 요청 가능 시각을 until(time.monotonic 기준) 이후로 미룸"""
+        with self._lock:
+            if until <= self._next_allowed.get(host, 0):
+                return
+            self._next_allowed[host] = until
+            if host in self._host_queues and host not in self._saturated:
+                self._push_host(host, until)
+
+    def get(self, block=True, timeout=None):
+        """요청 가능한 호스트의 항목 꺼내기 (없으면 가장 빠른 호스트를 기다림)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._not_empty:
+            while True:
+                now = time.monotonic()
+                if self.store is not None:
+                    self._refill_from_store()
+                self._release_delayed(now)
+
+                while self._ready_heap and self._ready_heap[0][0] <= now:
+                    ready_at, _, host = heapq.heappop(self._ready_heap)
+                    if self._heap_time.get(host) != ready_at:
+                        continue  # defer_host 로 대체된 오래된 항목
+                    if self._at_limit(host):
+                        # 한도에 도달한 호스트는 release 될 때까지 힙에서 뺌
+                        del self._heap_time[host]
+                        self._saturated.add(host)
+                        continue
+
+                    host_queue = self._host_queues[host]
+                    item = self._pop_pending(host_queue)
+                    if item is None:
+                        # 점수를 올리며 대체된 항목만 남아 있던 호스트
+                        del self._host_queues[host]
+                        del self._heap_time[host]
+                        continue
+                    self._queued -= 1
+                    self._in_flight[host] = self._in_flight.get(host, 0) + 1
+
+                    next_allowed = now + self._delay_for(host)
+                    self._next_allowed[host] = next_allowed
+                    if not host_queue:
+                        del self._host_queues[host]
+                        del self._heap_time[host]
+                    elif self._at_limit(host):
+                        del self._heap_time[host]
+                        self._saturated.add(host)
+                    else:
+                        self._push_host(host, next_allowed)
+                    return item
+
+                # 실제 URL이 모두 처리된 뒤에만 종료 신호를 돌려준다
+                if self._sentinels and not self._host_queues and not self._delayed and not self._spilled:
+                    return self._sentinels.popleft()
+
+                if not block:
+                    raise Empty
+
+                wait = None
+                if self._ready_heap:
+                    wait = self._ready_heap[0][0] - now
+                if self._delayed:
+                    delayed_wait = self._delayed[0][0] - now
+                    wait = delayed_wait if wait is None else min(wait, delayed_wait)
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise Empty
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._not_empty.wait(wait)
+
+    def release(self, url, fetched=True):
+        """
+        get 으로 받은 URL의 처리가 끝났음을 알림 (호스트 동시 요청 수 감소)
+
+        실제로 요청하지 않고 건너뛴 URL(fetched=False)은 예약했던 요청 간격을 돌려준다.
+        """
+        host = self.host_of(url)
+        with self._lock:
+            in_flight = self._in_flight.get(host, 0) - 1
+            if in_flight > 0:
+                self._in_flight[host] = in_flight
+            else:
+                self._in_flight.pop(host, None)
+
+            now = time.monotonic()
+            if not fetched and self._next_allowed.get(host, 0) > now:
+                self._next_allowed[host] = now
+                if host in self._heap_time:
+                    self._push_host(host, now)
+                    self._not_empty.notify()
+
+            if host in self._saturated and \
+                    (not self.throttle or in_flight < self.throttle.max_in_flight(host)):
+                self._saturated.discard(host)
+                if host in self._host_queues:
+                    self._push_host(host, self._next_allowed.get(host, 0))
+                    self._not_empty.notify()
+
+    def reserve(self, url):
+        """호스트의 다음 요청 슬롯을 예약하고 기다려야 할 시간(초)을 반환"""
+        host = self.host_of(url)
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed.get(host, 0))
+            self._next_allowed[host] = start + self._delay_for(host)
+            return start - now
+
+    def wait(self, url):
+        """직접 요청하는 코드용: 해당 호스트 차례가 될 때까지만 대기"""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def add_task(self):
+        """get 으로 받은 항목과 따로 끝나는 작업 등록 (task_done 으로 끝내며 join / is_idle 이 기다림)"""
+        with self._lock:
+            self._unfinished += 1
+
+    def task_done(self):
+        with self._lock:
+            self._unfinished -= 1
+            if self._unfinished < 0:
+                raise ValueError('task_done() called too many times')
+            if self._unfinished == 0:
+                self._all_done.notify_all()
+
+    def join(self):
+        with self._all_done:
+            while self._unfinished:
+                self._all_done.wait()
+
+    def is_idle(self):
+        """대기 중이거나 처리 중인 항목이 없는지"""
+        with self._lock:
+            return self._unfinished == 0
+
+    def qsize(self):
+        with self._lock:
+            return self._queued + self._spilled
+
+    def empty(self):
+        return self.qsize() == 0
+
+    def get_statistics(self):
+        """스케줄러 상태"""
+        with self._lock:
+            return {
+                'queued_urls': self._queued,
+                'active_hosts': len(self._host_queues),
+                'delayed_urls': len(self._delayed),
+                'spilled_urls': self._spilled,
+                'in_flight': sum(self._in_flight.values()),
+                'saturated_hosts': len(self._saturated),
+                'known_hosts': len(self._next_allowed)
+            }
+
+    def lock_statistics(self):
+        """스케줄러 lock 의 경합 통계 ({이름: 통계}, InstrumentedLock 이 아니면 빈 dict)"""
+        if not hasattr(self._lock, 'get_statistics'):
+            return {}
+        return {self._lock.name: self._lock.get_statistics()}
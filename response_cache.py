@@ -0,0 +1,126 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from urllib.parse import urlparse, urlunparse
+
+
+class ResponseCache:
+    """
+    HTTP 재검증 캐시 (ETag / Last-Modified)
+
+    정규화된 URL마다 검증자(ETag, Last-Modified), 본문 크기, 파싱 결과를
+    SQLite 파일에 저장한다. 다시 크롤링할 때 If-None-Match / If-Modified-Since 를
+    보내고, 304 응답이면 저장된 파싱 결과를 그대로 재사용한다.
+    """
+
+    def __init__(self, path='response_cache.db'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+            'body BLOB, page_data TEXT, updated_at TEXT, body_size INTEGER)'
+        )
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(responses)')]
+        if 'body_size' not in columns:
+            # 본문을 통째로 저장하던 이전 형식 (본문은 더 이상 읽지 않음)
+            self._conn.execute('ALTER TABLE responses ADD COLUMN body_size INTEGER')
+        self._conn.commit()
+        self.stats = {
+            'not_modified': 0,
+            'stored': 0,
+            'bytes_saved': 0
+        }
+
+    @staticmethod
+    def normalize_url(url):
+        """캐시 키용 URL 정규화 (스킴/호스트 소문자, 프래그먼트 제거)"""
+        parsed = urlparse(url)
+        return urlunparse((
+            parsed.scheme.lower(),
+            parsed.netloc.lower(),
+            parsed.path or '/',
+            parsed.params,
+            parsed.query,
+            ''
+        ))
+
+    def get(self, url):
+        """저장된 항목 (없으면 None)"""
+        key = self.normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified, body_size, page_data FROM responses WHERE url = ?',
+                (key,)
+            ).fetchone()
+        if not row:
+            return None
+
+        etag, last_modified, body_size, page_data = row
+        return {
+            'etag': etag,
+            'last_modified': last_modified,
+            'body_size': body_size or 0,
+            'page_data': json.loads(page_data) if page_data else None
+        }
+
+    def conditional_headers(self, url):
+        """재검증 요청 헤더"""
+        key = self.normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified FROM responses WHERE url = ? AND page_data IS NOT NULL',
+                (key,)
+            ).fetchone()
+        if not row:
+            return {}
+
+        headers = {}
+        etag, last_modified = row
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def store(self, url, response, page_data):
+        """200 응답과 파싱 결과 저장 (검증자가 없으면 저장하지 않음)"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        key = self.normalize_url(url)
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(url, etag, last_modified, body_size, page_data, updated_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (key, etag, last_modified, len(response.content),
+                 json.dumps(page_data, ensure_ascii=False), datetime.now().isoformat())
+            )
+            self._conn.commit()
+            self.stats['stored'] += 1
+
+    def reuse(self, url, response):
+        """304 응답에 대해 저장된 파싱 결과 반환 (없으면 None)"""
+        cached = self.get(url)
+        if not cached or cached['page_data'] is None:
+            return None
+
+        page_data = cached['page_data']
+        page_data['timestamp'] = datetime.now().isoformat()
+        page_data['not_modified'] = True
+        with self._lock:
+            self.stats['not_modified'] += 1
+            self.stats['bytes_saved'] += cached['body_size']
+        return page_data
+
+    def get_statistics(self):
+        with self._lock:
+            return dict(self.stats)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
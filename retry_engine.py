@@ -0,0 +1,209 @@
+import time
+import random
+import threading
+from collections import deque, Counter
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+import requests
+
+
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+
+class CircuitBreaker:
+    """
+    호스트 하나에 대한 서킷 브레이커
+
+    연속 실패가 failure_threshold 번 쌓이면 열리고(open), reset_timeout 동안 요청을 막는다.
+    그 뒤 한 번의 시험 요청(half-open)만 내보내고, 그 결과가 나올 때까지 다른 요청은 막는다.
+    시험 요청이 성공하면 닫히고, 실패하면 다시 열린다.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.opened_until = 0
+        self.state = 'closed'
+        self.probe_in_flight = False
+
+    def allow_request(self, now):
+        if self.state == 'open':
+            if now < self.opened_until:
+                return False
+            self.state = 'half_open'
+        elif self.state == 'half_open' and self.probe_in_flight:
+            return False  # 시험 요청 결과를 기다리는 중
+        if self.state == 'half_open':
+            self.probe_in_flight = True
+        return True
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.state = 'closed'
+        self.probe_in_flight = False
+
+    def record_failure(self, now):
+        """실패 기록 (이번 실패로 브레이커가 열렸으면 True)"""
+        self.consecutive_failures += 1
+        self.probe_in_flight = False
+        if self.state == 'half_open' or self.consecutive_failures >= self.failure_threshold:
+            was_open = self.state == 'open'
+            self.state = 'open'
+            self.opened_until = now + self.reset_timeout
+            return not was_open
+        return False
+
+
+class RetryEngine:
+    """
+    비차단 재시도 엔진
+
+    실패한 요청을 그 자리에서 잠들며 다시 시도하지 않고, 다음 시도 시각(지터가 들어간
+    지수 백오프, 429/503 이면 Retry-After)을 계산해 돌려준다. 호출하는 쪽은 그 시각에
+    맞춰 URL을 프론티어에 다시 넣는다. 호스트별 서킷 브레이커와 구조화된 재시도 지표도 관리한다.
+    """
+
+    def __init__(self, max_retries=3, base_delay=1.0, max_delay=60.0,
+                 failure_threshold=5, reset_timeout=60, max_events=200):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._breakers = {}
+        self._attempts = {}
+        self.counters = Counter()
+        self.errors_by_type = Counter()
+        self.events = deque(maxlen=max_events)
+
+    @staticmethod
+    def host_of(url):
+        return urlparse(url).netloc
+
+    def _breaker(self, host):
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self._breakers[host] = breaker
+        return breaker
+
+    @staticmethod
+    def parse_retry_after(value):
+        """Retry-After 헤더 값(초 또는 HTTP 날짜)을 초 단위로 변환"""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max((retry_at - datetime.now(retry_at.tzinfo)).total_seconds(), 0)
+
+    def backoff(self, attempt):
+        """지터가 들어간 지수 백오프 (full jitter)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def allow_request(self, url):
+        """호스트 서킷이 닫혀 있는지 (열려 있으면 언제 다시 시도할지 함께 반환)"""
+        host = self.host_of(url)
+        now = time.monotonic()
+        with self._lock:
+            breaker = self._breaker(host)
+            if breaker.allow_request(now):
+                return True, None
+            self.counters['circuit_skips'] += 1
+            if breaker.state == 'open':
+                return False, breaker.opened_until
+            return False, now + self.base_delay  # half-open 시험 요청이 끝난 뒤 다시 확인
+
+    def record_success(self, url):
+        host = self.host_of(url)
+        with self._lock:
+            self._breaker(host).record_success()
+            self._attempts.pop(url, None)
+            self.counters['successes'] += 1
+
+    @staticmethod
+    def classify(error):
+        """예외를 (오류 종류, 상태 코드, Retry-After 초)로 분류"""
+        response = getattr(error, 'response', None)
+        if response is not None:
+            status = response.status_code
+            retry_after = None
+            if status in (429, 503):
+                retry_after = RetryEngine.parse_retry_after(response.headers.get('Retry-After'))
+            return f'http_{status}', status, retry_after
+        if isinstance(error, requests.Timeout):
+            return 'timeout', None, None
+        if isinstance(error, requests.ConnectionError):
+            return 'connection', None, None
+        return type(error).__name__, None, None
+
+    def record_failure(self, url, error):
+        """
+        실패 기록 후 다음 시도까지의 지연(초)을 반환
+
+        재시도하지 않을 오류이거나 재시도 횟수를 다 쓰면 None.
+        반환값의 두 번째 항목은 호스트 전체를 미뤄야 하는 시각(Retry-After, 서킷 열림) 또는 None.
+        """
+        host = self.host_of(url)
+        kind, status, retry_after = self.classify(error)
+        now = time.monotonic()
+
+        with self._lock:
+            attempt = self._attempts.get(url, 0) + 1
+            self._attempts[url] = attempt
+            self.counters['failures'] += 1
+            self.errors_by_type[kind] += 1
+
+            retryable = status is None or status in RETRYABLE_STATUS
+            host_deferred_until = None
+            if not retryable and self._breaker(host).state == 'half_open':
+                # 재시도하지 않을 응답(4xx 등)이라도 호스트는 살아 있으므로 시험 요청은 성공
+                self._breaker(host).record_success()
+            if retryable:
+                breaker = self._breaker(host)
+                if breaker.record_failure(now):
+                    self.counters['circuits_opened'] += 1
+                if breaker.state == 'open':
+                    host_deferred_until = breaker.opened_until
+
+            delay = None
+            if retryable and attempt <= self.max_retries:
+                delay = retry_after if retry_after is not None else self.backoff(attempt)
+                if retry_after is not None:
+                    host_deferred_until = max(host_deferred_until or 0, now + retry_after)
+                self.counters['retries_scheduled'] += 1
+            else:
+                self._attempts.pop(url, None)
+                self.counters['gave_up'] += 1
+
+            self.events.append({
+                'url': url,
+                'host': host,
+                'attempt': attempt,
+                'error': str(error),
+                'error_type': kind,
+                'retry_in': round(delay, 2) if delay is not None else None,
+                'timestamp': datetime.now().isoformat()
+            })
+
+        return delay, host_deferred_until
+
+    def get_metrics(self):
+        """구조화된 재시도 지표"""
+        with self._lock:
+            return {
+                'counters': dict(self.counters),
+                'errors_by_type': dict(self.errors_by_type),
+                'open_circuits': [
+                    host for host, breaker in self._breakers.items() if breaker.state == 'open'
+                ],
+                'recent_errors': list(self.events)
+            }
@@ -0,0 +1,168 @@
+import os
+import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+
+logger = logging.getLogger(__name__)
+
+
+class RobotsCache:
+    """
+    호스트별 robots.txt 캐시
+
+    호스트마다 robots.txt 원문을 받아 파싱해 두고 TTL 동안 재사용한다.
+    원문은 디스크에 저장해 다음 실행에서도 쓰며, Crawl-delay / Request-rate 는
+    on_delay 콜백으로 넘겨 호스트 스케줄러의 최소 지연으로 쓴다.
+    5xx 나 네트워크 오류로 가져오지 못한 호스트는 일시적인 실패로 보고 retry_ttl 동안만
+    전부 차단한 뒤 다시 가져오며, 이 결과는 디스크에 저장하지 않는다.
+    새로 발견한 호스트의 robots.txt 는 prefetch 로 미리 병렬로 받아 둔다.
+    """
+
+    def __init__(self, fetch, ttl=86400, cache_file=None, on_delay=None, max_workers=4, retry_ttl=300):
+        self.fetch = fetch              # fetch(robots_url) -> (status_code, text)
+        self.ttl = ttl
+        self.retry_ttl = retry_ttl      # 가져오지 못한 경우 다시 시도하기까지의 시간
+        self.cache_file = cache_file
+        self.on_delay = on_delay        # on_delay(host, seconds)
+        self._entries = {}              # 호스트 -> {'scheme', 'status', 'text', 'fetched_at'}
+        self._parsers = {}              # 호스트 -> RobotFileParser
+        self._pending = {}              # 호스트 -> Future (가져오는 중)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.stats = {'fetched': 0, 'cache_hits': 0, 'loaded': 0, 'failures': 0}
+        self.load()
+
+    @staticmethod
+    def _parse(status, text):
+        """RobotFileParser.read 와 같은 규칙으로 파싱"""
+        rp = RobotFileParser()
+        if status in (401, 403) or RobotsCache._is_unreachable(status):
+            # 가져오지 못한 경우(5xx, 네트워크 오류)는 다시 받을 때까지 모두 차단
+            rp.disallow_all = True
+        elif status >= 400:
+            # 없으면(4xx) 모두 허용
+            rp.allow_all = True
+        else:
+            rp.parse(text.splitlines())
+        rp.modified()
+        return rp
+
+    @staticmethod
+    def _is_unreachable(status):
+        return status is None or status >= 500
+
+    def _is_fresh(self, entry):
+        ttl = self.retry_ttl if self._is_unreachable(entry['status']) else self.ttl
+        return time.time() - entry['fetched_at'] < ttl
+
+    def _apply_delay(self, host, rp):
+        if not self.on_delay:
+            return
+        delay = rp.crawl_delay('*')
+        rate = rp.request_rate('*')
+        seconds = float(delay) if delay else 0
+        if rate and rate.requests:
+            seconds = max(seconds, rate.seconds / rate.requests)
+        if seconds:
+            self.on_delay(host, seconds)
+
+    def _store(self, host, scheme, status, text):
+        rp = self._parse(status, text)
+        with self._lock:
+            self._entries[host] = {
+                'scheme': scheme,
+                'status': status,
+                'text': text,
+                'fetched_at': time.time()
+            }
+            self._parsers[host] = rp
+            self.stats['fetched'] += 1
+            if self._is_unreachable(status):
+                self.stats['failures'] += 1
+        self._apply_delay(host, rp)
+        return rp
+
+    def _fetch_host(self, host, scheme):
+        robots_url = f"{scheme}://{host}/robots.txt"
+        try:
+            status, text = self.fetch(robots_url)
+        except Exception as e:
+            logger.warning(f"robots.txt 확인 실패 {host}: {e}")
+            status, text = None, ''
+        try:
+            return self._store(host, scheme, status, text)
+        finally:
+            with self._lock:
+                self._pending.pop(host, None)
+
+    def _get_parser(self, url, wait=True):
+        parsed = urlparse(url)
+        host, scheme = parsed.netloc, parsed.scheme or 'https'
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry and self._is_fresh(entry):
+                self.stats['cache_hits'] += 1
+                return self._parsers[host]
+            future = self._pending.get(host)
+            if future is None:
+                future = self._executor.submit(self._fetch_host, host, scheme)
+                self._pending[host] = future
+        return future.result() if wait else None
+
+    def prefetch(self, urls):
+        """아직 캐시에 없는 호스트의 robots.txt 를 백그라운드에서 가져오기"""
+        for url in urls:
+            self._get_parser(url, wait=False)
+
+    def can_fetch(self, url, user_agent='*'):
+        """robots.txt 규칙상 가져와도 되는지"""
+        return self._get_parser(url).can_fetch(user_agent, url)
+
+    def site_maps(self, url):
+        """robots.txt 에 적힌 Sitemap 목록"""
+        return self._get_parser(url).site_maps() or []
+
+    def load(self):
+        """디스크에서 캐시 로드 (만료되지 않은 항목만 다시 파싱)"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"robots.txt 캐시 로드 실패: {e}")
+            return
+
+        for host, entry in entries.items():
+            if not self._is_unreachable(entry['status']) and self._is_fresh(entry):
+                rp = self._parse(entry['status'], entry['text'])
+                self._entries[host] = entry
+                self._parsers[host] = rp
+                self.stats['loaded'] += 1
+                self._apply_delay(host, rp)
+
+    def save(self):
+        """캐시를 디스크에 저장 (가져오지 못한 호스트는 다음 실행에서 다시 가져오도록 제외)"""
+        if not self.cache_file:
+            return
+        with self._lock:
+            entries = {
+                host: entry for host, entry in self._entries.items()
+                if not self._is_unreachable(entry['status'])
+            }
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+        except OSError as e:
+            logger.error(f"robots.txt 캐시 저장 실패: {e}")
+
+    def get_statistics(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['hosts'] = len(self._entries)
+        return stats
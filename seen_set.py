@@ -0,0 +1,450 @@
+import os
+import re
+import json
+import math
+import mmap
+import struct
+import bisect
+import hashlib
+import threading
+from array import array
+
+
+BLOOM_MAGIC = b'SBF1'
+
+
+def _hash_pair(item):
+    """URL 하나에서 64비트 해시 두 개 (이중 해싱으로 k 개의 위치를 만든다)"""
+    digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+    h1, h2 = struct.unpack('<QQ', digest)
+    return h1, h2 | 1
+
+
+class BloomFilter:
+    """
+    고정 크기 블룸 필터
+
+    capacity 개까지 넣었을 때 오탐률이 error_rate 가 되도록 비트 수와 해시 수를 정한다.
+    오탐(본 적 없는 URL을 봤다고 판단)은 있을 수 있지만 미탐은 없다.
+    """
+
+    def __init__(self, capacity, error_rate, bits=None, count=0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bits if bits is not None else bytearray((self.num_bits + 7) // 8)
+        self.count = count
+
+    def _positions(self, hashes):
+        h1, h2 = hashes
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def contains(self, hashes):
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(hashes))
+
+    def add(self, hashes):
+        bits = self.bits
+        for pos in self._positions(hashes):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    @property
+    def is_full(self):
+        return self.count >= self.capacity
+
+
+class WindowedBloomFilter:
+    """
+    통계용 고정 크기 블룸 필터
+
+    capacity 개를 넣으면 비우고 다시 시작하므로 크롤링이 길어져도 메모리가 일정하다.
+    그 대신 오래전에 본 URL은 다시 처음 보는 것으로 세므로 이것으로 센 값은 근사치다.
+    """
+
+    def __init__(self, capacity=1000000, error_rate=0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.resets = 0
+        self._filter = BloomFilter(capacity, error_rate)
+
+    def add(self, url):
+        """URL 추가 (처음 보는 URL이면 True)"""
+        hashes = _hash_pair(url)
+        if self._filter.contains(hashes):
+            return False
+        if self._filter.is_full:
+            self._filter = BloomFilter(self.capacity, self.error_rate)
+            self.resets += 1
+        self._filter.add(hashes)
+        return True
+
+    def __contains__(self, url):
+        return self._filter.contains(_hash_pair(url))
+
+
+class ScalableBloomFilter:
+    """
+    크기가 늘어나는 블룸 필터 (seen 집합용)
+
+    URL 문자열을 그대로 들고 있는 set 대신 비트 배열만 저장하므로 URL 1억 개도 수백 MB 안에
+    들어간다. 필터가 차면 growth 배 큰 필터를 더 붙이고, 새 필터의 오탐률은 tightening 배로
+    낮춰 전체 오탐률이 error_rate 근처에 머물게 한다.
+    set 과 같은 방식(in, add, len)으로 쓸 수 있고, save / load 는 비트 배열을 그대로 읽고 쓴다.
+    """
+
+    def __init__(self, initial_capacity=1000000, error_rate=0.001, growth=2, tightening=0.5):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.filters = []
+        self._lock = threading.Lock()
+
+    def _add_filter(self):
+        index = len(self.filters)
+        capacity = self.initial_capacity * (self.growth ** index)
+        error_rate = self.error_rate * (1 - self.tightening) * (self.tightening ** index)
+        self.filters.append(BloomFilter(capacity, error_rate))
+
+    def __contains__(self, url):
+        hashes = _hash_pair(url)
+        return any(f.contains(hashes) for f in self.filters)
+
+    def add(self, url):
+        hashes = _hash_pair(url)
+        with self._lock:
+            if any(f.contains(hashes) for f in self.filters):
+                return
+            if not self.filters or self.filters[-1].is_full:
+                self._add_filter()
+            self.filters[-1].add(hashes)
+
+    def update(self, urls):
+        for url in urls:
+            self.add(url)
+
+    def __len__(self):
+        return sum(f.count for f in self.filters)
+
+    def size_bytes(self):
+        return sum(len(f.bits) for f in self.filters)
+
+    def estimated_error_rate(self):
+        """현재 채워진 정도로 계산한 오탐률 추정치"""
+        miss = 1.0
+        for f in self.filters:
+            miss *= 1 - (1 - math.exp(-f.num_hashes * f.count / f.num_bits)) ** f.num_hashes
+        return 1 - miss
+
+    def save(self, path):
+        """헤더(JSON) 뒤에 각 필터의 비트 배열을 그대로 기록"""
+        with self._lock:
+            header = json.dumps({
+                'initial_capacity': self.initial_capacity,
+                'error_rate': self.error_rate,
+                'growth': self.growth,
+                'tightening': self.tightening,
+                'filters': [
+                    {'capacity': f.capacity, 'error_rate': f.error_rate, 'count': f.count}
+                    for f in self.filters
+                ]
+            }).encode('utf-8')
+            with open(path, 'wb') as fp:
+                fp.write(BLOOM_MAGIC)
+                fp.write(struct.pack('<I', len(header)))
+                fp.write(header)
+                for f in self.filters:
+                    fp.write(f.bits)
+
+    @classmethod
+    def load(cls, path):
+        """save 로 저장한 파일 로드 (비트 배열은 파싱 없이 바로 읽음)"""
+        with open(path, 'rb') as fp:
+            if fp.read(4) != BLOOM_MAGIC:
+                raise ValueError(f"블룸 필터 파일이 아님: {path}")
+            header_len, = struct.unpack('<I', fp.read(4))
+            header = json.loads(fp.read(header_len))
+            seen = cls(header['initial_capacity'], header['error_rate'],
+                       header['growth'], header['tightening'])
+            for info in header['filters']:
+                f = BloomFilter(info['capacity'], info['error_rate'], count=info['count'])
+                if fp.readinto(f.bits) != len(f.bits):
+                    raise ValueError(f"블룸 필터 파일이 잘림: {path}")
+                seen.filters.append(f)
+        return seen
+
+    def get_statistics(self):
+        return {
+            'type': 'bloom',
+            'count': len(self),
+            'filters': len(self.filters),
+            'size_bytes': self.size_bytes(),
+            'estimated_error_rate': self.estimated_error_rate()
+        }
+
+
+def url_fingerprint(url):
+    """URL의 64비트 지문"""
+    return struct.unpack('<Q', hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest())[0]
+
+
+class _SortedRun:
+    """정렬된 지문 배열 파일 하나 (lo~hi 세대의 추가 로그를 반영)"""
+
+    def __init__(self, path, lo, hi):
+        self.path = path
+        self.lo = lo
+        self.hi = hi
+        self._mmap = None
+        self.view = None
+        if os.path.getsize(path):
+            with open(path, 'rb') as fp:
+                self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            self.view = memoryview(self._mmap).cast('Q')
+
+    def __len__(self):
+        return len(self.view) if self.view is not None else 0
+
+    def __contains__(self, fingerprint):
+        view = self.view
+        if view is None:
+            return False
+        pos = bisect.bisect_left(view, fingerprint)
+        return pos < len(view) and view[pos] == fingerprint
+
+    def close(self):
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+class FingerprintIndex:
+    """
+    메모리 매핑된 URL 지문 인덱스 (seen 집합용)
+
+    방문한 URL을 64비트 지문으로 바꿔 정렬된 배열 파일(run)에 저장하고, 시작할 때는 파일을
+    mmap 으로 열기만 하므로 기록이 많아도 바로 시작한다. 조회는 run 마다 이진 탐색.
+    새 지문은 추가 로그에 덧붙였다가 merge_threshold 개가 쌓이면 새 run 으로 쓰고, 크기가
+    size_ratio 배 안쪽인 run 끼리만 합친다. 지문 하나가 다시 쓰이는 횟수가 run 단계 수(log N)에
+    묶이므로 병합 I/O 가 크롤링 크기에 대해 제곱으로 늘지 않는다.
+    run 파일 이름({path}.{lo}-{hi}.run)은 몇 번째 추가 로그({path}.{세대}.log)까지 반영했는지를
+    나타내므로, run 을 rename 하는 순간 그 로그는 비워진 것과 같다. 다시 열 때는 그보다 새 로그만
+    읽고, 이미 run 에 있는 지문은 건너뛴다. 지문이 64비트라 URL 1억 개에서도 충돌 확률은 무시할 만하다.
+    """
+
+    ITEM_SIZE = array('Q').itemsize
+    _RUN_NAME = re.compile(r'\.(\d+)-(\d+)\.run')
+    _LOG_NAME = re.compile(r'\.(\d+)\.log')
+
+    def __init__(self, path='seen_urls.idx', merge_threshold=100000, size_ratio=2):
+        self.path = path
+        self.merge_threshold = merge_threshold
+        self.size_ratio = size_ratio
+        self._lock = threading.RLock()
+        self._runs = []               # 오래된 것부터 (세대 순)
+        self._pending = set()
+        self._generation = 0          # run 에 반영된 마지막 로그 세대
+        self.stats = {'merges': 0, 'compactions': 0, 'log_replayed': 0}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        self._open_runs(directory)
+        self._replay_logs(directory)
+        self._log = open(self._log_path(self._generation + 1), 'ab')
+        if os.path.exists(path + '.log'):
+            # 이전 형식의 추가 로그는 바로 run 으로 옮김
+            if self._pending:
+                self.merge()
+            else:
+                os.remove(path + '.log')
+
+    def _run_path(self, lo, hi):
+        return f"{self.path}.{lo}-{hi}.run"
+
+    def _log_path(self, generation):
+        return f"{self.path}.{generation}.log"
+
+    def _files(self, directory, pattern):
+        """path 로 시작하는 파일 중 pattern 에 맞는 것 -> [(숫자들, 파일 경로)]"""
+        base = os.path.basename(self.path)
+        found = []
+        for name in os.listdir(directory):
+            if not name.startswith(base):
+                continue
+            match = pattern.fullmatch(name[len(base):])
+            if match:
+                found.append((tuple(int(g) for g in match.groups()), os.path.join(directory, name)))
+        return found
+
+    def _open_runs(self, directory):
+        """run 파일 열기 (병합 도중 멈춰 남은, 다른 run 에 포함된 run 과 임시 파일은 지움)"""
+        for name in os.listdir(directory):
+            if name.startswith(os.path.basename(self.path)) and name.endswith('.tmp'):
+                os.remove(os.path.join(directory, name))
+
+        runs = self._files(directory, self._RUN_NAME)
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            runs.append(((0, 0), self.path))   # 이전 형식의 정렬 배열 파일
+        for (lo, hi), run_path in sorted(runs, key=lambda item: (item[0][0], -item[0][1])):
+            if self._runs and lo >= self._runs[-1].lo and hi <= self._runs[-1].hi:
+                os.remove(run_path)   # 합친 run 으로 바꾼 뒤 지우지 못한 run
+                continue
+            self._runs.append(_SortedRun(run_path, lo, hi))
+        self._generation = max((run.hi for run in self._runs), default=0)
+
+    def _replay_logs(self, directory):
+        """아직 run 에 반영하지 않은 추가 로그 읽기 (이미 반영된 지문은 건너뜀)"""
+        logs = [((self._generation + 1,), self.path + '.log')] if os.path.exists(self.path + '.log') else []
+        logs += self._files(directory, self._LOG_NAME)
+        replayed = 0
+        for (generation,), log_path in sorted(logs):
+            if generation <= self._generation:
+                os.remove(log_path)   # run 으로 옮긴 뒤 지우지 못한 로그
+                continue
+            entries = array('Q')
+            with open(log_path, 'rb') as fp:
+                data = fp.read()
+            entries.frombytes(data[:len(data) - len(data) % self.ITEM_SIZE])
+            for fingerprint in entries:
+                if fingerprint not in self._pending and not self._in_index(fingerprint):
+                    self._pending.add(fingerprint)
+                    replayed += 1
+        self.stats['log_replayed'] = replayed
+
+    def _in_index(self, fingerprint):
+        return any(fingerprint in run for run in self._runs)
+
+    def __contains__(self, url):
+        fingerprint = url_fingerprint(url)
+        with self._lock:
+            return fingerprint in self._pending or self._in_index(fingerprint)
+
+    def add(self, url):
+        fingerprint = url_fingerprint(url)
+        with self._lock:
+            if fingerprint in self._pending or self._in_index(fingerprint):
+                return
+            self._pending.add(fingerprint)
+            self._log.write(struct.pack('Q', fingerprint))
+            if len(self._pending) >= self.merge_threshold:
+                self.merge()
+
+    def update(self, urls):
+        for url in urls:
+            self.add(url)
+
+    @staticmethod
+    def _write_sorted(out, large, small):
+        """정렬된 두 배열을 합쳐 쓰기 (작은 쪽 지문마다 큰 쪽의 구간을 바이트 단위로 그대로 복사)"""
+        start = 0
+        for fingerprint in small:
+            pos = bisect.bisect_left(large, fingerprint, start) if large is not None else 0
+            if pos > start:
+                out.write(large[start:pos])
+            if large is None or pos == len(large) or large[pos] != fingerprint:
+                out.write(struct.pack('Q', fingerprint))
+            start = pos
+        if large is not None and start < len(large):
+            out.write(large[start:])
+
+    def merge(self):
+        """추가 로그의 지문을 새 run 으로 쓰고 (rename 으로 로그를 비움), 크기가 비슷한 run 끼리 합침"""
+        with self._lock:
+            if not self._pending:
+                return
+            generation = self._generation + 1
+            run_path = self._run_path(generation, generation)
+            with open(run_path + '.tmp', 'wb') as out:
+                out.write(array('Q', sorted(self._pending)).tobytes())
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(run_path + '.tmp', run_path)   # 이 시점부터 이 세대의 로그는 반영된 것
+            self._runs.append(_SortedRun(run_path, generation, generation))
+            self._generation = generation
+
+            self._log.close()
+            os.remove(self._log_path(generation))
+            if os.path.exists(self.path + '.log'):
+                os.remove(self.path + '.log')
+            self._log = open(self._log_path(generation + 1), 'ab')
+            self._pending.clear()
+            self.stats['merges'] += 1
+            self._compact()
+
+    def _compact(self):
+        """마지막 run 이 바로 앞 run 의 1/size_ratio 보다 크면 둘을 합침 (run 크기가 기하급수로 유지됨)"""
+        while len(self._runs) >= 2 and len(self._runs[-1]) * self.size_ratio >= len(self._runs[-2]):
+            older, newer = self._runs[-2], self._runs[-1]
+            run_path = self._run_path(older.lo, newer.hi)
+            large, small = (older, newer) if len(older) >= len(newer) else (newer, older)
+            with open(run_path + '.tmp', 'wb') as out:
+                self._write_sorted(out, large.view, small.view if small.view is not None else ())
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(run_path + '.tmp', run_path)
+            self._runs[-2:] = [_SortedRun(run_path, older.lo, newer.hi)]
+            for run in (older, newer):
+                run.close()
+                os.remove(run.path)
+            self.stats['compactions'] += 1
+
+    def flush(self):
+        """추가 로그를 디스크에 기록"""
+        with self._lock:
+            self._log.flush()
+
+    def close(self):
+        with self._lock:
+            self._log.close()
+            for run in self._runs:
+                run.close()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(run) for run in self._runs) + len(self._pending)
+
+    def get_statistics(self):
+        with self._lock:
+            indexed = sum(len(run) for run in self._runs)
+            return {
+                'type': 'mmap',
+                'count': indexed + len(self._pending),
+                'indexed': indexed,
+                'runs': len(self._runs),
+                'pending_log': len(self._pending),
+                'size_bytes': indexed * self.ITEM_SIZE,
+                'merges': self.stats['merges'],
+                'compactions': self.stats['compactions'],
+                'log_replayed': self.stats['log_replayed']
+            }
+
+
+def create_seen_set(config=None):
+    """
+    seen 집합 생성
+
+    config 가 없거나 type 이 'exact' 면 일반 set, 'bloom' 이면 ScalableBloomFilter,
+    'mmap' 이면 FingerprintIndex.
+    """
+    config = dict(config or {})
+    kind = config.pop('type', 'exact')
+    path = config.pop('file', None)
+    if kind == 'exact':
+        return set()
+    if kind == 'bloom':
+        return ScalableBloomFilter(**config)
+    if kind == 'mmap':
+        return FingerprintIndex(path or 'seen_urls.idx', **config)
+    raise ValueError(f"알 수 없는 seen 집합 종류: {kind}")
+
+
+def seen_set_statistics(seen):
+    """seen 집합 종류와 크기"""
+    if isinstance(seen, set):
+        return {'type': 'exact', 'count': len(seen)}
+    return seen.get_statistics()
@@ -0,0 +1,233 @@
+import os
+import json
+import time
+import zlib
+import logging
+import threading
+import multiprocessing
+from queue import Empty
+from urllib.parse import urlparse
+from advanced_crawler import AdvancedWebCrawler
+
+
+logger = logging.getLogger(__name__)
+
+# 샤드마다 따로 써야 하는 파일 경로 설정 (값이 없으면 AdvancedWebCrawler 의 기본값)
+SHARD_FILE_KEYS = {
+    'output_file': None,
+    'cache_file': None,
+    'robots_cache_file': 'robots_cache.json',
+    'response_cache_file': None,
+    'frontier_file': None,
+    'sitemap_state_file': 'sitemap_state.json',
+    'checkpoint_dir': None
+}
+
+
+def shard_of(url, num_shards):
+    """
+    URL 호스트의 샤드 번호 (프로세스마다 같은 값이 나오도록 crc32 사용)
+
+    호스트별 요청 간격 / 동시 요청 수는 샤드 안의 HostScheduler 가 지키므로 호스트 하나는
+    항상 한 샤드에만 속해야 한다. 그래서 URL 단위가 아니라 호스트 단위로 나눈다.
+    """
+    return zlib.crc32(urlparse(url).netloc.encode('utf-8')) % num_shards
+
+
+def _shard_path(path, index):
+    root, ext = os.path.splitext(path)
+    return f"{root}.shard{index}{ext}"
+
+
+def shard_config(config, index):
+    """샤드 프로세스용 설정 (파일 경로에 샤드 번호를 붙임)"""
+    config = dict(config)
+    for key, default in SHARD_FILE_KEYS.items():
+        path = config.get(key, default)
+        if path:
+            config[key] = _shard_path(path, index)
+    seen_set = config.get('seen_set')
+    if isinstance(seen_set, dict) and seen_set.get('file'):
+        config['seen_set'] = dict(seen_set, file=_shard_path(seen_set['file'], index))
+    # 샤드 프로세스가 이미 파싱을 나누어 하고, daemon 프로세스는 자식 프로세스를 만들 수 없음
+    config['parse_processes'] = 0
+    return config
+
+
+class ShardCrawler(AdvancedWebCrawler):
+    """
+    샤드 하나를 맡는 크롤러 (워커 프로세스 안에서 실행)
+
+    자기 샤드에 속한 호스트의 URL만 가져오고, 다른 샤드 호스트의 링크는 그 샤드의
+    inbox 로 보낸다. max_pages 는 모든 샤드가 공유하는 카운터로 센다.
+    """
+
+    def __init__(self, config, index, inboxes, counters):
+        super().__init__(config)
+        self.index = index
+        self.inboxes = inboxes
+        self.counters = counters
+        self._routed = set()     # 다른 샤드로 이미 보낸 URL (같은 링크를 반복해서 보내지 않음)
+        self._routed_lock = threading.Lock()
+
+    def _put_links(self, items):
+        local = []
+        routed = []
+        with self._routed_lock:
+            for url, depth, priority in items:
+                owner = shard_of(url, len(self.inboxes))
+                if owner == self.index:
+                    local.append((url, depth, priority))
+                elif url not in self._routed:
+                    self._routed.add(url)
+                    routed.append((owner, (url, depth, priority)))
+        super()._put_links(local)
+        if routed:
+            with self.counters['sent'].get_lock():
+                self.counters['sent'].value += len(routed)
+            for owner, item in routed:
+                self.inboxes[owner].put(item)
+
+    def _record_page(self, url, page_data, depth):
+        super()._record_page(url, page_data, depth)
+        with self.counters['pages'].get_lock():
+            self.counters['pages'].value += 1
+
+    def _page_budget_exhausted(self):
+        return self.counters['pages'].value >= self.config['max_pages']
+
+    def process_url(self, url, depth):
+        try:
+            return super().process_url(url, depth)
+        finally:
+            with self.counters['processed'].get_lock():
+                self.counters['processed'].value += 1
+
+    def _route_inbox(self):
+        """inbox 로 들어온 URL을 로컬 프론티어에 넣음 (None 이면 종료)"""
+        inbox = self.inboxes[self.index]
+        while True:
+            item = inbox.get()
+            if item is None:
+                break
+            url, depth, priority = item
+            with self.lock:
+                if url not in self.crawled_urls:
+                    self.url_queue.put((url, depth), priority=priority)
+            # 로컬 큐에 넣은 뒤에 세야 종료 판정에서 잃어버리는 URL이 없음
+            with self.counters['received'].get_lock():
+                self.counters['received'].value += 1
+
+    def crawl_shard(self, idle_flags):
+        """종료 신호가 올 때까지 샤드 크롤링"""
+        threads = []
+        for _ in range(self.config['max_workers']):
+            t = threading.Thread(target=self.worker, daemon=True)
+            t.start()
+            threads.append(t)
+        router = threading.Thread(target=self._route_inbox, daemon=True)
+        router.start()
+
+        while router.is_alive():
+            idle_flags[self.index] = 1 if self.url_queue.is_idle() else 0
+            router.join(0.05)
+
+        for _ in threads:
+            self.url_queue.put(None)
+        for t in threads:
+            t.join()
+
+        self.save_data()
+        self._save_cache()
+        self.robots_cache.save()
+        if self.frontier_store:
+            self.frontier_store.flush()
+        return {
+            'shard': self.index,
+            'pages': len(self.crawled_data),
+            'output_file': self.config['output_file']
+        }
+
+
+def _run_shard(config, index, inboxes, counters, idle_flags, results):
+    crawler = ShardCrawler(config, index, inboxes, counters)
+    try:
+        results.put(crawler.crawl_shard(idle_flags))
+    except Exception as e:
+        crawler.logger.error(f"샤드 {index} 에러: {e}")
+        results.put({'shard': index, 'pages': 0, 'output_file': None, 'error': str(e)})
+
+
+def run_sharded_crawl(config, start_urls, num_processes=None, poll_interval=0.3):
+    """
+    호스트 해시로 나눈 num_processes 개 프로세스에서 크롤링하고 결과 페이지 목록을 반환
+
+    각 프로세스는 자기 샤드 호스트만 가져오고 파싱하므로 여러 호스트에 걸친 크롤링은 파싱도
+    코어 수만큼 나누어 처리된다. 샤드는 호스트 단위라서 한 사이트만 크롤링하면 프로세스 하나가
+    모든 URL을 맡게 되므로, 이 경우에는 AdvancedWebCrawler 의 parse_processes 로 파싱을 나눈다.
+    모든 샤드가 한가하고, 보낸 URL 수와 받은 URL 수가 같은 상태가 두 번
+    연속 확인되면 종료한다. (spawn 방식이므로 스크립트에서는 if __name__ == '__main__' 안에서 호출)
+    """
+    if isinstance(start_urls, str):
+        start_urls = [start_urls]
+    num_processes = num_processes or os.cpu_count() or 1
+
+    ctx = multiprocessing.get_context('spawn')
+    inboxes = [ctx.Queue() for _ in range(num_processes)]
+    results = ctx.Queue()
+    counters = {name: ctx.Value('q', 0) for name in ('sent', 'received', 'processed', 'pages')}
+    idle_flags = ctx.Array('b', [0] * num_processes)
+
+    processes = [
+        ctx.Process(
+            target=_run_shard,
+            args=(shard_config(config, i), i, inboxes, counters, idle_flags, results),
+            daemon=True
+        )
+        for i in range(num_processes)
+    ]
+    for p in processes:
+        p.start()
+
+    for url in start_urls:
+        with counters['sent'].get_lock():
+            counters['sent'].value += 1
+        inboxes[shard_of(url, num_processes)].put((url, 0, 0))
+
+    def snapshot():
+        return (counters['sent'].value, counters['received'].value,
+                counters['processed'].value, all(idle_flags[:]))
+
+    previous = None
+    while True:
+        time.sleep(poll_interval)
+        current = snapshot()
+        sent, received, _, all_idle = current
+        if all_idle and sent == received and current == previous:
+            break
+        if not any(p.is_alive() for p in processes):
+            logger.error("모든 샤드 프로세스가 종료됨")
+            break
+        previous = current
+
+    for inbox in inboxes:
+        inbox.put(None)
+
+    summaries = []
+    for _ in processes:
+        try:
+            summaries.append(results.get(timeout=60))
+        except Empty:
+            break
+    for p in processes:
+        p.join(timeout=10)
+
+    pages = []
+    for summary in sorted(summaries, key=lambda s: s['shard']):
+        if summary.get('error'):
+            logger.error(f"샤드 {summary['shard']} 실패: {summary['error']}")
+        if not summary.get('output_file') or not os.path.exists(summary['output_file']):
+            continue
+        with open(summary['output_file'], 'r', encoding='utf-8') as f:
+            pages.extend(json.load(f)['pages'])
+    return pages, summaries
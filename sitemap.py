@@ -0,0 +1,183 @@
+import os
+import gzip
+import json
+import logging
+from urllib.parse import urljoin, urlparse
+from xml.etree.ElementTree import iterparse, ParseError
+
+
+logger = logging.getLogger(__name__)
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _local_name(tag):
+    """네임스페이스를 뗀 태그 이름"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _parse_priority(value):
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class _PrefixedStream:
+    """앞에서 미리 읽은 바이트를 되돌려 놓은 읽기 전용 스트림"""
+
+    def __init__(self, prefix, stream):
+        self._prefix = prefix
+        self._stream = stream
+
+    def read(self, size=-1):
+        if not self._prefix:
+            return self._stream.read(size)
+        if size is None or size < 0:
+            data, self._prefix = self._prefix + self._stream.read(), b''
+            return data
+        data, self._prefix = self._prefix[:size], self._prefix[size:]
+        if len(data) < size:
+            data += self._stream.read(size - len(data))
+        return data
+
+
+def iter_sitemap(stream):
+    """
+    사이트맵(또는 사이트맵 인덱스)을 스트리밍으로 파싱
+
+    ('url' | 'sitemap', {'loc', 'lastmod', 'priority'}) 를 차례로 돌려준다.
+    처리한 요소는 바로 비우므로 수십 MB 사이트맵도 메모리를 거의 쓰지 않는다.
+    gzip 으로 압축된 스트림은 첫 두 바이트로 알아보고 풀면서 읽는다.
+    """
+    head = stream.read(2)
+    source = _PrefixedStream(head, stream)
+    if head == GZIP_MAGIC:
+        source = gzip.GzipFile(fileobj=source)
+
+    root = None
+    for event, elem in iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            continue
+
+        name = _local_name(elem.tag)
+        if name not in ('url', 'sitemap'):
+            continue
+
+        entry = {'loc': None, 'lastmod': None, 'priority': None}
+        for child in elem:
+            key = _local_name(child.tag)
+            if key in entry and child.text:
+                entry[key] = child.text.strip()
+
+        elem.clear()
+        root.clear()
+        if entry['loc']:
+            yield name, entry
+
+
+class SitemapDiscovery:
+    """
+    사이트맵 탐색기
+
+    robots.txt 의 Sitemap 항목과 /sitemap.xml 에서 시작해 사이트맵 인덱스를 따라가며
+    URL 을 찾는다. 이전 실행에서 크롤링한 URL의 lastmod 를 state_file 에 저장해 두고,
+    lastmod 가 그대로인 URL은 건너뛴다. canonicalize 를 주면 <loc> 을 정규화한 URL로
+    상태를 찾고 돌려주므로, 정규화한 URL로 저장한 상태와 맞는다.
+    """
+
+    def __init__(self, open_stream, robots_cache=None, state_file=None,
+                 max_sitemaps=1000, max_urls=100000, canonicalize=None):
+        self.open_stream = open_stream    # open_stream(url) -> 바이너리 파일 객체 (실패 시 None)
+        self.canonicalize = canonicalize  # canonicalize(url) -> 정규화한 URL (URLCanonicalizer.canonicalize)
+        self.robots_cache = robots_cache
+        self.state_file = state_file
+        self.max_sitemaps = max_sitemaps
+        self.max_urls = max_urls
+        self.previous_lastmod = self._load_state()
+        self.stats = {
+            'sitemaps': 0,
+            'urls': 0,
+            'skipped_unchanged': 0,
+            'errors': 0
+        }
+
+    def _load_state(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"사이트맵 상태 로드 실패: {e}")
+            return {}
+
+    def save_state(self, crawled_lastmod):
+        """이번에 크롤링한 URL의 lastmod 를 이전 기록과 합쳐 저장"""
+        if not self.state_file:
+            return
+        state = dict(self.previous_lastmod)
+        state.update(crawled_lastmod)
+        try:
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+        except OSError as e:
+            logger.error(f"사이트맵 상태 저장 실패: {e}")
+
+    def candidate_sitemaps(self, start_url):
+        """robots.txt 의 Sitemap 과 기본 /sitemap.xml"""
+        parsed = urlparse(start_url)
+        base = f"{parsed.scheme}://{parsed.netloc}/"
+        candidates = []
+        if self.robots_cache:
+            candidates.extend(urljoin(base, url) for url in self.robots_cache.site_maps(start_url))
+        default = urljoin(base, 'sitemap.xml')
+        if default not in candidates:
+            candidates.append(default)
+        return candidates
+
+    def discover(self, start_url):
+        """같은 호스트의 사이트맵 URL 을 {'url', 'lastmod', 'priority'} 로 하나씩 돌려줌"""
+        host = urlparse(start_url).netloc
+        pending = self.candidate_sitemaps(start_url)
+        seen_sitemaps = set(pending)
+
+        while pending and self.stats['sitemaps'] < self.max_sitemaps:
+            sitemap_url = pending.pop(0)
+            stream = self.open_stream(sitemap_url)
+            if stream is None:
+                continue
+            self.stats['sitemaps'] += 1
+
+            try:
+                for kind, entry in iter_sitemap(stream):
+                    loc = urljoin(sitemap_url, entry['loc'])
+                    if kind == 'sitemap':
+                        if loc not in seen_sitemaps:
+                            seen_sitemaps.add(loc)
+                            pending.append(loc)
+                        continue
+
+                    if self.canonicalize is not None:
+                        loc = self.canonicalize(loc)
+                    if urlparse(loc).netloc != host:
+                        continue
+                    if entry['lastmod'] and self.previous_lastmod.get(loc) == entry['lastmod']:
+                        self.stats['skipped_unchanged'] += 1
+                        continue
+
+                    self.stats['urls'] += 1
+                    yield {
+                        'url': loc,
+                        'lastmod': entry['lastmod'],
+                        'priority': _parse_priority(entry['priority'])
+                    }
+                    if self.stats['urls'] >= self.max_urls:
+                        return
+            except (ParseError, OSError, EOFError, ValueError) as e:
+                self.stats['errors'] += 1
+                logger.warning(f"사이트맵 파싱 실패 {sitemap_url}: {e}")
+            finally:
+                stream.close()
@@ -0,0 +1,213 @@
+import codecs
+import hashlib
+from datetime import datetime
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse
+from requests.compat import chardet
+
+
+# </head> 까지만 읽어도 채워지는 필드
+HEAD_FIELDS = frozenset(['title', 'meta_description', 'meta_keywords', 'meta_robots'])
+
+_HEADER_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+_TEXT_EXCLUDED_TAGS = frozenset(['script', 'style', 'nav', 'footer'])
+_VOID_TAGS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+    'param', 'source', 'track', 'wbr'
+])
+
+
+def incremental_decoder(encoding, first_chunk=b''):
+    """
+    본문 조각을 차례로 디코딩하는 decoder
+
+    인코딩을 모르면 첫 조각으로 추측하고, 알 수 없는 인코딩이면 utf-8 을 쓴다 (잘못된 바이트는 대체 문자).
+    """
+    if encoding is None:
+        encoding = chardet.detect(first_chunk)['encoding'] or 'utf-8'
+    try:
+        return codecs.getincrementaldecoder(encoding)(errors='replace')
+    except LookupError:
+        return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+
+class _Element:
+    """열려 있는 요소 (텍스트를 모아야 하는 title / h1~h6 / a 만 parts 를 가짐)"""
+
+    __slots__ = ('tag', 'parts', 'attrs')
+
+    def __init__(self, tag, parts=None, attrs=None):
+        self.tag = tag
+        self.parts = parts
+        self.attrs = attrs
+
+
+class StreamingPageParser(HTMLParser):
+    """
+    본문을 받는 대로 feed 로 넣어 파싱하는 페이지 파서
+
+    결과는 advanced_crawler.parse_html 과 같은 형식이며, 트리를 만들지 않고 필요한 값만 모은다.
+    링크는 찾는 즉시 on_links(링크 목록) 으로 link_batch 개씩 넘긴다.
+    fields 가 모두 HEAD_FIELDS 이면 </head> 에서, max_links 개의 링크를 찾으면 그 자리에서 done 이 되어
+    더 읽을 필요가 없다. content_hash 는 읽은 부분까지의 해시이다.
+    """
+
+    def __init__(self, url, fields=None, max_links=None, on_links=None, link_batch=10):
+        super().__init__(convert_charrefs=True)
+        self.url = url
+        self.head_only = bool(fields) and set(fields) <= HEAD_FIELDS
+        self.max_links = max_links
+        self.on_links = on_links
+        self.link_batch = link_batch
+        self.done = False
+        self.links_emitted = 0
+
+        self._hash = hashlib.md5()
+        self._stack = []
+        self._excluded = 0            # 열려 있는 script / style / nav / footer 수
+        self._text = []               # 태그 사이 텍스트 (feed 경계에서 잘린 조각을 모음)
+        self._strings = []            # 본문 텍스트 (strip 된 조각)
+        self._pending_links = []
+        self._title_seen = False
+        self.page_data = {
+            'url': url,
+            'content_hash': '',
+            'title': '',
+            'timestamp': datetime.now().isoformat(),
+            'links': [],
+            'text_content': '',
+            'meta_description': '',
+            'meta_keywords': [],
+            'images': [],
+            'headers': {tag: [] for tag in _HEADER_TAGS},
+            'word_count': 0
+        }
+
+    def feed(self, data):
+        self._hash.update(data.encode())
+        super().feed(data)
+
+    def _flush_text(self):
+        """모아 둔 텍스트 조각을 문자열 하나로 처리"""
+        if not self._text:
+            return
+        text = ''.join(self._text)
+        self._text = []
+        stripped = text.strip()
+        for element in self._stack:
+            if element.parts is not None:
+                element.parts.append(stripped if element.tag != 'title' else text)
+        if stripped and not self._excluded:
+            self._strings.append(stripped)
+
+    def handle_data(self, data):
+        self._text.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        attrs = {name: value if value is not None else '' for name, value in attrs}
+
+        if tag == 'meta':
+            name = attrs.get('name', '').lower()
+            content = attrs.get('content', '')
+            if name == 'description':
+                self.page_data['meta_description'] = content
+            elif name == 'keywords':
+                self.page_data['meta_keywords'] = [kw.strip() for kw in content.split(',')]
+            elif name == 'robots':
+                self.page_data['meta_robots'] = content
+        elif tag == 'img':
+            if 'src' in attrs:
+                self.page_data['images'].append({
+                    'src': urljoin(self.url, attrs['src']),
+                    'alt': attrs.get('alt', '')
+                })
+        elif tag == 'body' and self.head_only:
+            self.done = True
+
+        if tag in _VOID_TAGS:
+            return
+
+        parts = [] if tag in ('title', 'a') or tag in self.page_data['headers'] else None
+        self._stack.append(_Element(tag, parts, attrs if tag == 'a' else None))
+        if tag in _TEXT_EXCLUDED_TAGS:
+            self._excluded += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag == 'head' and self.head_only:
+            self.done = True
+        # 짝이 맞는 가장 가까운 요소까지 닫음 (짝이 없는 닫는 태그는 무시)
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index].tag == tag:
+                break
+        else:
+            return
+        while len(self._stack) > index:
+            self._close_element(self._stack.pop())
+
+    def _close_element(self, element):
+        tag = element.tag
+        if tag in _TEXT_EXCLUDED_TAGS:
+            self._excluded -= 1
+        if element.parts is None:
+            return
+        if tag == 'title':
+            if not self._title_seen:
+                # BeautifulSoup 의 title.string 과 같이 문자열이 하나일 때만 값이 있음
+                self._title_seen = True
+                self.page_data['title'] = element.parts[0] if len(element.parts) == 1 else None
+        elif tag == 'a':
+            # parse_html 과 같이 nav / footer 안의 링크는 제외
+            if not self._excluded:
+                self._add_link(element.attrs, ''.join(element.parts))
+        else:
+            self.page_data['headers'][tag].append(''.join(element.parts))
+
+    def _add_link(self, attrs, text):
+        href = attrs.get('href')
+        # done 이후 같은 feed 조각 안에서 나온 링크는 버림 (max_links 를 넘지 않도록)
+        if href is None or self.done:
+            return
+        absolute_url = urljoin(self.url, href)
+        # 같은 도메인의 링크만 수집
+        if urlparse(absolute_url).netloc != urlparse(self.url).netloc:
+            return
+        link_info = {'url': absolute_url, 'text': text, 'title': attrs.get('title', '')}
+        if attrs.get('type'):
+            link_info['type'] = attrs['type']
+        self.page_data['links'].append(link_info)
+        self._pending_links.append(link_info)
+        if len(self._pending_links) >= self.link_batch:
+            self._emit_links()
+        if self.max_links and len(self.page_data['links']) >= self.max_links:
+            self.done = True
+
+    def _emit_links(self):
+        if self._pending_links and self.on_links:
+            links, self._pending_links = self._pending_links, []
+            self.links_emitted += len(links)
+            self.on_links(links)
+
+    def close(self):
+        """남은 입력을 처리하고 페이지 데이터 반환 (남은 링크도 on_links 로 넘김)"""
+        super().close()
+        self._flush_text()
+        while self._stack:
+            self._close_element(self._stack.pop())
+        self._emit_links()
+
+        page_data = self.page_data
+        page_data['content_hash'] = self._hash.hexdigest()
+        text_content = ' '.join(self._strings)
+        page_data['text_content'] = text_content
+        page_data['word_count'] = len(text_content.split())
+        return page_data
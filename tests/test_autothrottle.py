@@ -0,0 +1,20 @@
+import requests
+
+from autothrottle import AutoThrottle
+
+
+def test_error_on_fresh_host_does_not_change_limit():
+    throttle = AutoThrottle(start_concurrency=2)
+    throttle.record('http://h/a', 0.1, error=requests.HTTPError())
+    throttle.record('http://h/b', 0.1, error=requests.TooManyRedirects())
+
+    assert throttle.limit('h') == 2
+    assert throttle.get_statistics()['hosts']['h']['ewma_latency'] is None
+
+
+def test_success_increases_and_overload_decreases():
+    throttle = AutoThrottle(start_concurrency=1, max_concurrency=4)
+    throttle.record('http://h/a', 0.1, status=200)
+    assert throttle.limit('h') == 2
+    throttle.record('http://h/a', 0.1, status=503)
+    assert throttle.limit('h') == 1
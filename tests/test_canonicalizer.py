@@ -0,0 +1,20 @@
+from advanced_crawler import parse_html
+from canonicalizer import URLCanonicalizer
+
+
+def test_duplicates_removed_counts_unique_variants():
+    canonicalizer = URLCanonicalizer(trailing_slash='strip')
+    for url in ('http://a.com/x', 'http://a.com/x/', 'http://a.com/x/', 'http://A.com/x?utm_source=y',
+                'http://a.com/x', 'http://a.com/y/'):
+        canonicalizer.canonicalize(url)
+
+    stats = canonicalizer.get_statistics()
+    assert stats['duplicates_removed'] == 2
+    assert stats['rewritten'] == 4
+
+
+def test_relative_links_resolve_under_directory_url():
+    url = URLCanonicalizer().canonicalize('http://a.com/docs/')
+    assert url == 'http://a.com/docs/'
+    page = parse_html(url, '<html><body><a href="intro.html">intro</a></body></html>')
+    assert [link['url'] for link in page['links']] == ['http://a.com/docs/intro.html']
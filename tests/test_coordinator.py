@@ -0,0 +1,107 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from coordinator import CoordinatedCrawler, CoordinatorServer, CrawlCoordinator
+
+
+PAGES = {
+    '/': ['/a', '/b', '/bad'],
+    '/a': ['/c'],
+    '/b': ['/c'],
+    '/c': [],
+    '/bad': ['/a'],
+}
+
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        links = ''.join(f'<a href="{href}">{href}</a>' for href in PAGES.get(self.path, []))
+        body = f'<html><head><title>{self.path}</title></head><body>{links}</body></html>'.encode('utf-8')
+        self.send_response(200 if self.path in PAGES else 404)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FailingPageCrawler(CoordinatedCrawler):
+    """/bad 페이지 처리 중 파싱 오류를 흉내 내는 노드"""
+
+    def _handle_page(self, url, depth, page_data):
+        if url.endswith('/bad'):
+            raise ValueError('파싱 실패')
+        super()._handle_page(url, depth, page_data)
+
+
+def test_two_nodes_finish_when_a_page_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    site = ThreadingHTTPServer(('127.0.0.1', 0), _SiteHandler)
+    threading.Thread(target=site.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{site.server_address[1]}'
+
+    coordinator = CrawlCoordinator(max_pages=100, num_partitions=4)
+    coordinator.add_urls([(base + '/', 0)])
+    server = CoordinatorServer(coordinator, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    nodes = []
+    for i in range(2):
+        config = {
+            'delay_range': (0, 0),
+            'max_pages': 100,
+            'max_depth': 3,
+            'max_workers': 2,
+            'timeout': 5,
+            'respect_robots': False,
+            'output_file': str(tmp_path / f'node{i}.json'),
+            'cache_file': str(tmp_path / f'node{i}.cache.json'),
+            'robots_cache_file': str(tmp_path / 'robots_cache.json'),
+            'report_interval': 0.1
+        }
+        node = FailingPageCrawler(config, server.server_address, node_id=f'node{i}')
+        thread = threading.Thread(target=node.crawl_node, daemon=True)
+        thread.start()
+        nodes.append(thread)
+
+    try:
+        for thread in nodes:
+            thread.join(timeout=30)
+        stats = coordinator.get_statistics()
+        assert not any(thread.is_alive() for thread in nodes)
+        assert stats['done']
+        assert stats['in_lease'] == 0
+        assert stats['pages'] == 4
+    finally:
+        server.shutdown()
+        server.server_close()
+        site.shutdown()
+        site.server_close()
+
+
+def test_partition_waits_for_previous_owner_leases():
+    coordinator = CrawlCoordinator(num_partitions=1, batch_size=1)
+    coordinator.add_urls([('http://a.com/1', 0), ('http://a.com/2', 0)])
+    assert coordinator.lease('node-b')['items'] == [('http://a.com/1', 0)]
+
+    # node-a 가 들어오며 파티션 주인이 바뀌어도 node-b 의 lease 가 끝나기 전에는 빌려주지 않음
+    assert coordinator.lease('node-a')['items'] == []
+    coordinator.report('node-b', completed=['http://a.com/1'])
+    assert coordinator.lease('node-a')['items'] == [('http://a.com/2', 0)]
+
+
+def test_reaped_node_is_revoked_and_cannot_complete_reassigned_url():
+    coordinator = CrawlCoordinator(num_partitions=1, lease_timeout=0)
+    coordinator.add_urls([('http://a.com/1', 0)])
+    assert coordinator.lease('node-a')['items'] == [('http://a.com/1', 0)]
+    assert coordinator.reap() == 1
+
+    coordinator.lease_timeout = 60
+    assert coordinator.lease('node-b')['items'] == [('http://a.com/1', 0)]
+    response = coordinator.report('node-a', completed=['http://a.com/1'])
+    assert response['revoked']
+    assert coordinator.get_statistics()['in_lease'] == 1
+    coordinator.report('node-b', completed=['http://a.com/1'])
+    assert coordinator.get_statistics()['done']
@@ -0,0 +1,20 @@
+from frontier import PriorityFrontier, URLFrontier
+from seen_set import ScalableBloomFilter
+
+
+def test_frontier_dedups_with_given_seen_set():
+    seen = ScalableBloomFilter(initial_capacity=100)
+    frontier = URLFrontier(seen=seen)
+    assert frontier.push('http://a.com/', 0)
+    assert not frontier.push('http://a.com/', 1)
+    assert frontier.seen is seen
+    assert 'http://a.com/' in seen
+
+
+def test_priority_frontier_is_pending():
+    frontier = PriorityFrontier(seen=set())
+    frontier.push('http://a.com/x', 1, priority=1.0)
+    assert frontier.is_pending('http://a.com/x')
+    assert frontier.pop() == ('http://a.com/x', 1)
+    assert not frontier.is_pending('http://a.com/x')
+    assert frontier.is_duplicate('http://a.com/x')
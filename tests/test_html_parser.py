@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from advanced_crawler import parse_html
+from html_parser import available_parsers, make_soup
+from page_analyzer import PageAnalyzer
+from parser_benchmark import REFERENCE_PARSER, sample_pages
+
+
+BACKENDS = [parser for parser in available_parsers() if parser != REFERENCE_PARSER]
+
+
+def _strip_volatile(data):
+    return {key: value for key, value in data.items() if key not in ('timestamp', 'content_hash')}
+
+
+def _analyze(url, html, parser):
+    # character_count 는 태그 사이 공백까지 세므로 파서마다 다를 수 있어 비교하지 않음
+    analysis = PageAnalyzer(url).analyze(make_soup(html, parser))
+    analysis['extracted_data']['content_analysis'].pop('character_count')
+    return {f'{section}.{key}': value for section, fields in analysis.items() for key, value in fields.items()}
+
+
+@pytest.fixture
+def extractors(tmp_path, monkeypatch):
+    """검사할 추출 경로 {이름: (url, html, parser) -> dict}"""
+    monkeypatch.chdir(tmp_path)
+    from web_crawler import WebCrawler
+    basic = WebCrawler(output_file=os.devnull)
+
+    def basic_extract(url, html, parser):
+        basic.parser = parser
+        return basic.parse_page(url, html)
+
+    return {
+        'WebCrawler.parse_page': basic_extract,
+        'AdvancedWebCrawler.parse_page': parse_html,
+        'PageAnalyzer.analyze': _analyze
+    }
+
+
+def _assert_same_as_reference(extract, parser):
+    for name, url, html in sample_pages():
+        expected = _strip_volatile(extract(url, html, REFERENCE_PARSER))
+        actual = _strip_volatile(extract(url, html, parser))
+        assert actual == expected, name
+
+
+@pytest.mark.skipif(not BACKENDS, reason='html.parser 외에 설치된 파서 없음')
+@pytest.mark.parametrize('parser', BACKENDS)
+@pytest.mark.parametrize('name', ['WebCrawler.parse_page', 'AdvancedWebCrawler.parse_page', 'PageAnalyzer.analyze'])
+def test_extraction_matches_reference_parser(extractors, name, parser):
+    _assert_same_as_reference(extractors[name], parser)
+
+
+@pytest.mark.skipif(not BACKENDS, reason='html.parser 외에 설치된 파서 없음')
+@pytest.mark.parametrize('parser', BACKENDS)
+@pytest.mark.parametrize('module, cls_name', [
+    ('cute_gui_crawler', 'CuteCrawlerThread'),
+    ('advanced_gui_crawler', 'AdvancedCrawlerThread')
+])
+def test_gui_extraction_matches_reference_parser(module, cls_name, parser):
+    pytest.importorskip('PyQt5')
+    cls = getattr(pytest.importorskip(module), cls_name)
+
+    def extract(url, html, backend):
+        return cls(url).extract_basic_info(make_soup(html, backend))
+
+    _assert_same_as_reference(extract, parser)
@@ -0,0 +1,53 @@
+from queue import Empty
+
+import pytest
+
+from autothrottle import AutoThrottle
+from instrumented_lock import InstrumentedLock
+from politeness import HostScheduler
+
+
+def test_autothrottle_cap_holds_when_host_queue_drains():
+    """크롤 후 링크를 넣는 패턴(put/get 반복)에서도 호스트 동시 요청 한도를 지킴"""
+    throttle = AutoThrottle(start_concurrency=1, max_concurrency=1)
+    scheduler = HostScheduler(delay_range=None, throttle=throttle)
+
+    scheduler.put(('http://h/0', 0))
+    assert scheduler.get(block=False) == ('http://h/0', 0)
+    for i in range(1, 4):
+        scheduler.put(('http://h/%d' % i, 1))
+        try:
+            scheduler.get(block=False)
+        except Empty:
+            pass
+
+    assert scheduler._in_flight == {'h': 1}
+    assert scheduler.get_statistics()['saturated_hosts'] == 1
+
+    scheduler.release('http://h/0')
+    assert scheduler.get(block=False) == ('http://h/1', 1)
+    assert scheduler._in_flight == {'h': 1}
+
+
+def test_requeued_url_keeps_single_entry_and_raises_priority():
+    scheduler = HostScheduler(delay_range=None)
+    scheduler.put(('http://h/a', 1), priority=1.0)
+    scheduler.put(('http://h/b', 1), priority=2.0)
+    scheduler.put_many([('http://h/a', 1, 3.0), ('http://h/b', 1, 0.5)])
+
+    assert scheduler.qsize() == 2
+    assert scheduler.get(block=False) == ('http://h/a', 1)
+    assert scheduler.get(block=False) == ('http://h/b', 1)
+    with pytest.raises(Empty):
+        scheduler.get(block=False)
+    scheduler.task_done()
+    scheduler.task_done()
+    assert scheduler.is_idle()
+
+
+def test_lock_statistics_reports_instrumented_lock_only():
+    assert HostScheduler(delay_range=None).lock_statistics() == {}
+
+    scheduler = HostScheduler(delay_range=None, lock=InstrumentedLock('frontier'))
+    scheduler.put(('http://a.com/1', 0))
+    assert scheduler.lock_statistics()['frontier']['acquisitions'] >= 1
@@ -0,0 +1,39 @@
+import sqlite3
+
+from response_cache import ResponseCache
+
+
+class _Response:
+    def __init__(self, content=b'', headers=None, status_code=200):
+        self.content = content
+        self.headers = headers or {}
+        self.status_code = status_code
+
+
+def test_reuse_counts_stored_body_size(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.db'))
+    cache.store('http://a.com/x', _Response(b'x' * 1000, {'ETag': '"v1"'}), {'url': 'http://a.com/x'})
+
+    assert cache.conditional_headers('http://a.com/x') == {'If-None-Match': '"v1"'}
+    page_data = cache.reuse('http://a.com/x', _Response(status_code=304))
+    assert page_data['not_modified']
+    assert cache.get_statistics()['bytes_saved'] == 1000
+    cache.close()
+
+
+def test_opens_cache_written_with_bodies(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    conn = sqlite3.connect(path)
+    conn.execute(
+        'CREATE TABLE responses (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+        'body BLOB, page_data TEXT, updated_at TEXT)'
+    )
+    conn.execute("INSERT INTO responses VALUES ('http://a.com/', '\"v1\"', NULL, x'00', '{}', '')")
+    conn.commit()
+    conn.close()
+
+    cache = ResponseCache(path)
+    assert cache.reuse('http://a.com/', _Response(status_code=304)) is not None
+    cache.store('http://a.com/y', _Response(b'abc', {'ETag': '"v2"'}), {})
+    assert cache.get('http://a.com/y')['body_size'] == 3
+    cache.close()
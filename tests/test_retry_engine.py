@@ -0,0 +1,28 @@
+import time
+
+from retry_engine import CircuitBreaker
+
+
+def test_half_open_allows_single_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    now = time.monotonic()
+    breaker.record_failure(now)
+    assert not breaker.allow_request(now)
+
+    later = now + 11
+    assert breaker.allow_request(later)
+    assert not breaker.allow_request(later)
+
+    breaker.record_success()
+    assert breaker.allow_request(later)
+    assert breaker.allow_request(later)
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    now = time.monotonic()
+    breaker.record_failure(now)
+    assert breaker.allow_request(now + 11)
+    breaker.record_failure(now + 11)
+    assert breaker.state == 'open'
+    assert not breaker.allow_request(now + 12)
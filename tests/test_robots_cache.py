@@ -0,0 +1,41 @@
+import json
+import time
+
+from robots_cache import RobotsCache
+
+
+def _cache(tmp_path, responses, **kwargs):
+    calls = []
+
+    def fetch(robots_url):
+        calls.append(robots_url)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    cache = RobotsCache(fetch, cache_file=str(tmp_path / 'robots.json'), **kwargs)
+    return cache, calls
+
+
+def test_server_error_disallows_and_is_retried(tmp_path):
+    cache, calls = _cache(tmp_path, [(503, ''), (200, 'User-agent: *\nDisallow: /private')], retry_ttl=60)
+    assert not cache.can_fetch('http://a.com/page')
+    assert not cache.can_fetch('http://a.com/other')
+    assert len(calls) == 1
+
+    cache._entries['a.com']['fetched_at'] = time.time() - 61
+    assert cache.can_fetch('http://a.com/page')
+    assert not cache.can_fetch('http://a.com/private')
+    assert len(calls) == 2
+
+
+def test_fetch_failure_is_not_persisted(tmp_path):
+    cache, _ = _cache(tmp_path, [ConnectionError('reset'), (404, '')])
+    assert not cache.can_fetch('http://a.com/page')
+    assert cache.can_fetch('http://b.com/page')
+    cache.save()
+
+    with open(tmp_path / 'robots.json', encoding='utf-8') as f:
+        assert list(json.load(f)) == ['b.com']
+    assert cache.get_statistics()['failures'] == 1
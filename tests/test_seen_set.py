@@ -0,0 +1,52 @@
+import os
+import shutil
+
+from seen_set import FingerprintIndex
+
+
+def _urls(start, stop):
+    return [f'http://a.com/page{i}' for i in range(start, stop)]
+
+
+def test_merge_keeps_runs_logarithmic(tmp_path):
+    index = FingerprintIndex(str(tmp_path / 'seen.idx'), merge_threshold=10)
+    index.update(_urls(0, 160))
+
+    stats = index.get_statistics()
+    assert stats['count'] == 160
+    assert stats['merges'] == 16
+    assert stats['runs'] <= 5
+    assert all(url in index for url in _urls(0, 160))
+    assert 'http://a.com/other' not in index
+    index.close()
+
+
+def test_reopen_replays_only_unmerged_log(tmp_path):
+    path = str(tmp_path / 'seen.idx')
+    index = FingerprintIndex(path, merge_threshold=10)
+    index.update(_urls(0, 25))
+    index.close()
+
+    reopened = FingerprintIndex(path, merge_threshold=10)
+    assert len(reopened) == 25
+    assert reopened.get_statistics()['log_replayed'] == 5
+    assert all(url in reopened for url in _urls(0, 25))
+    reopened.close()
+
+
+def test_stale_log_after_merge_is_not_replayed(tmp_path):
+    path = str(tmp_path / 'seen.idx')
+    index = FingerprintIndex(path, merge_threshold=1000)
+    index.update(_urls(0, 5))
+    index.flush()
+    # rename 직후 로그를 지우기 전에 멈춘 상황
+    shutil.copy(path + '.1.log', str(tmp_path / 'saved.log'))
+    index.merge()
+    index.close()
+    shutil.copy(str(tmp_path / 'saved.log'), path + '.1.log')
+
+    reopened = FingerprintIndex(path, merge_threshold=1000)
+    assert len(reopened) == 5
+    assert reopened.get_statistics()['log_replayed'] == 0
+    assert not os.path.exists(path + '.1.log')
+    reopened.close()
@@ -0,0 +1,32 @@
+import io
+import json
+
+from canonicalizer import URLCanonicalizer
+from sitemap import SitemapDiscovery
+
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>http://a.com/sm/0/</loc><lastmod>2024-01-01</lastmod></url>
+  <url><loc>http://A.com:80/sm/1?utm_source=x</loc><lastmod>2024-01-01</lastmod></url>
+  <url><loc>http://a.com/sm/2/</loc><lastmod>2024-02-01</lastmod></url>
+</urlset>
+"""
+
+
+def test_unchanged_lastmod_matches_canonical_state(tmp_path):
+    state_file = tmp_path / 'sitemap_state.json'
+    state_file.write_text(json.dumps({
+        'http://a.com/sm/0': '2024-01-01',
+        'http://a.com/sm/1': '2024-01-01',
+        'http://a.com/sm/2': '2024-01-01'
+    }))
+    discovery = SitemapDiscovery(
+        lambda url: io.BytesIO(SITEMAP) if url.endswith('/sitemap.xml') else None,
+        state_file=str(state_file),
+        canonicalize=URLCanonicalizer(trailing_slash='strip').canonicalize
+    )
+
+    entries = list(discovery.discover('http://a.com/'))
+    assert [entry['url'] for entry in entries] == ['http://a.com/sm/2']
+    assert discovery.stats['skipped_unchanged'] == 2
@@ -0,0 +1,12 @@
+from url_filter import URLFilter
+
+
+def test_saved_fetches_counts_unique_urls():
+    url_filter = URLFilter()
+    for url in ('http://a.com/x.pdf', 'http://a.com/x.pdf', 'mailto:a@a.com', 'http://a.com/page'):
+        url_filter.allows(url)
+
+    stats = url_filter.get_statistics()
+    assert stats['blocked_extension'] == 2
+    assert stats['blocked_scheme'] == 1
+    assert stats['saved_fetches'] == 2
@@ -0,0 +1,133 @@
+import re
+import math
+import threading
+from collections import Counter
+from urllib.parse import urlsplit
+
+
+_HEX_ID = re.compile(r'[0-9a-f]{16,}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE)
+_NUMBER = re.compile(r'\d+')
+
+
+def url_template(url):
+    """URL 패턴 (숫자는 {n}, 긴 16진수 ID 는 {id}, 쿼리는 파라미터 이름만)"""
+    parts = urlsplit(url)
+    path = _NUMBER.sub('{n}', _HEX_ID.sub('{id}', parts.path))
+    keys = sorted({p.split('=', 1)[0] for p in parts.query.split('&') if p})
+    template = f"{parts.netloc}{path}"
+    if keys:
+        template += '?' + '&'.join(keys)
+    return template
+
+
+class CrawlTrapDetector:
+    """
+    크롤러 트랩 / 무한 URL 공간 탐지
+
+    링크를 큐에 넣기 전에 확인해서 다음 경우를 막는다.
+    - 같은 경로 조각이 반복되는 URL (/a/b/a/b/..., 상대 경로 재귀)
+    - 한 경로에서 쿼리 조합이 끝없이 늘어나는 경우 (필터 / 정렬 / 세션 ID / 페이지 번호)
+    - 한 URL 패턴(달력처럼 숫자만 바뀌는 경로 등)에 max_urls_per_template 개를 넘게 들어오는 경우
+    - 지금까지 본 URL보다 비정상적으로 긴 URL
+    막은 패턴은 get_statistics 의 throttled_patterns 로 확인한다.
+    """
+
+    def __init__(self, max_repeated_segments=2, max_path_depth=15, max_query_variants=100,
+                 max_urls_per_template=1000, max_url_length=1024, length_outlier_sigma=4.0,
+                 min_length_samples=100):
+        self.max_repeated_segments = max_repeated_segments
+        self.max_path_depth = max_path_depth
+        self.max_query_variants = max_query_variants
+        self.max_urls_per_template = max_urls_per_template
+        self.max_url_length = max_url_length
+        self.length_outlier_sigma = length_outlier_sigma
+        self.min_length_samples = min_length_samples
+
+        self._lock = threading.Lock()
+        self._query_variants = {}     # (호스트, 경로) -> 받아들인 쿼리 문자열의 해시
+        self._template_urls = {}      # URL 패턴 -> 받아들인 URL의 해시
+        self._length_count = 0
+        self._length_mean = 0.0
+        self._length_m2 = 0.0
+        self.checked = 0
+        self.blocked = Counter()      # 이유 -> 막은 수
+        self.throttled = Counter()    # (이유, 패턴) -> 막은 수
+
+    def _repeated_segments(self, path):
+        segments = [s for s in path.split('/') if s]
+        if len(segments) > self.max_path_depth:
+            return 'path_depth'
+        counts = Counter(segments)
+        if counts and max(counts.values()) > self.max_repeated_segments:
+            return 'repeated_segments'
+        return None
+
+    def _is_length_outlier(self, length):
+        if length > self.max_url_length:
+            return True
+        if self._length_count < self.min_length_samples:
+            return False
+        std = math.sqrt(self._length_m2 / (self._length_count - 1))
+        # 길이가 거의 같은 URL만 본 경우 조금만 길어도 막지 않도록 표준편차 하한을 둠
+        return length > self._length_mean + self.length_outlier_sigma * max(std, self._length_mean / 4)
+
+    def _record_length(self, length):
+        # Welford 방식의 평균 / 분산 갱신
+        self._length_count += 1
+        delta = length - self._length_mean
+        self._length_mean += delta / self._length_count
+        self._length_m2 += delta * (length - self._length_mean)
+
+    def _admit(self, table, key, value, limit):
+        """key 별로 서로 다른 value 를 limit 개까지만 받아들임"""
+        values = table.get(key)
+        if values is None:
+            values = table[key] = set()
+        value = hash(value)     # 문자열 대신 해시만 보관
+        if value in values:
+            return True
+        if limit is not None and len(values) >= limit:
+            return False
+        values.add(value)
+        return True
+
+    def _block(self, reason, pattern):
+        self.blocked[reason] += 1
+        self.throttled[(reason, pattern)] += 1
+        return False
+
+    def allows(self, url):
+        """크롤링할 만한 URL인지 (트랩으로 보이면 False)"""
+        parts = urlsplit(url)
+        with self._lock:
+            self.checked += 1
+
+            reason = self._repeated_segments(parts.path)
+            if reason:
+                return self._block(reason, url_template(url))
+
+            if self._is_length_outlier(len(url)):
+                return self._block('url_length', url_template(url))
+
+            template = url_template(url)
+            if parts.query and not self._admit(self._query_variants, (parts.netloc, parts.path),
+                                               parts.query, self.max_query_variants):
+                return self._block('query_variants', f"{parts.netloc}{parts.path}?*")
+
+            if not self._admit(self._template_urls, template, url, self.max_urls_per_template):
+                return self._block('template_budget', template)
+
+            self._record_length(len(url))
+            return True
+
+    def get_statistics(self, top=20):
+        with self._lock:
+            return {
+                'checked': self.checked,
+                'blocked': sum(self.blocked.values()),
+                'by_reason': dict(self.blocked),
+                'throttled_patterns': [
+                    {'reason': reason, 'pattern': pattern, 'blocked': count}
+                    for (reason, pattern), count in self.throttled.most_common(top)
+                ]
+            }
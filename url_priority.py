@@ -0,0 +1,121 @@
+import re
+import math
+import threading
+
+
+# 본문과 관계없는 내비게이션 / 계정 / 공유 링크에 자주 쓰이는 앵커 텍스트
+BOILERPLATE_ANCHORS = {
+    'home', 'login', 'log in', 'sign in', 'sign up', 'register', 'logout', 'privacy',
+    'privacy policy', 'terms', 'terms of service', 'cookies', 'cookie policy', 'contact',
+    'about', 'share', 'facebook', 'twitter', 'instagram', 'youtube', 'rss', 'top',
+    'next', 'prev', 'previous', 'more', 'skip to content',
+    '홈', '로그인', '로그아웃', '회원가입', '개인정보처리방침', '이용약관', '공유', '맨 위로',
+    '이전', '다음', '더보기'
+}
+
+# (정규식, 가산점) - URL 패턴별 기본 규칙
+DEFAULT_PATTERN_RULES = (
+    (r'/(tag|tags|category|author|archive|search|feed|print|share)(/|$|\?)', -1.0),
+    (r'/(login|signin|signup|register|logout|account|cart|checkout|privacy|terms)(/|$|\?|\.)', -2.0),
+    (r'[?&](sort|order|filter|sessionid|sid|replytocom)=', -1.0),
+    (r'[?&]page=\d+', -0.5),
+    (r'/\d{4}/\d{1,2}/', 0.5),
+    (r'/(article|articles|post|posts|news|docs|wiki)/', 0.5),
+)
+
+
+class URLScorer:
+    """
+    URL 우선순위 점수 (높을수록 먼저 가져옴)
+
+    깊이, 지금까지 본 내부 링크(in-link) 수, 앵커 텍스트, 사이트맵 priority, URL 패턴을
+    합산한다. 페이지마다 점수가 높은 링크 max_outlinks_per_page 개만 프론티어에 넣어
+    내비게이션 / 푸터 링크가 페이지 예산을 먼저 써 버리지 않게 한다.
+    """
+
+    def __init__(self, depth_weight=1.0, inlink_weight=0.5, anchor_weight=1.0, sitemap_weight=2.0,
+                 pattern_rules=None, max_outlinks_per_page=50, max_tracked_urls=1000000):
+        self.depth_weight = depth_weight
+        self.inlink_weight = inlink_weight
+        self.anchor_weight = anchor_weight
+        self.sitemap_weight = sitemap_weight
+        rules = DEFAULT_PATTERN_RULES if pattern_rules is None else pattern_rules
+        self.pattern_rules = [(re.compile(pattern, re.IGNORECASE), bonus) for pattern, bonus in rules]
+        self.max_outlinks_per_page = max_outlinks_per_page
+        self.max_tracked_urls = max_tracked_urls
+        self._inlinks = {}
+        self._lock = threading.Lock()
+        self.stats = {'scored': 0, 'outlinks_dropped': 0}
+
+    def record_inlink(self, url):
+        """url 로 들어오는 링크 하나 기록 -> 지금까지의 in-link 수"""
+        with self._lock:
+            count = self._inlinks.get(url)
+            if count is None:
+                if len(self._inlinks) >= self.max_tracked_urls:
+                    return 1
+                count = 0
+            self._inlinks[url] = count + 1
+            return count + 1
+
+    @staticmethod
+    def anchor_score(text):
+        """앵커 텍스트 점수 (설명적인 텍스트일수록 높음)"""
+        text = (text or '').strip().lower()
+        if not text:
+            return -0.5
+        if text in BOILERPLATE_ANCHORS:
+            return -1.0
+        return min(len(text.split()), 5) / 5
+
+    def pattern_score(self, url):
+        return sum(bonus for regex, bonus in self.pattern_rules if regex.search(url))
+
+    def score(self, url, depth, anchor_text=None, sitemap_priority=None, inlinks=None):
+        """URL 하나의 점수"""
+        if inlinks is None:
+            with self._lock:
+                inlinks = self._inlinks.get(url, 0)
+        score = -self.depth_weight * depth
+        score += self.inlink_weight * math.log1p(inlinks)
+        if anchor_text is not None:
+            score += self.anchor_weight * self.anchor_score(anchor_text)
+        if sitemap_priority is not None:
+            score += self.sitemap_weight * sitemap_priority
+        score += self.pattern_score(url)
+        with self._lock:
+            self.stats['scored'] += 1
+        return score
+
+    def rank(self, candidates, depth, sitemap_entries=None):
+        """
+        한 페이지에서 나온 링크 (url, 앵커 텍스트) 목록을 점수순으로 정렬해 상위만 반환
+
+        같은 페이지의 중복 링크는 in-link 한 번으로 세고 가장 좋은 앵커 텍스트를 쓴다.
+        반환값: [(url, 점수)]
+        """
+        anchors = {}
+        for url, text in candidates:
+            if url not in anchors or self.anchor_score(text) > self.anchor_score(anchors[url]):
+                anchors[url] = text
+
+        scored = []
+        for url, text in anchors.items():
+            inlinks = self.record_inlink(url)
+            entry = sitemap_entries.get(url) if sitemap_entries else None
+            sitemap_priority = entry.get('priority') if entry else None
+            scored.append((url, self.score(url, depth, text, sitemap_priority, inlinks)))
+
+        scored.sort(key=lambda pair: pair[1], reverse=True)
+        limit = self.max_outlinks_per_page
+        if limit is not None and len(scored) > limit:
+            with self._lock:
+                self.stats['outlinks_dropped'] += len(scored) - limit
+            scored = scored[:limit]
+        return scored
+
+    def get_statistics(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['tracked_urls'] = len(self._inlinks)
+        return stats
@@ -1,27 +1,59 @@
 import requests
 import time
 import random
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from fake_useragent import UserAgent
 import json
 import os
 from datetime import datetime
 import logging
+from politeness import HostScheduler
+from http_client import read_limited, HTML_CONTENT_TYPES, DEFAULT_MAX_BODY_BYTES
+from url_filter import URLFilter
+from frontier import URLFrontier, PriorityFrontier, SQLiteFrontier
+from url_priority import URLScorer
+from canonicalizer import URLCanonicalizer
+from seen_set import create_seen_set, seen_set_statistics
+from html_parser import make_soup, resolve_parser
 
 class WebCrawler:
     """
     구글 봇과 같은 웹 크롤러 클래스
     """
     
-    def __init__(self, delay_range=(1, 3), max_pages=100, output_file="crawled_data.json"):
+    def __init__(self, delay_range=(1, 3), max_pages=100, output_file="crawled_data.json",
+                 max_body_bytes=DEFAULT_MAX_BODY_BYTES, frontier_file=None, seen_set=None,
+                 prioritize=False, parser=None, timeout=10):
         self.session = requests.Session()
         self.ua = UserAgent()
         self.delay_range = delay_range
         self.max_pages = max_pages
         self.output_file = output_file
-        self.crawled_urls = set()
+        self.max_body_bytes = max_body_bytes
+        self.timeout = timeout
+        # seen_set={'type': 'bloom', ...} 이면 URL 문자열 대신 블룸 필터로 방문 기록
+        self.crawled_urls = create_seen_set(seen_set)
         self.crawled_data = []
+        # HTML 파서 백엔드 (None 이면 설치된 것 중 가장 빠른 파서)
+        self.parser = resolve_parser(parser)
+        self.scheduler = HostScheduler(delay_range)
+        self.url_filter = URLFilter()
+        self.url_canonicalizer = URLCanonicalizer()
+        # prioritize=True (또는 URLScorer 설정 dict) 면 점수가 높은 URL부터 크롤링
+        if prioritize:
+            self.url_scorer = URLScorer(**(prioritize if isinstance(prioritize, dict) else {}))
+        else:
+            self.url_scorer = None
+        # frontier_file 을 주면 디스크 프론티어 사용 (중단된 크롤링을 이어서 진행)
+        # 메모리 프론티어는 crawled_urls 를 seen 집합으로 같이 써서 큐에 넣는 시점에 표시한다
+        # (블룸 필터 / mmap 지문 인덱스를 설정하면 URL 문자열 집합을 따로 두지 않음)
+        if frontier_file:
+            self.frontier = SQLiteFrontier(frontier_file)
+        elif self.url_scorer:
+            self.frontier = PriorityFrontier(seen=self.crawled_urls)
+        else:
+            self.frontier = URLFrontier(seen=self.crawled_urls)
+        self._frontier_marks_seen = not frontier_file
         
         # 로깅 설정
         logging.basicConfig(
@@ -47,15 +79,24 @@ class WebCrawler:
     def get_page(self, url):
         """웹페이지를 가져오는 메서드"""
         try:
-            # 랜덤 지연 (봇 감지 방지)
-            time.sleep(random.uniform(*self.delay_range))
+            # 호스트별 지연 (봇 감지 방지) - 같은 호스트의 이전 요청 이후 지난 시간만큼은 기다리지 않음
+            self.scheduler.wait(url)
             
             # User-Agent 변경
             self.session.headers['User-Agent'] = self.ua.random
             
-            response = self.session.get(url, timeout=10)
+            response = self.session.get(url, timeout=self.timeout, stream=True)
+            if not response.ok:
+                # 본문을 읽지 않은 스트리밍 응답은 닫아야 커넥션이 풀로 돌아감
+                response.close()
             response.raise_for_status()
             
+            # HTML이 아니면 본문을 받지 않고, HTML도 상한까지만 읽음
+            response = read_limited(response, self.max_body_bytes, HTML_CONTENT_TYPES)
+            if response is None:
+                self.logger.info(f"HTML이 아닌 응답 건너뜀: {url}")
+                return None
+            
             self.logger.info(f"성공적으로 페이지 가져옴: {url}")
             return response
             
@@ -65,7 +106,7 @@ class WebCrawler:
     
     def parse_page(self, url, html_content):
         """페이지 내용을 파싱하는 메서드"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content, self.parser)
         
         # 페이지 정보 추출
         page_data = {
@@ -116,13 +157,21 @@ class WebCrawler:
     def crawl(self, start_url, max_depth=3):
         """웹사이트를 크롤링하는 메인 메서드"""
         self.logger.info(f"크롤링 시작: {start_url}")
+        start_url = self.url_canonicalizer.canonicalize(start_url)
         
-        urls_to_crawl = [(start_url, 0)]  # (url, depth)
+        # 디스크 프론티어에 이전 기록이 있으면 시작 URL은 중복으로 무시되고 이어서 진행
+        self.frontier.push(start_url, 0)  # (url, depth)
         
-        while urls_to_crawl and len(self.crawled_urls) < self.max_pages:
-            current_url, depth = urls_to_crawl.pop(0)
+        while len(self.crawled_data) < self.max_pages:
+            item = self.frontier.pop()
+            if item is None:
+                break
+            current_url, depth = item
             
-            if current_url in self.crawled_urls or depth > max_depth:
+            # 메모리 프론티어의 URL은 큐에 넣을 때 이미 seen 에 표시되어 있고 한 번만 꺼내진다
+            already_crawled = not self._frontier_marks_seen and current_url in self.crawled_urls
+            if already_crawled or depth > max_depth:
+                self.frontier.mark_done(current_url)
                 continue
             
             self.logger.info(f"크롤링 중: {current_url} (깊이: {depth})")
@@ -130,21 +179,64 @@ class WebCrawler:
             # 페이지 가져오기
             response = self.get_page(current_url)
             if not response:
+                self.frontier.mark_done(current_url)
                 continue
             
             # 페이지 파싱
             page_data = self.parse_page(current_url, response.text)
+            page_data['truncated'] = response.truncated
             self.crawled_data.append(page_data)
             self.crawled_urls.add(current_url)
             
-            # 새로운 링크들을 큐에 추가
+            # 새로운 링크들을 큐에 추가 (큐에 넣을 때 중복 제거)
             if depth < max_depth:
+                candidates = []
+                queued = set()
                 for link_info in page_data['links']:
-                    link_url = link_info['url']
-                    if link_url not in self.crawled_urls:
-                        urls_to_crawl.append((link_url, depth + 1))
+                    link_url = self.url_canonicalizer.canonicalize(link_info['url'])
+                    if self.frontier.is_duplicate(link_url):
+                        if self.url_scorer and self.frontier.is_pending(link_url):
+                            candidates.append((link_url, link_info['text']))
+                            queued.add(link_url)
+                        continue
+                    if self.url_filter.allows(link_url):
+                        candidates.append((link_url, link_info['text']))
+                
+                if self.url_scorer:
+                    # 이미 대기 중인 URL은 in-link 가 늘어난 만큼 점수만 올림
+                    for link_url, priority in self.url_scorer.rank(candidates, depth + 1):
+                        if link_url in queued:
+                            self.frontier.raise_priority(link_url, priority)
+                        else:
+                            self.frontier.push(link_url, depth + 1, priority=priority)
+                else:
+                    for link_url, _ in candidates:
+                        self.frontier.push(link_url, depth + 1)
+            
+            self.frontier.mark_done(current_url)
+        
+        self.frontier.flush()
+        self.logger.info(f"크롤링 완료. 총 {len(self.crawled_data)}개 페이지 크롤링됨")
+        self.save_data()
+    
+    def crawl_async(self, start_url, max_depth=3, max_concurrency=100):
+        """aiohttp 기반 비동기 크롤링 (동시 요청 수 max_concurrency 로 제한)"""
+        from async_crawler import run_async_crawl
+        
+        self.logger.info(f"비동기 크롤링 시작: {start_url} (동시 요청: {max_concurrency})")
+        
+        run_async_crawl(
+            self,
+            start_url,
+            max_depth=max_depth,
+            max_pages=self.max_pages,
+            max_concurrency=max_concurrency,
+            timeout=self.timeout,
+            delay_range=self.delay_range,
+            max_body_bytes=self.max_body_bytes
+        )
         
-        self.logger.info(f"크롤링 완료. 총 {len(self.crawled_urls)}개 페이지 크롤링됨")
+        self.logger.info(f"크롤링 완료. 총 {len(self.crawled_data)}개 페이지 크롤링됨")
         self.save_data()
     
     def save_data(self):
@@ -163,7 +255,12 @@ class WebCrawler:
             'total_pages': len(self.crawled_data),
             'total_links': total_links,
             'total_text_length': total_text_length,
-            'average_text_length': total_text_length / len(self.crawled_data) if self.crawled_data else 0
+            'average_text_length': total_text_length / len(self.crawled_data) if self.crawled_data else 0,
+            'url_filter': self.url_filter.get_statistics(),
+            'canonicalizer': self.url_canonicalizer.get_statistics(),
+            'priority': self.url_scorer.get_statistics() if self.url_scorer else {},
+            'frontier': self.frontier.get_statistics(),
+            'seen_set': seen_set_statistics(self.crawled_urls)
         }
 
 # 사용 예시